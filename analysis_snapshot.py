@@ -18,11 +18,16 @@ SNAPSHOT_SCHEMA_VERSION = 1
 DEFAULT_SNAPSHOT_PATH = Path("output/analysis/analysis_results.json")
 ENGINE_SOURCE_FILES = (
     "portal_frame_analysis.py",
+    "frame_model.py",
+    "load_superposition.py",
+    "plane_frame.py",
+    "serviceability_deflection.py",
     "haunch_design.py",
     "haunch_geometry.py",
     "bracing_design.py",
     "internal_pressure.py",
     "strength_checks.py",
+    "member_actions.py",
     "analysis_visualisation.py",
     "member_database.csv",
     "bracing_member_database.csv",
@@ -52,8 +57,13 @@ def create_analysis_snapshot(
     input_path: str | Path,
     results: Mapping[str, Any],
     source_root: str | Path | None = None,
+    search_profile: Mapping[str, Any] | None = None,
 ) -> dict[str, Any]:
-    """Create a serialisable snapshot from one completed analysis."""
+    """Create a serialisable snapshot from one completed analysis.
+
+    ``search_profile`` is the section-search timing profile; it is stored
+    beside the results because it describes the run, not the design.
+    """
 
     input_path = Path(input_path).resolve()
     input_bytes = input_path.read_bytes()
@@ -65,7 +75,7 @@ def create_analysis_snapshot(
     ).hexdigest()[:16]
     root = Path(source_root).resolve() if source_root else Path(__file__).resolve().parent
 
-    return {
+    snapshot = {
         "schema_version": SNAPSHOT_SCHEMA_VERSION,
         "analysis": {
             "analysis_id": analysis_id,
@@ -78,6 +88,9 @@ def create_analysis_snapshot(
         "input_data": input_data,
         "results": dict(results),
     }
+    if search_profile is not None:
+        snapshot["search_profile"] = dict(search_profile)
+    return snapshot
 
 
 def write_analysis_snapshot(
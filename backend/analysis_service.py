@@ -28,6 +28,7 @@ from design_calculations import (
 from draughtsman_markup import write_markup
 from foundation_design import design_pad_foundations
 from analysis_snapshot import load_analysis_snapshot
+from parametric_sweep import run_sweep, sweep_variants
 from preview_geometry import build_preview_geometry
 from prokon_export import (
     build_portal_comparison,
@@ -111,6 +112,15 @@ def _normalise_payload(payload: Mapping[str, Any]) -> dict[str, Any]:
     return json.loads(json.dumps(payload))
 
 
+def _warm_start_key(project: Mapping[str, Any]) -> str | None:
+    """Return the key of a project's last winning section pair, if named."""
+
+    identity = [
+        str(project.get(key) or "").strip() for key in ("number", "name")
+    ]
+    return "\0".join(identity) if any(identity) else None
+
+
 def _design_summary(
     calculation_data,
     analysis_id: str,
@@ -335,6 +345,7 @@ def _run_job(analysis_id: str, payload: dict[str, Any]) -> None:
             snapshot_path=snapshot_path,
             render=False,
             project_metadata=payload["project"],
+            warm_start_key=_warm_start_key(payload["project"]),
         )
         if written_snapshot is None:
             raise RuntimeError("No acceptable portal-frame section pair was found.")
@@ -471,6 +482,82 @@ def submit_analysis_job(payload: Mapping[str, Any]) -> dict[str, Any]:
     return public_analysis_job(job)
 
 
+def _normalise_sweep_payload(payload: Mapping[str, Any]) -> dict[str, Any]:
+    normalised = _normalise_payload(payload)
+    if normalised.get("structural_system", "Portal frame") != "Portal frame":
+        raise ValueError("Parametric sweeps are available for portal frames only.")
+    keep = normalised.get("keep_snapshots", "best")
+    if not isinstance(keep, (str, list)):
+        raise ValueError("keep_snapshots must be best, all, none or a list of variants.")
+    # Validates every variant's geometry before the sweep is queued.
+    sweep_variants(normalised["building_data"], normalised.get("parameters"))
+    return normalised
+
+
+def _run_sweep_job(analysis_id: str, payload: dict[str, Any]) -> None:
+    job = get_analysis_job(analysis_id)
+    job.update({"status": "running", "started": _now(), "message": "Running parametric sweep."})
+    _write_job(job)
+
+    try:
+        result = run_sweep(
+            payload["building_data"],
+            payload["wind_data"],
+            payload["parameters"],
+            output_dir=_job_dir(analysis_id) / "sweep",
+            project_metadata=payload["project"],
+            keep_snapshots=payload.get("keep_snapshots", "best"),
+        )
+        artifact_paths = {
+            "sweep-results-csv": result["csv_path"],
+            "sweep-results-json": result["json_path"],
+        }
+        for row in result["variants"]:
+            if row.get("snapshot_path"):
+                artifact_paths[f"{row['variant']}-snapshot-json"] = row["snapshot_path"]
+        job.update(
+            {
+                "status": "complete",
+                "completed": _now(),
+                "message": f"Parametric sweep of {len(result['variants'])} variant(s) is complete.",
+                "sweep_summary": {
+                    "parameters": result["parameters"],
+                    "variants": [
+                        {key: value for key, value in row.items() if key != "snapshot_path"}
+                        for row in result["variants"]
+                    ],
+                    "kept_snapshots": result["kept_snapshots"],
+                },
+                "artifact_paths": artifact_paths,
+            }
+        )
+    except Exception as exc:
+        job.update(
+            {
+                "status": "failed",
+                "completed": _now(),
+                "message": "Parametric sweep failed.",
+                "error": f"{type(exc).__name__}: {exc}",
+            }
+        )
+    _write_job(job)
+
+
+def submit_sweep_job(payload: Mapping[str, Any]) -> dict[str, Any]:
+    normalised = _normalise_sweep_payload(payload)
+    analysis_id = uuid4().hex[:12]
+    job = {
+        "analysis_id": analysis_id,
+        "kind": "sweep",
+        "status": "queued",
+        "created": _now(),
+        "message": "Parametric sweep is queued.",
+    }
+    _write_job(job)
+    _EXECUTOR.submit(_run_sweep_job, analysis_id, normalised)
+    return public_analysis_job(job)
+
+
 def get_analysis_job(analysis_id: str) -> dict[str, Any]:
     analysis_id = _validate_job_id(analysis_id)
     with _LOCK:
@@ -522,6 +609,11 @@ def design_foundations(
     job = get_analysis_job(analysis_id)
     if job.get("status") != "complete":
         raise ValueError("Foundation design requires a completed analysis.")
+    if job.get("kind") == "sweep":
+        raise ValueError(
+            "Foundation design is not available for parametric sweeps; "
+            "analyse the chosen variant on its own first."
+        )
     snapshot_value = job.get("snapshot_path")
     if not snapshot_value:
         raise ValueError(
@@ -20,6 +20,7 @@ from backend.analysis_service import (
     get_analysis_job,
     public_analysis_job,
     submit_analysis_job,
+    submit_sweep_job,
 )
 from preview_geometry import build_preview_geometry
 from connection_viewer import (
@@ -62,6 +63,7 @@ def project_info() -> dict[str, Any]:
             "generate_reports": True,
             "rafter_haunches": True,
             "post_analysis_pad_foundations": True,
+            "parametric_sweeps": True,
             "structural_systems": ["Portal frame", "Truss"],
             "truss_validation_status": "Calculation draft; connections and independent project verification outstanding",
         },
@@ -90,6 +92,16 @@ def submit_analysis(payload: dict[str, Any]) -> dict[str, Any]:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
 
 
+@app.post("/api/sweep", status_code=202, tags=["analysis"])
+def submit_sweep(payload: dict[str, Any]) -> dict[str, Any]:
+    """Queue a portal design at every span, eaves height and spacing variant."""
+
+    try:
+        return submit_sweep_job(payload)
+    except (KeyError, TypeError, ValueError) as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
 @app.get("/api/analysis/{analysis_id}/status", tags=["analysis"])
 def analysis_status(analysis_id: str) -> dict[str, Any]:
     """Return queued, running, complete or failed status for one analysis."""
@@ -0,0 +1 @@
+"""Performance benchmarks of the portal-frame and truss design engines."""
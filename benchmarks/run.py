@@ -0,0 +1,432 @@
+"""Time the design engine on the canonical benchmark fixtures.
+
+Every portal fixture is prepared exactly as an analysis job prepares it, then
+the section search (``sls_check``) runs without the trial cache so each run
+is a cold search. The winning pair is analysed once more to write the
+snapshot, and pad-foundation design, connection design and calculation
+report writing are timed on that snapshot. Truss fixtures time
+``design_truss`` and the truss report writers.
+
+The median of ``--repeat`` runs of each stage is compared with the stored
+baseline. A stage regresses when it is slower than the baseline by more than
+the relative threshold and by more than :data:`MINIMUM_REGRESSION_S`, so
+millisecond stages do not fail on timer noise. Baselines are only
+comparable on the machine that recorded them.
+
+Run from the repository root::
+
+    python -m benchmarks.run
+    python -m benchmarks.run --fixture small_duo_pitch --repeat 3
+    python -m benchmarks.run --update-baseline
+"""
+
+from __future__ import annotations
+
+import contextlib
+from datetime import datetime
+import json
+import os
+from pathlib import Path
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Iterable, Mapping
+
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+FIXTURE_DIR = BENCHMARK_DIR / "fixtures"
+DEFAULT_BASELINE_PATH = BENCHMARK_DIR / "baseline.json"
+BASELINE_SCHEMA_VERSION = 1
+DEFAULT_THRESHOLD = 0.25
+MINIMUM_REGRESSION_S = 0.05
+
+# Explicit footing dimensions select the fixed-size check; the product UI omits
+# them and the automatic pad sizing is the path benchmarked.
+EXPLICIT_FOUNDATION_KEYS = (
+    "foundation_length_m",
+    "foundation_width_m",
+    "foundation_thickness_mm",
+)
+
+
+def fixture_names() -> list[str]:
+    """Return the stored fixture names in alphabetical order."""
+
+    return sorted(path.stem for path in FIXTURE_DIR.glob("*.json"))
+
+
+def load_fixture(name: str) -> dict[str, Any]:
+    """Return the analysis payload stored for fixture ``name``."""
+
+    path = FIXTURE_DIR / f"{name}.json"
+    if not path.is_file():
+        raise ValueError(
+            f"Unknown benchmark fixture {name!r}; choose from "
+            f"{', '.join(fixture_names())}."
+        )
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def environment() -> dict[str, Any]:
+    """Return the interpreter and machine description stored with results."""
+
+    import numpy
+    import scipy
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": numpy.__version__,
+        "scipy": scipy.__version__,
+    }
+
+
+def _time(
+    timings: dict[str, list[float]],
+    stage: str,
+    function: Callable[..., Any],
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    timings.setdefault(stage, []).append(time.perf_counter() - start)
+    return result
+
+
+def _portal_run(
+    payload: Mapping[str, Any],
+    directory: Path,
+    timings: dict[str, list[float]],
+    workers: int,
+    member_db: Mapping[str, Any],
+) -> None:
+    import portal_frame_analysis
+    from analysis_snapshot import load_analysis_snapshot
+    from connection_design import design_portal_connections
+    from design_calculations import (
+        ReportScope,
+        load_calculation_sheet_data,
+        write_html_report,
+        write_json_data,
+    )
+    from foundation_design import DEFAULT_FOUNDATION_VALUES, design_pad_foundations
+    from run_full_analysis import prepare_input_file
+
+    building_data = dict(payload["building_data"])
+    input_path = prepare_input_file(
+        building_data, payload["wind_data"], directory / "input_data.json"
+    )
+    frame_input = portal_frame_analysis.import_data(str(input_path)).frame_data[0]
+    frame, *_, best_section = _time(
+        timings,
+        "sls_check",
+        portal_frame_analysis.sls_check,
+        "Yes",
+        frame_input.get("rafter_section_type", "I-Sections"),
+        frame_input.get("column_section_type", "I-Sections"),
+        input_path=input_path,
+        selected_rafter_section=frame_input.get("rafter_section"),
+        selected_column_section=frame_input.get("column_section"),
+        use_trial_cache=False,
+        workers=workers,
+        member_db=member_db,
+    )
+    if frame is None:
+        raise RuntimeError("No acceptable portal-frame section pair was found.")
+
+    # The snapshot is written from the winning pair alone, so this stage
+    # times result extraction and the calculation sheet, not a second search.
+    building_data.update(
+        rafter_section=best_section[0], column_section=best_section[1]
+    )
+    input_path = prepare_input_file(
+        building_data, payload["wind_data"], directory / "input_data.json"
+    )
+    snapshot_path = _time(
+        timings,
+        "analysis_snapshot",
+        portal_frame_analysis.main,
+        render=False,
+        snapshot_path=directory / "analysis_results.json",
+        input_path=input_path,
+        project_metadata=payload.get("project"),
+        workers=1,
+        member_db=member_db,
+        use_trial_cache=False,
+    )
+    snapshot = load_analysis_snapshot(snapshot_path)
+    foundation_inputs = {
+        key: value
+        for key, value in DEFAULT_FOUNDATION_VALUES.items()
+        if key not in EXPLICIT_FOUNDATION_KEYS
+    }
+    _time(
+        timings,
+        "design_pad_foundations",
+        design_pad_foundations,
+        snapshot,
+        foundation_inputs,
+    )
+    _time(timings, "design_portal_connections", design_portal_connections, snapshot)
+
+    def write_reports() -> None:
+        calculation_data = load_calculation_sheet_data(
+            snapshot_path, scope=ReportScope.CRITICAL
+        )
+        write_html_report(
+            calculation_data, directory / "portal_frame_design_report.html"
+        )
+        write_json_data(
+            calculation_data, directory / "portal_frame_design_report.json"
+        )
+
+    _time(timings, "report_writing", write_reports)
+
+
+def _truss_run(
+    payload: Mapping[str, Any],
+    directory: Path,
+    timings: dict[str, list[float]],
+) -> None:
+    from truss_design import design_truss
+    from truss_report import write_truss_html, write_truss_json
+
+    result = _time(timings, "design_truss", design_truss, dict(payload))
+
+    def write_reports() -> None:
+        write_truss_html(result, directory / "preliminary_truss_design_report.html")
+        write_truss_json(result, directory / "preliminary_truss_design_report.json")
+
+    _time(timings, "report_writing", write_reports)
+
+
+def run_benchmarks(
+    names: Iterable[str] | None = None,
+    *,
+    repeat: int = 1,
+    workers: int = 1,
+    verbose: bool = False,
+) -> dict[str, Any]:
+    """Run the selected fixtures and return median stage times in seconds.
+
+    Engine console output is suppressed unless ``verbose`` is set. Inputs,
+    snapshots and reports are written to a temporary directory that is
+    removed afterwards.
+    """
+
+    import member_database as mdb
+
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1.")
+    names = list(names) if names else fixture_names()
+    payloads = {name: load_fixture(name) for name in names}
+    member_db = mdb.load_member_database()
+    results: dict[str, dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory(prefix="portal-benchmarks-") as temporary:
+        for name, payload in payloads.items():
+            timings: dict[str, list[float]] = {}
+            print(f"Benchmarking {name} ...", flush=True)
+            for run in range(repeat):
+                directory = Path(temporary) / name / f"run-{run + 1}"
+                directory.mkdir(parents=True)
+                output = None if verbose else open(os.devnull, "w")
+                with contextlib.ExitStack() as stack:
+                    if output is not None:
+                        stack.enter_context(output)
+                        stack.enter_context(contextlib.redirect_stdout(output))
+                    if payload.get("structural_system") == "Truss":
+                        _truss_run(payload, directory, timings)
+                    else:
+                        _portal_run(payload, directory, timings, workers, member_db)
+            results[name] = {
+                stage: {
+                    "median_s": round(statistics.median(values), 4),
+                    "runs_s": [round(value, 4) for value in values],
+                }
+                for stage, values in timings.items()
+            }
+    return {
+        "schema_version": BASELINE_SCHEMA_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "environment": environment(),
+        "repeat": repeat,
+        "workers": workers,
+        "benchmarks": results,
+    }
+
+
+def load_baseline(path: str | Path = DEFAULT_BASELINE_PATH) -> dict[str, Any] | None:
+    """Return the stored baseline, or ``None`` when there is none yet."""
+
+    path = Path(path)
+    if not path.is_file():
+        return None
+    baseline = json.loads(path.read_text(encoding="utf-8"))
+    if baseline.get("schema_version") != BASELINE_SCHEMA_VERSION:
+        raise ValueError(
+            f"{path} has baseline schema {baseline.get('schema_version')!r}; "
+            f"expected {BASELINE_SCHEMA_VERSION}."
+        )
+    return baseline
+
+
+def write_baseline(
+    results: Mapping[str, Any],
+    path: str | Path = DEFAULT_BASELINE_PATH,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> Path:
+    """Store ``results`` as the baseline with its regression threshold.
+
+    Fixtures that were not run keep their previous baseline entries.
+    """
+
+    path = Path(path)
+    previous = load_baseline(path) or {}
+    benchmarks = dict(previous.get("benchmarks", {}))
+    benchmarks.update(results["benchmarks"])
+    baseline = {**results, "threshold": threshold, "benchmarks": benchmarks}
+    path.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def compare_with_baseline(
+    results: Mapping[str, Any],
+    baseline: Mapping[str, Any] | None,
+    threshold: float | None = None,
+) -> list[dict[str, Any]]:
+    """Return one comparison row per fixture stage.
+
+    ``status`` is ``regression``, ``improved``, ``ok`` or ``new`` when the
+    baseline has no entry for the stage. ``threshold`` defaults to the value
+    stored in the baseline.
+    """
+
+    baseline = baseline or {}
+    if threshold is None:
+        threshold = float(baseline.get("threshold", DEFAULT_THRESHOLD))
+    stored = baseline.get("benchmarks", {})
+    rows = []
+    for name, stages in results["benchmarks"].items():
+        for stage, timing in stages.items():
+            current = timing["median_s"]
+            reference = stored.get(name, {}).get(stage, {}).get("median_s")
+            row = {
+                "fixture": name,
+                "stage": stage,
+                "baseline_s": reference,
+                "current_s": current,
+                "change": None,
+                "status": "new",
+            }
+            if reference is not None:
+                change = (current - reference) / max(reference, 1e-9)
+                row["change"] = change
+                if (
+                    change > threshold
+                    and current - reference > MINIMUM_REGRESSION_S
+                ):
+                    row["status"] = "regression"
+                elif (
+                    change < -threshold
+                    and reference - current > MINIMUM_REGRESSION_S
+                ):
+                    row["status"] = "improved"
+                else:
+                    row["status"] = "ok"
+            rows.append(row)
+    return rows
+
+
+def comparison_table(rows: Iterable[Mapping[str, Any]]) -> str:
+    """Return the console comparison table."""
+
+    from tabulate import tabulate
+
+    return tabulate(
+        [
+            [
+                row["fixture"],
+                row["stage"],
+                "-" if row["baseline_s"] is None else f"{row['baseline_s']:.3f}",
+                f"{row['current_s']:.3f}",
+                "-" if row["change"] is None else f"{row['change']:+.1%}",
+                row["status"].upper(),
+            ]
+            for row in rows
+        ],
+        headers=["Fixture", "Stage", "Baseline s", "Current s", "Change", "Status"],
+        tablefmt="pretty",
+    )
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description=(
+            "Time sls_check, design_truss, foundation and connection design "
+            "and report writing on the benchmark fixtures and compare the "
+            "results with the stored baseline."
+        )
+    )
+    parser.add_argument(
+        "--fixture", action="append", choices=fixture_names(),
+        help="fixture to run; repeat for several (default: all)",
+    )
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="section-search processes (default: 1 for repeatable timings)",
+    )
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE_PATH))
+    parser.add_argument(
+        "--threshold", type=float, default=None,
+        help=(
+            "relative slow-down counted as a regression (default: the "
+            f"baseline's threshold, or {DEFAULT_THRESHOLD})"
+        ),
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true",
+        help="store these results as the new baseline",
+    )
+    parser.add_argument("--output", help="also write the results to this JSON file")
+    parser.add_argument("--verbose", action="store_true", help="show engine output")
+    arguments = parser.parse_args()
+
+    results = run_benchmarks(
+        arguments.fixture,
+        repeat=arguments.repeat,
+        workers=arguments.workers,
+        verbose=arguments.verbose,
+    )
+    if arguments.output:
+        Path(arguments.output).write_text(
+            json.dumps(results, indent=2) + "\n", encoding="utf-8"
+        )
+    baseline = load_baseline(arguments.baseline)
+    if baseline and baseline.get("environment") != results["environment"]:
+        print(
+            "Warning: the baseline was recorded on a different machine or "
+            "interpreter; timings may not be comparable."
+        )
+    rows = compare_with_baseline(results, baseline, arguments.threshold)
+    print(comparison_table(rows))
+    if arguments.update_baseline:
+        threshold = (
+            arguments.threshold
+            if arguments.threshold is not None
+            else float((baseline or {}).get("threshold", DEFAULT_THRESHOLD))
+        )
+        path = write_baseline(results, arguments.baseline, threshold)
+        print(f"Baseline written to {path}")
+        sys.exit(0)
+    regressions = [row for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"{len(regressions)} stage(s) regressed beyond the threshold.")
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,168 @@
+"""Stiffness-dominance pruning for the rafter/column section search.
+
+For a first-order elastic portal, every serviceability quantity (eaves
+drift, rafter deflection, ponding) falls as the rafter or column second
+moment of area rises. A pair that fails serviceability therefore proves that
+every pair with both ``Ix`` values no larger fails as well, and a pair that
+passes proves the same for any heavier pair that is at least as stiff in both
+members. The frontier keeps only the non-dominated points of each kind.
+
+Self-weight and strength are not monotonic in ``Ix``, so only serviceability
+failures are recorded as failed points. Neither is a frame whose haunch is
+cut to the full depth of its rafter ("Cut-Depth" and "Auto Size" modes): a
+deeper rafter with a smaller ``Ix`` gets a deeper haunch and may be the
+stiffer frame. Such searches keep no failed points (``record_failures``).
+
+The same ordering gives a warm start after an input edit: the previous
+winning pair and its nearest neighbours in ``Ix`` are trialled first. A
+passing pair bounds the search mass, and failures just below the previous
+winner prune most of the lighter region before the ascending scan reaches it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from itertools import product
+from typing import Mapping
+
+
+@dataclass(frozen=True)
+class PruningDecision:
+    """One skipped candidate and the evaluated pair that proved it."""
+
+    rafter: str
+    column: str
+    reason: str
+    rafter_reference: str
+    column_reference: str
+
+    def message(self) -> str:
+        relation = (
+            "no stiffer than failed"
+            if self.reason == "failed"
+            else "heavier and no more flexible than passing"
+        )
+        return (
+            f"Skipped {self.rafter} / {self.column}: {relation} "
+            f"{self.rafter_reference} / {self.column_reference}"
+        )
+
+
+@dataclass
+class DominanceFrontier:
+    """Pareto frontiers of failed and passed ``(rafter Ix, column Ix)`` pairs."""
+
+    failed: list[tuple[float, float, str, str]] = field(default_factory=list)
+    passed: list[tuple[float, float, float, str, str]] = field(
+        default_factory=list
+    )
+    decisions: list[PruningDecision] = field(default_factory=list)
+    record_failures: bool = True
+
+    def add_failure(
+        self, rafter_ix: float, column_ix: float, rafter: str, column: str
+    ) -> None:
+        """Record a serviceability failure, keeping only maximal points."""
+
+        if not self.record_failures or any(
+            rafter_ix <= r_ix and column_ix <= c_ix
+            for r_ix, c_ix, *_ in self.failed
+        ):
+            return
+        self.failed = [
+            point
+            for point in self.failed
+            if not (point[0] <= rafter_ix and point[1] <= column_ix)
+        ]
+        self.failed.append((rafter_ix, column_ix, rafter, column))
+
+    def add_pass(
+        self,
+        rafter_ix: float,
+        column_ix: float,
+        mass: float,
+        rafter: str,
+        column: str,
+    ) -> None:
+        """Record a passing pair, keeping only minimal points."""
+
+        if any(
+            rafter_ix >= r_ix and column_ix >= c_ix and mass >= m
+            for r_ix, c_ix, m, *_ in self.passed
+        ):
+            return
+        self.passed = [
+            point
+            for point in self.passed
+            if not (
+                point[0] >= rafter_ix
+                and point[1] >= column_ix
+                and point[2] >= mass
+            )
+        ]
+        self.passed.append((rafter_ix, column_ix, mass, rafter, column))
+
+    def dominated(
+        self,
+        rafter_ix: float,
+        column_ix: float,
+        mass: float,
+        rafter: str,
+        column: str,
+    ) -> PruningDecision | None:
+        """Return and log the decision that skips this pair, if any."""
+
+        decision = None
+        for r_ix, c_ix, r_ref, c_ref in self.failed:
+            if rafter_ix <= r_ix and column_ix <= c_ix:
+                decision = PruningDecision(
+                    rafter, column, "failed", r_ref, c_ref
+                )
+                break
+        if decision is None:
+            for r_ix, c_ix, m, r_ref, c_ref in self.passed:
+                if rafter_ix >= r_ix and column_ix >= c_ix and mass >= m:
+                    decision = PruningDecision(
+                        rafter, column, "passed", r_ref, c_ref
+                    )
+                    break
+        if decision is not None:
+            self.decisions.append(decision)
+        return decision
+
+
+def ix_neighbours(
+    ix: float, candidates: Mapping[str, float], radius: int = 1
+) -> list[str]:
+    """Return candidates with ``ix`` and the ``radius`` nearest either side."""
+
+    below = sorted(
+        (name for name, value in candidates.items() if value < ix),
+        key=candidates.__getitem__,
+        reverse=True,
+    )[:radius]
+    same = [name for name, value in candidates.items() if value == ix]
+    above = sorted(
+        (name for name, value in candidates.items() if value > ix),
+        key=candidates.__getitem__,
+    )[:radius]
+    return [*below, *same, *above]
+
+
+def warm_start_pairs(
+    rafter_ix: float,
+    column_ix: float,
+    rafters: Mapping[str, float],
+    columns: Mapping[str, float],
+    radius: int = 1,
+) -> list[tuple[str, str]]:
+    """Return the ``(rafter, column)`` neighbourhood of a previous winner.
+
+    ``rafters`` and ``columns`` map candidate names to ``Ix``. The previous
+    sections need not be candidates of the new search.
+    """
+
+    return list(product(
+        ix_neighbours(rafter_ix, rafters, radius),
+        ix_neighbours(column_ix, columns, radius),
+    ))
@@ -0,0 +1,340 @@
+"""Load-combination dominance pruning for the rafter/column section search.
+
+``user_input.add_load_cases`` generates every SANS 10160 combination, and
+with crawl beams applied one at a time the crane scenarios multiply them.
+Many combinations can never govern: a repeated factor set, a combination
+that is another scaled by a factor no larger than one, or one whose every
+monitored response lies between zero and the matching response of another
+combination. The search analyses only the remaining combinations.
+
+Identical and scaled factor sets are enveloped for every section pair of a
+linear frame. Response dominance is established from one reference analysis
+of all combinations, on the serviceability quantities the acceptance gates
+use (nodal drift, checked vertical deflection and rafter fall loss) and on
+the member design actions and utilisations of the strength checks. It is
+exact only at the reference pair, so the winning pair is re-checked against
+the full combination set; a pair rejected by the reduced set is also
+rejected by the full set, so a winner that passes the re-check is the
+lightest passing pair of a full search.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, replace
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+from tabulate import tabulate
+
+from load_superposition import combination_factors
+from serviceability_deflection import (
+    _rafter_ordinates,
+    _result_value,
+    permanent_baseline_name,
+    uses_permanent_deflection_baseline,
+)
+
+
+SERVICEABILITY = "SLS"
+STRENGTH = "ULS"
+
+IDENTICAL = "identical factors"
+SCALED = "scaled factors"
+DOMINATED = "dominated responses"
+
+# Responses within this fraction of the largest value of their kind are
+# treated as zero, and factors within it of each other as equal.
+TOLERANCE = 1e-9
+
+
+@dataclass(frozen=True)
+class PrunedCombination:
+    """One combination left out of the search and the one that envelopes it.
+
+    ``ratio`` is the scale factor of a scaled factor set and otherwise the
+    largest ratio of a monitored response to the enveloping response at the
+    reference pair.
+    """
+
+    limit_state: str
+    combination: str
+    governed_by: str
+    reason: str
+    ratio: float
+
+    def as_row(self) -> dict[str, Any]:
+        return {
+            "limit_state": self.limit_state,
+            "combination": self.combination,
+            "governed_by": self.governed_by,
+            "reason": self.reason,
+            "ratio": round(self.ratio, 4),
+        }
+
+
+@dataclass(frozen=True)
+class CombinationReduction:
+    """Combinations carried through the search and the pruned audit rows."""
+
+    serviceability: tuple[str, ...]
+    strength: tuple[str, ...]
+    pruned: tuple[PrunedCombination, ...]
+    reference: tuple[str, str]
+
+    def apply(self, data):
+        """Return ``data`` with only the kept combinations."""
+
+        return keep_combinations(data, self.serviceability, self.strength)
+
+    def audit(self) -> dict[str, Any]:
+        """Return the serialisable audit of this reduction."""
+
+        return {
+            "reference_pair": {
+                "rafter": self.reference[0],
+                "column": self.reference[1],
+            },
+            "kept": {
+                SERVICEABILITY: len(self.serviceability),
+                STRENGTH: len(self.strength),
+            },
+            "pruned_count": {
+                limit_state: sum(
+                    row.limit_state == limit_state for row in self.pruned
+                )
+                for limit_state in (SERVICEABILITY, STRENGTH)
+            },
+            "pruned": [row.as_row() for row in self.pruned],
+        }
+
+    def table(self) -> str:
+        """Return the pruned combinations as a printable table."""
+
+        return tabulate(
+            [
+                [row.limit_state, row.combination, row.governed_by,
+                 row.reason, f"{row.ratio:.3f}"]
+                for row in self.pruned
+            ],
+            headers=["", "Pruned combination", "Enveloped by", "Reason",
+                     "Ratio"],
+            tablefmt="pretty",
+            colalign=("left", "left", "left", "left", "right"),
+        )
+
+
+def keep_combinations(data, serviceability, strength):
+    """Return ``data`` with only the named SLS and ULS combinations.
+
+    Permanent baselines and footing combinations are derived from the kept
+    combinations wherever they are needed.
+    """
+
+    serviceability, strength = set(serviceability), set(strength)
+    return replace(
+        data,
+        serviceability_load_combinations=[
+            combination
+            for combination in data.serviceability_load_combinations
+            if str(combination["name"]) in serviceability
+        ],
+        load_combinations=[
+            combination
+            for combination in data.load_combinations
+            if str(combination["name"]) in strength
+        ],
+    )
+
+
+def factor_scale(
+    governing: Mapping[str, float],
+    candidate: Mapping[str, float],
+) -> float | None:
+    """Return ``s`` with ``candidate == s * governing`` and ``0 < s <= 1``."""
+
+    cases = {
+        case
+        for factors in (governing, candidate)
+        for case, factor in factors.items()
+        if abs(factor) > 1e-12
+    }
+    if not cases:
+        return None
+    pivot = max(cases, key=lambda case: abs(governing.get(case, 0.0)))
+    if abs(governing.get(pivot, 0.0)) <= 1e-12:
+        return None
+    scale = candidate.get(pivot, 0.0) / governing[pivot]
+    if not 0.0 < scale <= 1.0 + TOLERANCE:
+        return None
+    for case in cases:
+        expected = scale * governing.get(case, 0.0)
+        if abs(candidate.get(case, 0.0) - expected) > TOLERANCE * max(
+            1.0, abs(expected)
+        ):
+            return None
+    return min(scale, 1.0)
+
+
+def _scales(values: np.ndarray) -> np.ndarray:
+    """Return the largest finite magnitude of each response column."""
+
+    finite = np.where(np.isfinite(values), np.abs(values), 0.0)
+    return np.maximum(np.max(finite, axis=0, initial=0.0), 1e-12)
+
+
+def _dominance_ratio(signed, magnitude, signed_tol, magnitude_tol, a, b):
+    """Return the largest ``|b| / |a|`` ratio if ``a`` envelopes ``b``.
+
+    Each signed response of ``b`` must be negligible or have the sign of
+    ``a`` and no larger magnitude; each non-negative response must be no
+    larger. ``None`` means ``a`` does not envelope ``b``.
+    """
+
+    ratio = 0.0
+    for values, tolerance, signed_values in (
+        (signed, signed_tol, True),
+        (magnitude, magnitude_tol, False),
+    ):
+        if values.shape[1] == 0:
+            continue
+        active = np.abs(values[b]) > tolerance
+        top, bottom = values[a][active], values[b][active]
+        tolerance = tolerance[active]
+        if not np.all(np.isfinite(bottom)):
+            return None
+        if signed_values and np.any(top * bottom <= 0.0):
+            return None
+        if np.any(np.abs(bottom) > np.abs(top) + tolerance):
+            return None
+        if bottom.size:
+            ratio = max(ratio, float(np.max(
+                np.abs(bottom) / np.maximum(np.abs(top), tolerance)
+            )))
+    return min(ratio, 1.0)
+
+
+def reduce_combinations(
+    limit_state: str,
+    combinations: Sequence[Mapping[str, Any]],
+    signed: np.ndarray,
+    magnitude: np.ndarray,
+    gated: Sequence[bool] | None = None,
+) -> tuple[list[str], list[PrunedCombination]]:
+    """Return the kept names and the pruned rows of one limit state.
+
+    ``signed`` and ``magnitude`` are ``(combinations, responses)`` arrays of
+    the reference analysis; ``magnitude`` holds non-negative responses such
+    as utilisations. A combination subject to a check that another skips
+    (``gated``) is never enveloped by it. Combinations are visited from the
+    largest normalised response down, so an enveloping combination is kept
+    before the combinations it envelopes.
+    """
+
+    names = [str(combination["name"]) for combination in combinations]
+    factors = combination_factors(combinations)
+    signed = np.asarray(signed, dtype=float).reshape(len(names), -1)
+    magnitude = np.asarray(magnitude, dtype=float).reshape(len(names), -1)
+    gated = list(gated) if gated is not None else [True] * len(names)
+    signed_scale, magnitude_scale = _scales(signed), _scales(magnitude)
+    signed_tol = TOLERANCE * signed_scale
+    magnitude_tol = TOLERANCE * magnitude_scale
+
+    def size(row):
+        normalised = np.concatenate((
+            np.abs(signed[row]) / signed_scale,
+            np.abs(magnitude[row]) / magnitude_scale,
+        ))
+        return float(np.sum(np.where(
+            np.isfinite(normalised), normalised, math.inf
+        )))
+
+    order = sorted(range(len(names)), key=lambda row: (-size(row), row))
+    kept_rows: list[int] = []
+    pruned: dict[int, PrunedCombination] = {}
+    for row in order:
+        for other in kept_rows:
+            if gated[row] and not gated[other]:
+                continue
+            scale = factor_scale(factors[names[other]], factors[names[row]])
+            if scale is not None:
+                reason = IDENTICAL if scale >= 1.0 - TOLERANCE else SCALED
+                ratio = scale
+            else:
+                ratio = _dominance_ratio(
+                    signed, magnitude, signed_tol, magnitude_tol, other, row
+                )
+                if ratio is None:
+                    continue
+                reason = DOMINATED
+            pruned[row] = PrunedCombination(
+                limit_state, names[row], names[other], reason, ratio
+            )
+            break
+        else:
+            kept_rows.append(row)
+    return (
+        [name for row, name in enumerate(names) if row not in pruned],
+        [pruned[row] for row in sorted(pruned)],
+    )
+
+
+def serviceability_responses(
+    frame: Any,
+    data: Any,
+    gated: Sequence[bool],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the monitored SLS responses of an analysed frame.
+
+    The signed responses are the nodal drift and the vertical deflection the
+    acceptance gate measures (zero where ``gated`` is false); the
+    non-negative responses are the loss of original fall of every rafter
+    drainage segment.
+    """
+
+    combinations = list(data.serviceability_load_combinations)
+    names = [str(combination["name"]) for combination in combinations]
+    nodes = list(frame.nodes.values())
+    shape = (len(names), len(nodes))
+    drift = np.array([
+        [_result_value(node.DX, name) for node in nodes] for name in names
+    ]).reshape(shape)
+    vertical = np.array([
+        [_result_value(node.DY, name) for node in nodes] for name in names
+    ]).reshape(shape)
+    if uses_permanent_deflection_baseline(data):
+        vertical = vertical - np.array([
+            [
+                _result_value(node.DY, permanent_baseline_name(combination))
+                for node in nodes
+            ]
+            for combination in combinations
+        ]).reshape(shape)
+    vertical[~np.asarray(gated, dtype=bool)] = 0.0
+
+    fall_loss = [np.zeros((len(names), 0))]
+    for member in data.members:
+        if str(member.type).lower() != "rafter":
+            continue
+        _, original, deformed = _rafter_ordinates(frame, data, member, names)
+        fall = np.sign(np.diff(original))
+        fall_loss.append(np.maximum(
+            -fall * np.diff(deformed - original, axis=1), 0.0
+        ))
+    return np.hstack((drift, vertical)), np.hstack(fall_loss)
+
+
+def strength_responses(table, ratios) -> tuple[np.ndarray, np.ndarray]:
+    """Return the monitored ULS responses of a member action table.
+
+    ``table`` is a :class:`member_actions.MemberActionTable` and ``ratios``
+    the ``(CSS, OMS, LTB)`` utilisation arrays of its combinations. Axial
+    force and end moments are signed; the largest moment magnitude and the
+    utilisations are non-negative.
+    """
+
+    css, oms, ltb = ratios
+    return (
+        np.hstack((table.Cu, table.Mx_top, table.Mx_bot)),
+        np.hstack((table.Mx_max, css, oms, *ltb)),
+    )
@@ -22,7 +22,10 @@ import member_database as mdb
 from analysis_visualisation import build_analysis_visualisation
 from analysis_snapshot import load_analysis_snapshot, validate_snapshot_input
 from haunch_geometry import maximum_haunch_cut_depth_mm
-from serviceability_deflection import serviceability_deflection_rows
+from serviceability_deflection import (
+    first_largest,
+    serviceability_deflection_rows,
+)
 from strength_checks import (
     element_property_details,
     member_class_details,
@@ -673,7 +676,7 @@ def governing_serviceability_deflections(
 ]:
     """Select governing checked deflections and retain ignored vertical rows."""
 
-    governing_dx = max(
+    governing_dx = first_largest(
         deflections,
         key=lambda item: abs(float(item["max_dx"])),
         default=None,
@@ -699,7 +702,7 @@ def governing_serviceability_deflections(
         for item in deflections
         if item["load_combination"] not in ignored_names
     ]
-    governing_dy = max(
+    governing_dy = first_largest(
         checked_vertical,
         key=lambda item: abs(float(item["max_dy"])),
         default=None,
@@ -738,8 +741,8 @@ def build_frame_summary(data, member_db, rafter_section_type, column_section_typ
     governing_dx, governing_dy, ignored_vertical = (
         governing_serviceability_deflections(deflections, frame_data)
     )
-    governing_fx = max(reactions, key=lambda item: abs(item.fx), default=None)
-    governing_fy = max(reactions, key=lambda item: abs(item.fy), default=None)
+    governing_fx = first_largest(reactions, key=lambda item: abs(item.fx))
+    governing_fy = first_largest(reactions, key=lambda item: abs(item.fy))
     roof_drainage_failures = [
         item
         for item in deflections
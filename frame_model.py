@@ -90,6 +90,14 @@ def load_portal_frame(path: str) -> 'PortalFrame':
     import json
     with open(path) as f:
         data = json.load(f)
+    return portal_frame_from_dict(data)
+
+
+def portal_frame_from_dict(data: Dict) -> 'PortalFrame':
+    """Return the :class:`PortalFrame` of an analysis input dict.
+
+    The frame shares the lists and dicts of ``data``.
+    """
 
     nodes = {}
     for n in data.get('nodes', []):
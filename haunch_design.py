@@ -3,8 +3,17 @@
 The haunch is treated as a cut length of the selected rafter welded below the
 rafter.  PyNite physical members retain their original names and loads, while
 their automatically generated sub-members receive constant properties sampled
-at the sub-member midpoint.  Eight sub-members per haunch zone give a stable,
-auditable approximation without replacing PyNite's beam formulation.
+at the sub-member midpoint, without replacing PyNite's beam formulation.
+
+The number of sub-members per haunch zone is chosen adaptively for each
+rafter. A zone is split until two estimates meet their targets: the error of
+the stepped zone's flexibility integrals, scaled by the zone's share of the
+rafter-slope flexibility, and the moment-capacity error of the deepest
+sub-member, whose section is sampled at its midpoint. Shallow haunches
+relative to the rafter depth need few sub-members, deep haunches more.
+``haunch_discretisation: "Fixed"`` in the frame data restores the former
+eight sub-members per zone; :func:`haunch_discretisation_report` lists the
+convergence of both estimates.
 """
 
 from __future__ import annotations
@@ -13,13 +22,28 @@ from functools import lru_cache
 import math
 from typing import Any, Callable, Mapping
 
+from numpy.polynomial.legendre import leggauss
 from Pynite.PhysMember import PhysMember
 
 from haunch_geometry import haunch_cut_depth_check, haunch_cut_error
 
 
 HAUNCH_SEGMENTS = 8
+HAUNCH_DISCRETISATION_ADAPTIVE = "Adaptive"
+HAUNCH_DISCRETISATION_FIXED = "Fixed"
+HAUNCH_DISCRETISATION_MODES = (
+    HAUNCH_DISCRETISATION_ADAPTIVE,
+    HAUNCH_DISCRETISATION_FIXED,
+)
+# Adaptive targets: relative rafter-slope flexibility error and the
+# moment-capacity error of the deepest sub-member.
+HAUNCH_STIFFNESS_ERROR = 0.005
+HAUNCH_MOMENT_ERROR = 0.05
+HAUNCH_MAX_SEGMENTS = 16
 _TOLERANCE_MM = 1e-6
+_GAUSS_POINTS = tuple(
+    (float(point), float(weight)) for point, weight in zip(*leggauss(8))
+)
 
 
 def _rect_plastic_modulus_about_x(
@@ -62,13 +86,17 @@ def _plastic_axis(rectangles: list[tuple[float, float, float]]) -> float:
     return (low + high) / 2
 
 
+_PROPERTY_FIELDS = (
+    "Designation", "m", "h", "b", "tw", "tf", "r1", "hw", "A", "Ix",
+    "Zex", "Zplx", "rx", "Iy", "Zey", "Zply", "ry", "J", "Cw",
+    "Preferred",
+)
+
+
 def _property_key(base: Mapping[str, Any], added_depth_mm: float) -> tuple:
-    fields = (
-        "Designation", "m", "h", "b", "tw", "tf", "r1", "hw", "A", "Ix",
-        "Zex", "Zplx", "rx", "Iy", "Zey", "Zply", "ry", "J", "Cw",
-        "Preferred",
+    return tuple(base.get(field) for field in _PROPERTY_FIELDS) + (
+        round(added_depth_mm, 6),
     )
-    return tuple(base.get(field) for field in fields) + (round(added_depth_mm, 6),)
 
 
 @lru_cache(maxsize=4096)
@@ -238,6 +266,155 @@ def composite_haunch_properties(
     return dict(_composite_properties_cached(_property_key(base, added_depth_mm)))
 
 
+def _zone_integrals(base, zone_depth_mm, fractions):
+    """Return ``integral(t^k / Ix)`` for ``k = 0, 1, 2`` over ``t`` in [0, 1].
+
+    ``t`` runs from the haunch toe (no added depth) to the zone root.
+    ``fractions`` is ``None`` for the exact taper, integrated by Gauss
+    quadrature on each side of the added-flange kink, or the sub-member
+    boundaries of the stepped approximation.
+    """
+
+    def inverse_ix(t):
+        return 1.0 / float(
+            composite_haunch_properties(base, zone_depth_mm * t)["Ix"]
+        )
+
+    integrals = [0.0, 0.0, 0.0]
+    if fractions is None:
+        kink = float(base.get("tf", 0.0)) / zone_depth_mm
+        pieces = [(0.0, kink), (kink, 1.0)] if 0.0 < kink < 1.0 else [(0.0, 1.0)]
+        for start, end in pieces:
+            half = (end - start) / 2
+            for point, weight in _GAUSS_POINTS:
+                t = start + half * (point + 1.0)
+                value = half * weight * inverse_ix(t)
+                for power in range(3):
+                    integrals[power] += value * t**power
+        return integrals
+    for start, end in zip(fractions, fractions[1:]):
+        value = inverse_ix((start + end) / 2)
+        for power in range(3):
+            integrals[power] += value * (
+                end ** (power + 1) - start ** (power + 1)
+            ) / (power + 1)
+    return integrals
+
+
+def haunch_zone_errors(
+    base: Mapping[str, Any],
+    zone_depth_mm: float,
+    zone_length_mm: float,
+    slope_length_mm: float,
+    segments: int,
+) -> tuple[float, float]:
+    """Return ``(stiffness_error, moment_error)`` of one stepped haunch zone.
+
+    The stiffness error is the largest relative error of the zone's
+    flexibility integrals, scaled by the zone's share of the rafter-slope
+    flexibility ``integral(1 / Ix)``. The moment error is the relative
+    elastic-modulus shortfall of the deepest sub-member's midpoint section
+    against the zone root, where the haunch moment is largest.
+    """
+
+    return _zone_errors_cached(
+        _property_key(base, 0.0)[:-1],
+        round(float(zone_depth_mm), 6),
+        round(float(zone_length_mm), 6),
+        round(float(slope_length_mm), 6),
+        int(segments),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _zone_errors_cached(
+    base_key, zone_depth_mm, zone_length_mm, slope_length_mm, segments
+):
+    if zone_depth_mm <= _TOLERANCE_MM or zone_length_mm <= _TOLERANCE_MM:
+        return 0.0, 0.0
+    base = dict(zip(_PROPERTY_FIELDS, base_key))
+    exact = _zone_integrals(base, zone_depth_mm, None)
+    stepped = _zone_integrals(
+        base,
+        zone_depth_mm,
+        [index / segments for index in range(segments + 1)],
+    )
+    zone_flexibility = zone_length_mm * exact[0]
+    prismatic_flexibility = max(slope_length_mm - zone_length_mm, 0.0) / (
+        float(base["Ix"])
+    )
+    share = zone_flexibility / (zone_flexibility + prismatic_flexibility)
+    stiffness_error = share * max(
+        abs(float(approximate) / float(reference) - 1.0)
+        for approximate, reference in zip(stepped, exact)
+    )
+    root = composite_haunch_properties(base, zone_depth_mm)
+    deepest = composite_haunch_properties(
+        base, zone_depth_mm * (1.0 - 0.5 / segments)
+    )
+    moment_error = 1.0 - float(deepest["Zex"]) / float(root["Zex"])
+    return stiffness_error, moment_error
+
+
+def haunch_zone_segments(
+    base: Mapping[str, Any],
+    zone_depth_mm: float,
+    zone_length_mm: float,
+    slope_length_mm: float,
+    stiffness_error: float = HAUNCH_STIFFNESS_ERROR,
+    moment_error: float = HAUNCH_MOMENT_ERROR,
+) -> int:
+    """Return the fewest sub-members meeting both error targets."""
+
+    for segments in range(1, HAUNCH_MAX_SEGMENTS + 1):
+        stiffness, moment = haunch_zone_errors(
+            base, zone_depth_mm, zone_length_mm, slope_length_mm, segments
+        )
+        if stiffness <= stiffness_error and moment <= moment_error:
+            return segments
+    return HAUNCH_MAX_SEGMENTS
+
+
+def haunch_discretisation_report(
+    frame_data: Mapping[str, Any], rafter: Mapping[str, Any]
+) -> list[dict[str, Any]]:
+    """Return the sub-member choice and error convergence of each zone.
+
+    ``frame_data`` must have its cut depths resolved for ``rafter``. Each
+    row lists the zone geometry, its depth ratio to the rafter, the selected
+    sub-member count with its estimated errors and both estimates for every
+    count up to ``HAUNCH_MAX_SEGMENTS``.
+    """
+
+    profile = HaunchProfile(frame_data)
+    counts = profile.segment_counts(rafter)
+    rows = []
+    for zone, length, depth in profile.zones():
+        convergence = []
+        for segments in range(1, HAUNCH_MAX_SEGMENTS + 1):
+            stiffness, moment = haunch_zone_errors(
+                rafter, depth, length, profile.slope_length, segments
+            )
+            convergence.append({
+                "segments": segments,
+                "stiffness_error": stiffness,
+                "moment_error": moment,
+            })
+        selected = convergence[counts[zone] - 1]
+        rows.append({
+            "zone": zone,
+            "length_mm": length,
+            "depth_mm": depth,
+            "depth_ratio": depth / float(rafter["h"]),
+            "discretisation": profile.discretisation,
+            "segments": counts[zone],
+            "stiffness_error": selected["stiffness_error"],
+            "moment_error": selected["moment_error"],
+            "convergence": convergence,
+        })
+    return rows
+
+
 class HaunchProfile:
     """Resolve haunch depth at any point on a portal rafter."""
 
@@ -279,6 +456,13 @@ class HaunchProfile:
             else 0.0
         )
         self.apex_depth = float(frame_data.get("apex_haunch_depth", 0.0))
+        self.discretisation = str(
+            frame_data.get(
+                "haunch_discretisation", HAUNCH_DISCRETISATION_ADAPTIVE
+            )
+        )
+        if self.discretisation not in HAUNCH_DISCRETISATION_MODES:
+            self.discretisation = HAUNCH_DISCRETISATION_ADAPTIVE
 
     @property
     def enabled(self) -> bool:
@@ -288,6 +472,45 @@ class HaunchProfile:
             or self.apex_length > 0
         )
 
+    def zones(self) -> list[tuple[str, float, float]]:
+        """Return ``(zone, length, root depth)`` of each discretised zone."""
+
+        zones = [
+            ("left_eaves", self.left_eaves_length, self.eaves_depth),
+            (
+                "right_eaves",
+                self.right_eaves_length
+                if self.roof_type == "Duo Pitched"
+                else 0.0,
+                self.eaves_depth,
+            ),
+            ("apex", self.apex_length, self.apex_depth),
+        ]
+        return [zone for zone in zones if zone[1] > 0]
+
+    def segment_counts(
+        self, rafter: Mapping[str, Any] | None = None
+    ) -> dict[str, int]:
+        """Return the sub-member count of each zone for ``rafter``.
+
+        Fixed discretisation, or no rafter, gives ``HAUNCH_SEGMENTS``.
+        """
+
+        adaptive = (
+            rafter is not None
+            and self.discretisation == HAUNCH_DISCRETISATION_ADAPTIVE
+        )
+        return {
+            zone: (
+                haunch_zone_segments(
+                    rafter, depth, length, self.slope_length
+                )
+                if adaptive
+                else HAUNCH_SEGMENTS
+            )
+            for zone, length, depth in self.zones()
+        }
+
     def slope_position(self, x: float, y: float) -> float | None:
         del y
         run = self.span / 2 if self.roof_type == "Duo Pitched" else self.span
@@ -319,26 +542,37 @@ class HaunchProfile:
             )
         return max(eaves_depth, apex_depth)
 
-    def discretisation_points(self) -> list[tuple[float, float]]:
-        """Return internal global roof coordinates for the tapered zones."""
+    def discretisation_points(
+        self, segment_counts: Mapping[str, int] | None = None
+    ) -> list[tuple[float, float]]:
+        """Return internal global roof coordinates for the tapered zones.
+
+        ``segment_counts`` maps zones to sub-member counts, as returned by
+        :meth:`segment_counts`; missing zones use ``HAUNCH_SEGMENTS``.
+        """
+
+        counts = dict(segment_counts or {})
+
+        def positions(zone, length):
+            segments = int(counts.get(zone, HAUNCH_SEGMENTS))
+            return [
+                length * index / segments for index in range(1, segments + 1)
+            ]
 
         left_positions: set[float] = set()
         right_positions: set[float] = set()
         if self.left_eaves_length:
             left_positions.update(
-                self.left_eaves_length * index / HAUNCH_SEGMENTS
-                for index in range(1, HAUNCH_SEGMENTS + 1)
+                positions("left_eaves", self.left_eaves_length)
             )
         if self.roof_type == "Duo Pitched" and self.right_eaves_length:
             right_positions.update(
-                self.right_eaves_length * index / HAUNCH_SEGMENTS
-                for index in range(1, HAUNCH_SEGMENTS + 1)
+                positions("right_eaves", self.right_eaves_length)
             )
         if self.apex_length:
             apex_positions = {
-                self.slope_length
-                - self.apex_length * index / HAUNCH_SEGMENTS
-                for index in range(1, HAUNCH_SEGMENTS + 1)
+                self.slope_length - position
+                for position in positions("apex", self.apex_length)
             }
             left_positions.update(apex_positions)
             right_positions.update(apex_positions)
@@ -370,7 +604,12 @@ class HaunchProfile:
 
 
 class TaperedPhysMember(PhysMember):
-    """PyNite physical member assigning cached sections after discretisation."""
+    """PyNite physical member assigning cached sections after discretisation.
+
+    The portal template also sets ``design_spans``: the ``(x1, x2,
+    properties)`` strength-check stations along the member, which stay on
+    the fixed per-zone layout whatever the analysis discretisation.
+    """
 
     def __init__(
         self,
@@ -443,3 +682,66 @@ def haunch_extra_mass_kg(
             )
             total += count * extra_mass_per_m * segment_length / 1000.0
     return total
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    from tabulate import tabulate
+
+    import member_database as mdb
+    from portal_frame_analysis import haunch_convergence_check, import_data
+
+    parser = argparse.ArgumentParser(
+        description=(
+            "Report the adaptive haunch discretisation of a portal input file "
+            "and compare it with a refined discretisation."
+        )
+    )
+    parser.add_argument("input", help="input_data.json file")
+    parser.add_argument("--rafter", required=True)
+    parser.add_argument("--column", required=True)
+    parser.add_argument("--refinement", type=int, default=2)
+    parser.add_argument(
+        "--tolerance", type=float, default=HAUNCH_STIFFNESS_ERROR
+    )
+    arguments = parser.parse_args()
+
+    member_db = mdb.load_member_database()
+    frame_data = import_data(arguments.input)
+    settings = frame_data.frame_data[0]
+    report = haunch_convergence_check(
+        mdb.member_properties(
+            settings.get("rafter_section_type", "I-Sections"),
+            arguments.rafter,
+            member_db,
+        ),
+        mdb.member_properties(
+            settings.get("column_section_type", "I-Sections"),
+            arguments.column,
+            member_db,
+        ),
+        frame_data,
+        refinement=arguments.refinement,
+        tolerance=arguments.tolerance,
+    )
+    for zone in report["zones"]:
+        print(
+            f"{zone['zone']}: {zone['length_mm']:.0f} mm long, "
+            f"{zone['depth_mm']:.1f} mm deep (depth ratio "
+            f"{zone['depth_ratio']:.2f}), {zone['segments']} sub-members"
+        )
+        print(tabulate(
+            [
+                [
+                    row["segments"],
+                    f"{100 * row['stiffness_error']:.3f}",
+                    f"{100 * row['moment_error']:.2f}",
+                ]
+                for row in zone["convergence"]
+            ],
+            headers=["Sub-members", "Stiffness error %", "Moment error %"],
+        ))
+    print(json.dumps(report["summary"], indent=2))
+    raise SystemExit(0 if report["summary"]["status"] == "PASS" else 1)
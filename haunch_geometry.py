@@ -157,6 +157,20 @@ def governing_specified_haunch_cut_depth_mm(
     return max(requested, default=0.0)
 
 
+def haunch_depth_follows_rafter(frame_data: Mapping[str, Any]) -> bool:
+    """Return whether an enabled haunch takes its depth from the rafter."""
+
+    return any(
+        str(frame_data.get(f"use_{location}_haunch", "No")).lower() == "yes"
+        and str(
+            frame_data.get(
+                f"{location}_haunch_depth_mode", HAUNCH_DEPTH_SPECIFIED
+            )
+        ) in (HAUNCH_DEPTH_CUT, HAUNCH_DEPTH_AUTO)
+        for location in ("eaves", "apex")
+    )
+
+
 def resolve_haunch_cut_depths(
     frame_data: Mapping[str, Any],
     rafter_section: Mapping[str, Any],
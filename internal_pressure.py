@@ -9,10 +9,23 @@ envelope.  Openings are assumed to be uniformly distributed over each face.
 from __future__ import annotations
 
 import math
+from copy import deepcopy
+from functools import lru_cache
 from typing import Any, Mapping
 
 
 FACES = ("side_1", "side_2", "gable_1", "gable_2")
+# ``wind_data`` entries read by ``resolve_internal_pressure``, besides the
+# opening areas; they key its memoised results.
+INTERNAL_PRESSURE_KEYS = (
+    "wind_design_mode",
+    "building_type",
+    "building_roof",
+    "gable_width",
+    "building_length",
+    "eaves_height",
+    "apex_height",
+)
 
 
 def _number(value: Any, name: str) -> float:
@@ -151,6 +164,35 @@ def _one_direction_cpi(
 
 
 def resolve_internal_pressure(wind: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the internal-pressure basis and cpi envelope of ``wind``.
+
+    Results are memoised on the inputs they depend on; every call returns a
+    new dict.
+    """
+
+    raw = wind.get("opening_areas_m2")
+    items = tuple(
+        (key, wind[key]) for key in INTERNAL_PRESSURE_KEYS if key in wind
+    )
+    openings = tuple(raw.items()) if isinstance(raw, Mapping) else None
+    try:
+        hash((items, openings))
+    except TypeError:
+        return _resolve_internal_pressure(wind)
+    if raw is not None and openings is None:
+        return _resolve_internal_pressure(wind)
+    return deepcopy(_resolve_internal_pressure_cached(items, openings))
+
+
+@lru_cache(maxsize=64)
+def _resolve_internal_pressure_cached(items, openings) -> dict[str, Any]:
+    wind = dict(items)
+    if openings is not None:
+        wind["opening_areas_m2"] = dict(openings)
+    return _resolve_internal_pressure(wind)
+
+
+def _resolve_internal_pressure(wind: Mapping[str, Any]) -> dict[str, Any]:
     mode = normalize_design_mode(wind.get("wind_design_mode", "Prelim"))
     if wind.get("building_type") == "Canopy":
         return {"mode": mode, "applicable": False, "reason": "Canopy net coefficients apply."}
@@ -0,0 +1,700 @@
+"""Linear superposition of primary load cases for portal-frame trials.
+
+A first-order elastic portal has one stiffness matrix for every load
+combination. Each primary load case is therefore solved once and every
+serviceability, permanent-baseline, strength and foundation combination is
+built by factor arithmetic on the stored displacement and reaction results,
+one matrix product for all combinations of a stage.
+The combination results are written back into the PyNite model, so member
+force, deflection and reaction queries are unchanged for downstream code.
+
+Primary cases are solved by :func:`factorised_linear_analysis`, which
+assembles and factorises the stiffness matrix once and solves every case as
+one multi-column right-hand side. A model reused for many section trials can
+carry a :class:`FactorisationCache`, so the assembly maps, the fill-reducing
+ordering and the element load vectors are kept between trials and only the
+section-dependent values are refreshed. Trials that change only the column or
+only the rafter section reuse the previous factorisation through the Woodbury
+identity; :data:`SOLVE_STATISTICS` counts both kinds of solve.
+
+Analysed results can also be exported as a plain result bundle and restored
+onto a freshly built model of the same frame without another solve: PyNite
+recovers member actions from the nodal displacements and the member loads.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from typing import Any, Callable, Iterable, Mapping
+
+import numpy as np
+from numpy.linalg import inv
+from Pynite.Analysis import (
+    _calc_reactions,
+    _identify_combos,
+    _partition,
+    _partition_D,
+    _prepare_model,
+    _store_displacements,
+)
+from scipy.sparse import coo_matrix
+from scipy.sparse.linalg import splu
+
+
+PRIMARY_CASE_PREFIX = "__PRIMARY_CASE__"
+FULL_SOLVE = "full"
+LOW_RANK_SOLVE = "low_rank"
+# Free-DOF solves of this process by FactorisationCache, by kind.
+SOLVE_STATISTICS = Counter()
+_DISPLACEMENT_KEYS = ("DX", "DY", "DZ", "RX", "RY", "RZ")
+_REACTION_KEYS = ("RxnFX", "RxnFY", "RxnFZ", "RxnMX", "RxnMY", "RxnMZ")
+
+
+def primary_case_combination_name(case_name: str) -> str:
+    """Return the internal unit-factor combination name for one load case."""
+
+    return f"{PRIMARY_CASE_PREFIX}{case_name}"
+
+
+def combination_factors(
+    combinations: Iterable[Mapping[str, Any]],
+) -> dict[str, dict[str, float]]:
+    """Return ``{name: factors}`` with PyNite's last-definition-wins rule."""
+
+    factors_by_name: dict[str, dict[str, float]] = {}
+    for combination in combinations:
+        factors_by_name[str(combination["name"])] = {
+            str(case): float(factor)
+            for case, factor in dict(combination.get("factors", {})).items()
+        }
+    return factors_by_name
+
+
+def primary_load_cases(
+    combinations: Iterable[Mapping[str, Any]],
+) -> list[str]:
+    """Return every load case with a non-zero factor, in first-use order."""
+
+    cases: dict[str, None] = {}
+    for factors in combination_factors(combinations).values():
+        for case, factor in factors.items():
+            if abs(factor) > 1e-12:
+                cases.setdefault(case, None)
+    return list(cases)
+
+
+def _activate_combinations(frame: Any, names: list[str]) -> None:
+    active = dict.fromkeys(names, True)
+    for spring in getattr(frame, "springs", {}).values():
+        spring.active.update(active)
+    for physical in frame.members.values():
+        physical.active.update(active)
+        for sub_member in physical.sub_members.values():
+            sub_member.active.update(active)
+
+
+def superpose_combinations(
+    frame: Any,
+    combinations: Iterable[Mapping[str, Any]],
+) -> None:
+    """Store factored primary-case results as analysed PyNite combinations.
+
+    Each primary case's displacements and reactions are its influence
+    coefficients: every combination is a row of the factor matrix, so all
+    of them are evaluated by one matrix product however many crane
+    scenarios, signs and patterns they enumerate.
+    """
+
+    factors_by_name = combination_factors(combinations)
+    names = list(factors_by_name)
+    if not names:
+        return
+    cases = list(dict.fromkeys(
+        case
+        for factors in factors_by_name.values()
+        for case, factor in factors.items()
+        if abs(factor) > 1e-12
+    ))
+    factor_matrix = np.array([
+        [
+            factor if abs(factor := factors.get(case, 0.0)) > 1e-12 else 0.0
+            for case in cases
+        ]
+        for factors in factors_by_name.values()
+    ]).reshape(len(names), len(cases))
+    primaries = [primary_case_combination_name(case) for case in cases]
+    size = len(frame.nodes) * 6
+    displacements = (
+        np.hstack([frame._D[primary] for primary in primaries])
+        if primaries
+        else np.zeros((size, 0))
+    ) @ factor_matrix.T
+    for name, factors in factors_by_name.items():
+        frame.add_load_combo(name, factors)
+    for column, name in enumerate(names):
+        frame._D[name] = displacements[:, [column]]
+    for node in frame.nodes.values():
+        offset = node.ID * 6
+        for index, key in enumerate(_DISPLACEMENT_KEYS):
+            getattr(node, key).update(
+                zip(names, displacements[offset + index].tolist())
+            )
+        for key in _REACTION_KEYS:
+            values = getattr(node, key)
+            primary_values = np.array(
+                [values.get(primary, 0.0) for primary in primaries],
+                dtype=float,
+            )
+            values.update(
+                zip(names, (factor_matrix @ primary_values).tolist())
+            )
+    _activate_combinations(frame, names)
+
+
+class FactorisationCache:
+    """Candidate-independent parts of :func:`factorised_linear_analysis`.
+
+    Section trials on one prepared portal model change only the section
+    properties and the self-weight loads. The first solve assembles the
+    stiffness matrix with PyNite, including its nodal stability check, and
+    records each element's global DOF indices and transformation, the node
+    spring terms and the fill-reducing column ordering of the free-DOF
+    matrix. Later solves of the same topology only recompute the local
+    element stiffnesses. When only one member group's sections changed, the
+    system is solved by a low-rank update of the last factorisation;
+    otherwise it is factorised afresh with the stored ordering.
+
+    Element fixed-end reaction vectors are kept by element and load
+    signature, so a load case is only recomputed for elements whose loads
+    changed: in practice the self-weight case of a section not seen before.
+    """
+
+    # Stored element load vectors before the store is emptied.
+    MAX_LOAD_VECTORS = 20000
+    # Low-rank updates are used while at most this share of the DOFs changed,
+    # the capacitance matrix is this well conditioned and the relative
+    # residual is this small.
+    MAX_UPDATE_FRACTION = 0.5
+    MAX_CAPACITANCE_CONDITION = 1e8
+    RESIDUAL_TOLERANCE = 1e-12
+
+    def __init__(self):
+        self.topology = None
+        self.elements = None
+        self.ordering = None
+        self.reference = None
+        self.load_vectors: dict[tuple, np.ndarray] = {}
+        self.load_vector_hits = 0
+        self.load_vector_misses = 0
+
+    @staticmethod
+    def _topology(frame: Any, combo_name: str) -> tuple | None:
+        """Return the key of everything the stored structure depends on."""
+
+        if frame.springs or frame.plates or frame.quads:
+            return None
+        return (
+            tuple(
+                (
+                    node.name, node.X, node.Y, node.Z,
+                    node.support_DX, node.support_DY, node.support_DZ,
+                    node.support_RX, node.support_RY, node.support_RZ,
+                    *(
+                        tuple(getattr(node, f"spring_{dof}"))
+                        for dof in _DISPLACEMENT_KEYS
+                    ),
+                )
+                for node in frame.nodes.values()
+            ),
+            tuple(
+                (
+                    member.name, member.i_node.name, member.j_node.name,
+                    member.rotation, tuple(member.Releases),
+                )
+                for member in _active_elements(frame, combo_name)
+            ),
+        )
+
+    def stiffness(self, frame: Any, combo_name: str):
+        """Return the global stiffness matrix of ``frame`` in CSR format."""
+
+        topology = self._topology(frame, combo_name)
+        if topology is None:
+            self.topology = None
+            return frame.K(combo_name).tocsr()
+        elements = list(_active_elements(frame, combo_name))
+        if topology != self.topology:
+            matrix = frame.K(combo_name).tocsr()
+            dofs = np.array([
+                frame._build_dof_vector(member.i_node, member.j_node)
+                for member in elements
+            ]).reshape(len(elements), 12)
+            transformations = np.array(
+                [member.T() for member in elements]
+            ).reshape(len(elements), 12, 12)
+            springs = [
+                (6 * node.ID + index, float(spring[0]))
+                for node in frame.nodes.values()
+                for index, dof in enumerate(_DISPLACEMENT_KEYS)
+                for spring in (getattr(node, f"spring_{dof}"),)
+                if spring[0] is not None and spring[2]
+            ]
+            spring_dofs = np.array([dof for dof, _ in springs], dtype=int)
+            self.elements = {
+                "rows": np.concatenate(
+                    [spring_dofs, np.repeat(dofs, 12, axis=1).ravel()]
+                ),
+                "cols": np.concatenate(
+                    [spring_dofs, np.tile(dofs, (1, 12)).ravel()]
+                ),
+                "springs": np.array([value for _, value in springs]),
+                "inverse": [inv(matrix) for matrix in transformations],
+                "transformations": list(transformations),
+                "size": len(frame.nodes) * 6,
+            }
+            self.topology = topology
+            self.ordering = None
+            self.reference = None
+            self.load_vectors.clear()
+            return matrix
+        structure = self.elements
+        # Multiplied element by element as PyNite does, so the matrix equals
+        # ``frame.K`` exactly.
+        values = [
+            (inverse @ member.k()) @ transformation
+            for member, inverse, transformation in zip(
+                elements, structure["inverse"], structure["transformations"]
+            )
+        ]
+        data = np.concatenate([structure["springs"], np.ravel(values)])
+        # PyNite drops zero terms; the same sparsity keeps the same pivots.
+        nonzero = data != 0.0
+        return coo_matrix(
+            (
+                data[nonzero],
+                (structure["rows"][nonzero], structure["cols"][nonzero]),
+            ),
+            shape=(structure["size"], structure["size"]),
+        ).tocsr()
+
+    def fixed_end_reactions(self, frame: Any, combo: Any) -> np.ndarray:
+        """Return the global fixed-end reaction vector of ``combo``."""
+
+        if self.topology is None or frame.plates or frame.quads:
+            return frame.FER(combo.name)
+        if len(self.load_vectors) > self.MAX_LOAD_VECTORS:
+            self.load_vectors.clear()
+        vector = np.zeros((len(frame.nodes) * 6, 1))
+        for member in _elements(frame):
+            loads = tuple(
+                (
+                    factor,
+                    tuple(tuple(load) for load in member.DistLoads
+                          if load[5] == case),
+                    tuple(tuple(load) for load in member.PtLoads
+                          if load[3] == case),
+                )
+                for case, factor in combo.factors.items()
+            )
+            if not any(distributed or points for _, distributed, points in loads):
+                continue
+            key = (member.name, loads)
+            if any(member.Releases):
+                # Released ends condense the load vector with the stiffness.
+                key += (
+                    member.material.E, member.material.G, member.section.A,
+                    member.section.Iy, member.section.Iz, member.section.J,
+                )
+            element = self.load_vectors.get(key)
+            if element is None:
+                element = self.load_vectors[key] = np.asarray(
+                    member.FER(combo.name), dtype=float
+                ).reshape(-1)
+                self.load_vector_misses += 1
+            else:
+                self.load_vector_hits += 1
+            vector[frame._build_dof_vector(member.i_node, member.j_node), 0] += (
+                element
+            )
+        return vector
+
+    def solve(self, matrix, rhs: np.ndarray) -> np.ndarray:
+        """Solve the free-DOF system ``matrix @ x = rhs``.
+
+        The last full factorisation is kept as the reference. A matrix that
+        differs from it in few DOFs, as when only the column or only the
+        rafter section changed, is solved with the Woodbury identity from
+        the reference factors. Otherwise, or when the update is
+        ill-conditioned or its residual too large, the matrix is factorised
+        afresh with the stored ordering and becomes the reference.
+        """
+
+        matrix = matrix.tocsc()
+        if (
+            self.reference is not None
+            and self.reference["matrix"].shape == matrix.shape
+        ):
+            solution = self._updated_solution(matrix, rhs)
+            if solution is not None:
+                SOLVE_STATISTICS[LOW_RANK_SOLVE] += 1
+                return solution
+        SOLVE_STATISTICS[FULL_SOLVE] += 1
+        if self.ordering is None or self.ordering.size != matrix.shape[0]:
+            factor = splu(matrix)
+            self.ordering = np.argsort(factor.perm_c)
+            solve = factor.solve
+        else:
+            factor = splu(matrix[:, self.ordering], permc_spec="NATURAL")
+
+            def solve(values, factor=factor, ordering=self.ordering):
+                solution = np.empty_like(values)
+                solution[ordering] = factor.solve(values)
+                return solution
+
+        self.reference = {"matrix": matrix, "solve": solve, "bases": {}}
+        return solve(rhs)
+
+    def _updated_solution(self, matrix, rhs: np.ndarray) -> np.ndarray | None:
+        """Return the Woodbury solution, or ``None`` to refactorise."""
+
+        reference = self.reference
+        difference = (matrix - reference["matrix"]).tocoo()
+        changed = np.union1d(
+            difference.row[difference.data != 0.0],
+            difference.col[difference.data != 0.0],
+        )
+        if changed.size > self.MAX_UPDATE_FRACTION * matrix.shape[0]:
+            return None
+        solution = reference["solve"](rhs)
+        if not changed.size:
+            return solution
+        # K = K0 + U C U^T with U selecting the changed DOFs, so
+        # x = y - Z (I + C Z_S)^-1 C y_S with y = K0^-1 b and Z = K0^-1 U.
+        key = changed.tobytes()
+        basis = reference["bases"].get(key)
+        if basis is None:
+            selector = np.zeros((matrix.shape[0], changed.size))
+            selector[changed, np.arange(changed.size)] = 1.0
+            basis = reference["bases"][key] = reference["solve"](selector)
+        update = difference.tocsr()[changed][:, changed].toarray()
+        capacitance = np.eye(changed.size) + update @ basis[changed]
+        if np.linalg.cond(capacitance) > self.MAX_CAPACITANCE_CONDITION:
+            return None
+        solution = solution - basis @ np.linalg.solve(
+            capacitance, update @ solution[changed]
+        )
+        residual = np.abs(matrix @ solution - rhs).max(initial=0.0)
+        scale = (
+            abs(matrix).max() * np.abs(solution).max(initial=0.0)
+            + np.abs(rhs).max(initial=0.0)
+        )
+        if not np.isfinite(residual) or residual > (
+            self.RESIDUAL_TOLERANCE * scale
+        ):
+            return None
+        return solution
+
+
+def _elements(frame: Any):
+    for physical in frame.members.values():
+        yield from physical.sub_members.values()
+
+
+def _active_elements(frame: Any, combo_name: str):
+    for physical in frame.members.values():
+        if physical.active[combo_name]:
+            yield from physical.sub_members.values()
+
+
+def factorised_linear_analysis(
+    frame: Any,
+    combo_tags: Iterable[str] | None = None,
+) -> None:
+    """Run PyNite's first-order linear analysis with one factorisation.
+
+    PyNite assembles and solves the stiffness matrix separately for every
+    combination. A linear portal has one stiffness for all of them, so the
+    matrix is assembled and LU-factorised once and the selected combinations
+    are solved as the columns of one right-hand side. Displacements and
+    reactions are stored exactly as ``FEModel3D.analyze_linear`` stores them.
+
+    A :class:`FactorisationCache` stored as ``frame._portal_factorisation``
+    is used for the assembly, the load vectors and the factorisation.
+    """
+
+    _prepare_model(frame)
+    combos = _identify_combos(frame, combo_tags)
+    if not combos:
+        return
+    cache = getattr(frame, "_portal_factorisation", None)
+    D1_indices, D2_indices, D2 = _partition_D(frame)
+    K11, K12, _, _ = _partition(
+        frame,
+        frame.K(combos[0].name).tocsr()
+        if cache is None
+        else cache.stiffness(frame, combos[0].name),
+        D1_indices,
+        D2_indices,
+    )
+    loads = []
+    for combo in combos:
+        FER1, _ = _partition(
+            frame,
+            frame.FER(combo.name)
+            if cache is None
+            else cache.fixed_end_reactions(frame, combo),
+            D1_indices,
+            D2_indices,
+        )
+        P1, _ = _partition(frame, frame.P(combo.name), D1_indices, D2_indices)
+        loads.append(P1 - FER1 - K12 @ D2)
+    if K11.shape == (0, 0):
+        D1 = np.zeros((0, len(combos)))
+    else:
+        try:
+            D1 = (
+                splu(K11.tocsc()).solve(np.hstack(loads))
+                if cache is None
+                else cache.solve(K11, np.hstack(loads))
+            )
+        except RuntimeError as exc:
+            raise Exception(
+                "The stiffness matrix is singular, which implies rigid body "
+                "motion. The structure is unstable. Aborting analysis."
+            ) from exc
+    for column, combo in enumerate(combos):
+        _store_displacements(
+            frame, D1[:, [column]], D2, D1_indices, D2_indices, combo
+        )
+    _calc_reactions(frame, False, combo_tags)
+    frame.solution = "Linear"
+
+
+def solve_primary_cases(
+    frame: Any,
+    combinations: Iterable[Mapping[str, Any]],
+    analyze: Callable[[Any], None] | None = None,
+) -> list[str]:
+    """Solve every primary load case used by ``combinations`` once.
+
+    No requested combination is added; call :func:`superpose_combinations`
+    afterwards, in one or several stages, to build them. ``analyze`` defaults
+    to PyNite's first-order ``analyze`` without statics checks.
+    """
+
+    cases = primary_load_cases(combinations)
+    for case in cases:
+        frame.add_load_combo(primary_case_combination_name(case), {case: 1.0})
+    if analyze is None:
+        frame.analyze(check_statics=False)
+    else:
+        analyze(frame)
+    return cases
+
+
+def analyze_by_superposition(
+    frame: Any,
+    combinations: Iterable[Mapping[str, Any]],
+    analyze: Callable[[Any], None] | None = None,
+) -> list[str]:
+    """Solve each primary case once, then superpose all ``combinations``.
+
+    ``frame`` must not yet contain the requested combinations; they are added
+    after the primary-case solve so PyNite does not analyse them again.
+    ``analyze`` defaults to PyNite's first-order ``analyze`` without statics
+    checks. The solved primary load-case names are returned.
+    """
+
+    combinations = list(combinations)
+    cases = solve_primary_cases(frame, combinations, analyze)
+    superpose_combinations(frame, combinations)
+    return cases
+
+
+def result_bundle(
+    frame: Any,
+    combinations: Iterable[Mapping[str, Any]],
+) -> dict[str, Any]:
+    """Return serialisable displacements and reactions of ``combinations``."""
+
+    factors_by_name = combination_factors(combinations)
+
+    def stored(values):
+        return {
+            name: float(values.get(name, 0.0)) for name in factors_by_name
+        }
+
+    return {
+        "combinations": [
+            {"name": name, "factors": factors}
+            for name, factors in factors_by_name.items()
+        ],
+        "nodes": {
+            str(node_name): {
+                key: stored(getattr(node, key))
+                for key in _DISPLACEMENT_KEYS + _REACTION_KEYS
+            }
+            for node_name, node in frame.nodes.items()
+        },
+    }
+
+
+def restore_result_bundle(frame: Any, bundle: Mapping[str, Any]) -> None:
+    """Load a :func:`result_bundle` into an unanalysed model of the frame.
+
+    ``frame`` must have the same nodes, members and loads as the model the
+    bundle was taken from. Combinations are added, members are discretised
+    and numbered as PyNite would before a solve, and the stored results are
+    written to the nodes; no stiffness matrix is assembled.
+    """
+
+    for combination in bundle["combinations"]:
+        frame.add_load_combo(combination["name"], combination["factors"])
+    _prepare_model(frame)
+    names = [combination["name"] for combination in bundle["combinations"]]
+    for name in names:
+        frame._D[name] = np.zeros((len(frame.nodes) * 6, 1))
+    for node_name, node in frame.nodes.items():
+        stored = bundle["nodes"][str(node_name)]
+        offset = node.ID * 6
+        for index, key in enumerate(_DISPLACEMENT_KEYS):
+            values = getattr(node, key)
+            for name in names:
+                values[name] = stored[key][name]
+                frame._D[name][offset + index, 0] = stored[key][name]
+        for key in _REACTION_KEYS:
+            getattr(node, key).update(stored[key])
+    frame.solution = "Linear"
+
+
+def _member_samples(
+    frame: Any,
+    combination: str,
+    count: int,
+) -> dict[tuple[str, str, int], float]:
+    samples = {}
+    for member_name, member in frame.members.items():
+        length = float(member.L())
+        for index in range(count):
+            distance = min(length * index / (count - 1), length)
+            samples[(member_name, "axial", index)] = float(
+                member.axial(distance, combination)
+            )
+            samples[(member_name, "shear_y", index)] = float(
+                member.shear("Fy", distance, combination)
+            )
+            samples[(member_name, "moment_z", index)] = float(
+                member.moment("Mz", distance, combination)
+            )
+            samples[(member_name, "deflection_y", index)] = float(
+                member.deflection("dy", distance, combination)
+            )
+    return samples
+
+
+def compare_combination_results(
+    reference: Any,
+    candidate: Any,
+    combinations: Iterable[Mapping[str, Any]],
+    *,
+    tolerance: float = 1e-6,
+    member_samples: int = 7,
+) -> dict[str, Any]:
+    """Compare two analysed models combination by combination.
+
+    Differences are relative to the larger of 1.0 and the reference value, so
+    near-zero displacements and reactions are compared absolutely.
+    """
+
+    rows = []
+    for name in combination_factors(combinations):
+        worst = {"quantity": "", "location": "", "difference": 0.0}
+
+        def record(quantity: str, location: str, expected: float, actual: float):
+            difference = abs(actual - expected) / max(1.0, abs(expected))
+            if not math.isfinite(difference):
+                difference = math.inf
+            if difference > worst["difference"] or not worst["quantity"]:
+                worst.update(
+                    quantity=quantity,
+                    location=location,
+                    difference=difference,
+                )
+
+        for node_name, node in reference.nodes.items():
+            other = candidate.nodes[node_name]
+            for key in _DISPLACEMENT_KEYS + _REACTION_KEYS:
+                record(
+                    key,
+                    node_name,
+                    float(getattr(node, key).get(name, 0.0)),
+                    float(getattr(other, key).get(name, 0.0)),
+                )
+        expected_samples = _member_samples(reference, name, member_samples)
+        actual_samples = _member_samples(candidate, name, member_samples)
+        for (member_name, quantity, index), value in expected_samples.items():
+            record(
+                quantity,
+                f"{member_name}@{index}",
+                value,
+                actual_samples[(member_name, quantity, index)],
+            )
+        rows.append({
+            "load_combination": name,
+            "governing_quantity": worst["quantity"],
+            "governing_location": worst["location"],
+            "max_relative_difference": worst["difference"],
+            "status": "PASS" if worst["difference"] <= tolerance else "FAIL",
+        })
+    return {
+        "summary": {
+            "combinations": len(rows),
+            "tolerance": tolerance,
+            "max_relative_difference": max(
+                (row["max_relative_difference"] for row in rows),
+                default=0.0,
+            ),
+            "status": (
+                "PASS"
+                if all(row["status"] == "PASS" for row in rows)
+                else "FAIL"
+            ),
+        },
+        "combinations": rows,
+    }
+
+
+if __name__ == "__main__":
+    import json
+    import sys
+
+    import member_database as mdb
+    from portal_frame_analysis import (
+        import_data,
+        superposition_regression_check,
+    )
+
+    if len(sys.argv) != 4:
+        raise SystemExit(
+            "Usage: python load_superposition.py INPUT_JSON RAFTER COLUMN"
+        )
+    input_path, rafter, column = sys.argv[1:4]
+    frame_data = import_data(input_path)
+    settings = frame_data.frame_data[0]
+    member_db = mdb.load_member_database()
+    comparison = superposition_regression_check(
+        mdb.member_properties(
+            settings.get("rafter_section_type", "I-Sections"),
+            rafter,
+            member_db,
+        ),
+        mdb.member_properties(
+            settings.get("column_section_type", "I-Sections"),
+            column,
+            member_db,
+        ),
+        frame_data,
+    )
+    print(json.dumps(comparison["summary"], indent=2))
+    raise SystemExit(0 if comparison["summary"]["status"] == "PASS" else 1)
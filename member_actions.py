@@ -0,0 +1,422 @@
+"""Closed-form member design actions for every load combination.
+
+The member checks need, per design segment and ULS combination, the largest
+axial force, the largest moment magnitude and the end moments. Querying the
+analysis members for each combination rebuilds their load segments every
+time. Here each analysis element is processed once for all combinations:
+the end forces follow from the element stiffness, the nodal displacements
+and the fixed-end reactions of each unit load case, and the load-only axial
+force, shear and moment at every load discontinuity are linear in the case
+factors. Within a segment the axial force is quadratic and the moment cubic,
+so the extremes are found exactly at the segment ends and the real roots of
+their derivatives, for all combinations as array operations.
+
+:class:`MemberActionTable` holds the results as ``(combinations, segments)``
+arrays for ``member_design_grid`` and rebuilds the action dictionaries of
+``extract_member_actions`` for the calculation reports. PyNite and
+:class:`plane_frame.PlaneFrame` models are both supported; members with end
+releases are queried through the member API as before.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+
+from plane_frame import PlaneElement, _break_positions, _load_actions
+from strength_checks import element_properties, member_class_check
+
+
+# Moment and axial coefficients of one load-continuous segment, in the order
+# returned by ``plane_frame._load_actions``.
+_N, _V, _M, _PA, _PB, _WA, _WB = range(7)
+
+
+@dataclass(frozen=True)
+class MemberActionTable:
+    """Design actions of every member segment for a set of combinations.
+
+    ``segments`` holds the combination-independent fields of each action
+    dictionary (name, section, buckling lengths) and ``properties`` the
+    section properties used for the class check. ``Cu``, ``Mx_max``,
+    ``Mx_top`` and ``Mx_bot`` are ``(combinations, segments)`` arrays rounded
+    as in the reports.
+    """
+
+    combinations: tuple[str, ...]
+    segments: tuple[dict, ...]
+    properties: tuple[Mapping[str, Any], ...]
+    steel_grade: Any
+    Cu: np.ndarray
+    Mx_max: np.ndarray
+    Mx_top: np.ndarray
+    Mx_bot: np.ndarray
+
+    def actions(self, combination: str) -> list[dict]:
+        """Return the ``extract_member_actions`` list of one combination."""
+
+        row = self.combinations.index(combination)
+        actions = []
+        for column, segment in enumerate(self.segments):
+            Cu = float(self.Cu[row, column])
+            Mx_max = float(self.Mx_max[row, column])
+            Mx_top = float(self.Mx_top[row, column])
+            Mx_bot = float(self.Mx_bot[row, column])
+            w1, w2 = element_properties(Mx_max, Mx_top, Mx_bot)
+            action = {
+                key: value
+                for key, value in segment.items()
+                if key != 'section_properties'
+            }
+            action.update({
+                'Cu': Cu,
+                'Class': member_class_check(
+                    Cu, self.properties[column], self.steel_grade
+                ),
+                'Mx_max': Mx_max,
+                'Mx_top': Mx_top,
+                'Mx_bot': Mx_bot,
+                'w1': w1,
+                'w2': w2,
+            })
+            if 'section_properties' in segment:
+                action['section_properties'] = dict(
+                    segment['section_properties']
+                )
+            actions.append(action)
+        return actions
+
+    def by_combination(self) -> dict[str, list[dict]]:
+        """Return the action lists of every combination, keyed by name."""
+
+        return {name: self.actions(name) for name in self.combinations}
+
+
+def design_segments(frame, r_type, r_mem, c_type, c_mem, data):
+    """Return ``(descriptor, properties, analysis_member, parts)`` rows.
+
+    ``parts`` lists the ``(element, start, end)`` element-local ranges that
+    make up the segment. Haunched rafters are checked per haunch design
+    span, or per analysis sub-element for models without spans; every other
+    member is one segment over its sub-elements.
+    """
+
+    fr = data.frame_data[0]
+    rafter_span = fr['gable_width'] / (
+        2 if fr['building_roof'] == "Duo Pitched" else 1
+    )
+    rows = []
+    for mem in data.members:
+        physical = frame.members[mem.name]
+        base_properties = r_mem if mem.type == "rafter" else c_mem
+        sub_members = list(physical.sub_members.values())
+        segments = []
+        if mem.type == "rafter":
+            spans = getattr(physical, "design_spans", None)
+            released = any(
+                any(getattr(sub_member, "Releases", ()))
+                for sub_member in sub_members
+            )
+            if spans and not released and any(
+                properties for *_, properties in spans
+            ):
+                segments = [
+                    (physical, properties,
+                     _span_parts(sub_members, x1, x2))
+                    for x1, x2, properties in spans
+                ]
+            elif any(
+                hasattr(sub_member, "portal_properties")
+                for sub_member in sub_members
+            ):
+                segments = [
+                    (sub_member,
+                     getattr(sub_member, "portal_properties", None),
+                     [(sub_member, 0.0, sub_member.L())])
+                    for sub_member in sub_members
+                ]
+        if not segments:
+            segments = [(
+                physical,
+                None,
+                [(sub_member, 0.0, sub_member.L())
+                 for sub_member in sub_members],
+            )]
+
+        for segment_index, (analysis_member, properties, parts) in enumerate(
+            segments, 1
+        ):
+            is_haunch = properties is not None
+            properties = properties or base_properties
+            result_name = (
+                f"{mem.name}[H{segment_index}]"
+                if is_haunch
+                else (
+                    f"{mem.name}[R{segment_index}]"
+                    if len(segments) > 1
+                    else mem.name
+                )
+            )
+            lx = (
+                rafter_span if mem.type == 'rafter' else fr['eaves_height']
+            ) / 1000
+            kx = 1.0 if mem.type == 'rafter' else 1.2
+            # Stability lengths remain the physical brace-panel length; the
+            # numerical haunch sub-elements are not additional restraints.
+            ly = mem.length
+            ky = 1.0
+            descriptor = {
+                'Name': result_name,
+                'parent_member': mem.name,
+                'kly': ky * ly,
+                'klx': kx * lx,
+                'kx': kx,
+                'lx': lx,
+                'ky': ky,
+                'ly': ly,
+                'type': mem.type,
+                'section_type': (
+                    "Haunched rafter"
+                    if is_haunch
+                    else (r_type if mem.type == "rafter" else c_type)
+                ),
+                'section': properties['Designation'],
+            }
+            if is_haunch:
+                descriptor['section_properties'] = dict(properties)
+            rows.append((descriptor, properties, analysis_member, parts))
+    return rows
+
+
+def _span_parts(sub_members, x1, x2):
+    """Return the ``(element, start, end)`` ranges covering ``[x1, x2]``."""
+
+    parts = []
+    offset = 0.0
+    for sub_member in sub_members:
+        length = sub_member.L()
+        start = max(x1, offset)
+        end = min(x2, offset + length)
+        if round(end, 10) > round(start, 10):
+            parts.append((sub_member, start - offset, end - offset))
+        offset += length
+    return parts
+
+
+def member_action_table(frame, r_type, r_mem, c_type, c_mem, data,
+                        combinations: Sequence[str]) -> MemberActionTable:
+    """Return the design actions of ``combinations`` on an analysed frame."""
+
+    combinations = tuple(combinations)
+    factors = [frame.load_combos[name].factors for name in combinations]
+    cases = sorted({case for combo in factors for case in combo})
+    factor_matrix = np.array(
+        [[combo.get(case, 0.0) for case in cases] for combo in factors]
+    ).reshape(len(combinations), len(cases))
+
+    rows = design_segments(frame, r_type, r_mem, c_type, c_mem, data)
+    # Every element is evaluated once, split at the ends of the design
+    # segments that cover it.
+    elements = {}
+    for *_, parts in rows:
+        for element, start, end in parts:
+            elements.setdefault(id(element), (element, set()))[1].update(
+                (start, end)
+            )
+    evaluated = {}
+
+    shape = (len(combinations), len(rows))
+    Cu, Mx_max, Mx_top, Mx_bot = (np.zeros(shape) for _ in range(4))
+    for column, (_, _, analysis_member, parts) in enumerate(rows):
+        if any(any(getattr(element, "Releases", ())) for element, *_ in parts):
+            values = _queried_actions(analysis_member, combinations)
+        else:
+            for element, *_ in parts:
+                if id(element) not in evaluated:
+                    evaluated[id(element)] = _element_segments(
+                        element, combinations, cases, factor_matrix,
+                        elements[id(element)][1],
+                    )
+            values = _closed_form_actions(parts, evaluated)
+        (Cu[:, column], Mx_max[:, column],
+         Mx_top[:, column], Mx_bot[:, column]) = values
+
+    return MemberActionTable(
+        combinations=combinations,
+        segments=tuple(row[0] for row in rows),
+        properties=tuple(row[1] for row in rows),
+        steel_grade=data.steel_grade,
+        Cu=np.round(Cu, 3),
+        Mx_max=np.round(Mx_max / 1000, 3),
+        Mx_top=np.round(Mx_top / 1000, 3),
+        Mx_bot=np.round(Mx_bot / 1000, 3),
+    )
+
+
+def _queried_actions(member, combinations):
+    end_position = max(member.L() - 1e-6, 0.0)
+    values = np.array([
+        (
+            member.max_axial(combo),
+            max(
+                member.max_moment('Mz', combo),
+                abs(member.min_moment('Mz', combo)),
+            ),
+            member.moment('Mz', 0, combo),
+            member.moment('Mz', end_position, combo),
+        )
+        for combo in combinations
+    ]).reshape(len(combinations), 4)
+    return values.T
+
+
+def _closed_form_actions(parts, evaluated):
+    """Return ``Cu, |M|max, M(start), M(end)`` over consecutive ranges."""
+
+    coefficients = []
+    lengths = []
+    first_moment = last_moment = None
+    for index, (element, start, end) in enumerate(parts):
+        starts, h, segment = evaluated[id(element)]
+        rounded = [round(x, 10) for x in starts]
+        first = bisect_left(rounded, round(start, 10))
+        last = bisect_left(rounded, round(end, 10))
+        coefficients.append(segment[:, first:last])
+        lengths.append(h[first:last])
+        if index == 0:
+            first_moment = segment[:, first, _M]
+        if index == len(parts) - 1:
+            x = max(end - 1e-6, start)
+            at = max(bisect_right(rounded, round(x, 10)) - 1, 0)
+            last_moment = _moment(segment[:, at, :], h[at], x - starts[at])
+
+    segment = np.concatenate(coefficients, axis=1)
+    h = np.concatenate(lengths)
+    axial, moments = _segment_extremes(segment, h)
+    moment_max = np.maximum(
+        np.max(moments, axis=(1, 2)), np.abs(np.min(moments, axis=(1, 2)))
+    )
+    return np.max(axial, axis=(1, 2)), moment_max, first_moment, last_moment
+
+
+def _element_segments(element, combinations, cases, factor_matrix, cuts=()):
+    """Return segment starts, lengths and ``(combos, segments, 7)`` actions.
+
+    Segment boundaries are the union of every case's load positions and
+    ``cuts``, so one set of segments serves all combinations.
+    """
+
+    plane = _plane_element(element)
+    L = plane.L()
+    loads = [plane._local_loads({case: 1.0}) for case in cases]
+    breaks = {
+        round(x, 10): x
+        for x in _break_positions(
+            L,
+            [load for distributed, _ in loads for load in distributed],
+            [load for _, points in loads for load in points],
+        )
+    }
+    for x in cuts:
+        if 0.0 < round(x, 10) < round(L, 10):
+            breaks.setdefault(round(x, 10), x)
+    positions = [breaks[key] for key in sorted(breaks)]
+    starts = positions[:-1]
+    h = np.diff(positions)
+    unit = np.array([
+        [_load_actions(x, x_end, distributed, points)
+         for x, x_end in zip(positions, positions[1:])]
+        for distributed, points in loads
+    ]).reshape(len(cases), len(starts), 7)
+    fer = np.array(
+        [plane.case_fer(case) for case in cases]
+    ).reshape(len(cases), 6)
+
+    displacements = np.array([
+        [
+            getattr(node, key)[combo]
+            for node in (element.i_node, element.j_node)
+            for key in ("DX", "DY", "RZ")
+        ]
+        for combo in combinations
+    ]).reshape(len(combinations), 6)
+    local = displacements @ plane._rotation().T
+    forces = local @ plane.k().T + factor_matrix @ fer
+
+    segment = np.tensordot(factor_matrix, unit, axes=1)
+    segment[..., _N] += forces[:, [0]]
+    segment[..., _V] += forces[:, [1]]
+    segment[..., _M] += forces[:, [2]] - forces[:, [1]] * np.asarray(starts)
+    return starts, h, segment
+
+
+def _plane_element(element) -> PlaneElement:
+    if isinstance(element, PlaneElement):
+        return element
+    plane = PlaneElement(
+        element.name,
+        element.i_node,
+        element.j_node,
+        element.material.E,
+        element.section.A,
+        element.section.Iz,
+    )
+    plane.DistLoads = [list(load[:6]) for load in element.DistLoads]
+    plane.PtLoads = [list(load[:4]) for load in element.PtLoads]
+    return plane
+
+
+def _moment(segment, h, xi):
+    return (
+        segment[..., _M] - segment[..., _V] * xi - segment[..., _WA] * xi ** 2 / 2
+        - (segment[..., _WB] - segment[..., _WA]) * xi ** 3 / (6 * h)
+    )
+
+
+def _axial(segment, h, xi):
+    return (
+        segment[..., _N] + segment[..., _PA] * xi
+        + (segment[..., _PB] - segment[..., _PA]) * xi ** 2 / (2 * h)
+    )
+
+
+def _stationary_points(a, b, c, h):
+    """Return ``(..., 4)`` candidates: the ends and roots of ``a x^2 + b x + c``.
+
+    Roots outside ``[0, h]`` are replaced by the segment start.
+    """
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        root = np.sqrt(b * b - 4 * a * c)
+        quadratic = np.abs(a) > 0.0
+        first = np.where(
+            quadratic, (-b + root) / (2 * a),
+            np.where(np.abs(b) > 0.0, -c / b, np.nan),
+        )
+        second = np.where(quadratic, (-b - root) / (2 * a), np.nan)
+    candidates = np.stack(
+        np.broadcast_arrays(np.zeros_like(first), h, first, second), axis=-1
+    )
+    inside = (candidates >= 0.0) & (candidates <= h[..., None])
+    return np.where(inside, candidates, 0.0)
+
+
+def _segment_extremes(segment, h):
+    """Return axial and moment values at every stationary candidate."""
+
+    axial_points = _stationary_points(
+        0.0, (segment[..., _PB] - segment[..., _PA]) / h, segment[..., _PA], h
+    )
+    moment_points = _stationary_points(
+        (segment[..., _WB] - segment[..., _WA]) / (2 * h),
+        segment[..., _WA],
+        segment[..., _V],
+        h,
+    )
+    return (
+        _axial(segment[..., None, :], h[:, None], axial_points),
+        _moment(segment[..., None, :], h[:, None], moment_points),
+    )
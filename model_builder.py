@@ -0,0 +1,95 @@
+"""Generate a complete portal-frame analysis input in memory.
+
+The file-based generators (``user_input.update_json_file``, ``wind_out`` and
+the ``add_*_loads`` steps) each read the whole input file and write it back
+with indentation. :class:`ModelBuilder` runs the same steps on one dict and
+returns it with its :class:`frame_model.PortalFrame`; the file is written
+once, only when a caller needs it (the snapshot input hash and the section
+search workers read ``input_data.json``).
+
+Values are normalised to the types the file would reload as, so an
+in-memory model and one read back from the written file are identical.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Mapping
+
+import numpy as np
+
+from frame_model import PortalFrame, portal_frame_from_dict
+from user_input import (
+    apply_dead_loads,
+    apply_live_loads,
+    apply_wind_member_loads,
+    generate_input_data,
+)
+from wind_loads import add_wind_zones
+
+
+def _json_value(value: Any) -> Any:
+    """Return ``value`` with the types ``json.load`` would give it."""
+
+    if isinstance(value, dict):
+        return {str(key): _json_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_value(item) for item in value]
+    if isinstance(value, (bool, str)) or value is None:
+        return value
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return float(value)
+    if isinstance(value, np.ndarray):
+        return _json_value(value.tolist())
+    return value
+
+
+class ModelBuilder:
+    """Build the analysis input of one building in a single pass.
+
+    ``base`` is an existing input dict whose entries are kept unless the
+    generator replaces them, as ``update_json_file`` keeps the entries of an
+    existing file.
+    """
+
+    def __init__(
+        self,
+        building_data: Mapping[str, Any],
+        wind_data: Mapping[str, Any],
+        base: Mapping[str, Any] | None = None,
+    ):
+        self.building_data = dict(building_data)
+        self.wind_data = dict(wind_data)
+        self.base = dict(base or {})
+        self._data: dict[str, Any] | None = None
+
+    def build(self) -> dict[str, Any]:
+        """Return the input dict with wind zones and all member loads."""
+
+        if self._data is None:
+            data = _json_value(generate_input_data(
+                self.building_data, self.wind_data, dict(self.base)
+            ))
+            add_wind_zones(data)
+            data = _json_value(data)
+            apply_wind_member_loads(data)
+            apply_live_loads(data)
+            apply_dead_loads(data)
+            self._data = _json_value(data)
+        return self._data
+
+    def portal_frame(self) -> PortalFrame:
+        """Return the :class:`PortalFrame` of the built input."""
+
+        return portal_frame_from_dict(self.build())
+
+    def write(self, path) -> Path:
+        """Write the built input to ``path`` as ``update_json_file`` does."""
+
+        path = Path(path)
+        with open(path, "w") as handle:
+            json.dump(self.build(), handle, indent=2)
+        return path
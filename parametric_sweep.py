@@ -0,0 +1,442 @@
+"""Parametric building sweeps over span, eaves height and frame spacing.
+
+One base ``building_data``/``wind_data`` pair is varied over the Cartesian
+product of the requested parameter values and every variant is designed with
+the complete :func:`run_full_analysis.run_analysis` workflow. Variants run in
+a process pool whose workers load the section catalogue once; each variant
+runs its section search in the worker process, and all of them share the
+persistent section-trial cache. The sweep writes one compact results table
+(steel mass, governing utilisation and deflections) as CSV and JSON and keeps
+the full analysis snapshot only for the selected variants.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import csv
+import itertools
+import json
+import math
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Sequence
+
+import member_database as mdb
+from analysis_snapshot import load_analysis_snapshot
+from portal_frame_analysis import num_cores
+from preview_geometry import build_preview_geometry
+from run_full_analysis import run_analysis
+
+
+MAX_SWEEP_VARIANTS = 200
+DEFAULT_SWEEP_ROOT = Path("output/sweeps")
+
+# Short parameter names accepted by the API and CLI, in building_data keys.
+PARAMETER_ALIASES = {
+    "span": "gable_width",
+    "eaves_height": "eaves_height",
+    "frame_spacing": "rafter_spacing",
+}
+
+RESULT_COLUMNS = (
+    "variant",
+    "status",
+    "rafter_section",
+    "column_section",
+    "frame_mass_kg",
+    "total_steel_mass_kg",
+    "steel_mass_kg_per_m2",
+    "governing_utilisation",
+    "governing_member",
+    "governing_check",
+    "governing_combination",
+    "max_vertical_deflection_mm",
+    "vertical_deflection_ratio",
+    "max_horizontal_deflection_mm",
+    "horizontal_deflection_ratio",
+    "elapsed_s",
+    "error",
+)
+
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def parse_values(text: str) -> list[float]:
+    """Parse ``"14000,16000"`` or an inclusive ``"14000:20000:2000"`` range."""
+
+    text = str(text).strip()
+    if ":" in text:
+        parts = [float(part) for part in text.split(":")]
+        if len(parts) != 3 or parts[2] <= 0.0 or parts[1] < parts[0]:
+            raise ValueError(
+                f"Range {text!r} must be START:STOP:STEP with STOP >= START "
+                "and a positive STEP."
+            )
+        start, stop, step = parts
+        count = int(math.floor((stop - start) / step + 1e-9)) + 1
+        return [start + index * step for index in range(count)]
+    return [float(part) for part in text.split(",") if part.strip()]
+
+
+def normalise_parameters(
+    parameters: Mapping[str, Iterable[Any]],
+) -> dict[str, list[float]]:
+    """Return ``{building_data key: values}`` from short or full names."""
+
+    if not isinstance(parameters, Mapping) or not parameters:
+        raise ValueError("parameters must be a non-empty object of value lists.")
+    normalised: dict[str, list[float]] = {}
+    for name, values in parameters.items():
+        key = PARAMETER_ALIASES.get(str(name), str(name))
+        if key not in PARAMETER_ALIASES.values():
+            raise ValueError(
+                f"Unsupported sweep parameter {name!r}. Choose from "
+                f"{', '.join(PARAMETER_ALIASES)}."
+            )
+        if isinstance(values, str):
+            values = parse_values(values)
+        values = [float(value) for value in values]
+        if not values or any(
+            not math.isfinite(value) or value <= 0.0 for value in values
+        ):
+            raise ValueError(f"{name} values must be positive numbers.")
+        normalised[key] = list(dict.fromkeys(values))
+    return normalised
+
+
+def variant_building_data(
+    base: Mapping[str, Any], values: Mapping[str, float]
+) -> dict[str, Any]:
+    """Return ``base`` with ``values`` applied at the base roof pitch.
+
+    Span and eaves height changes keep the roof pitch, so the apex height is
+    recalculated from the new eaves height and roof run.
+    """
+
+    building = dict(base)
+    building.update(values)
+    roof_type = str(building.get("building_roof", "Duo Pitched"))
+    divisor = 2.0 if roof_type == "Duo Pitched" else 1.0
+    pitch = building.get("roof_pitch")
+    if pitch is None:
+        pitch = math.degrees(math.atan(
+            (float(base["apex_height"]) - float(base["eaves_height"]))
+            / (float(base["gable_width"]) / divisor)
+        ))
+    building["roof_pitch"] = float(pitch)
+    building["apex_height"] = float(building["eaves_height"]) + math.tan(
+        math.radians(float(pitch))
+    ) * float(building["gable_width"]) / divisor
+    return building
+
+
+def sweep_variants(
+    building_data: Mapping[str, Any],
+    parameters: Mapping[str, Iterable[Any]],
+) -> list[dict[str, Any]]:
+    """Return the validated variants as ``{variant, values, building_data}``."""
+
+    parameters = normalise_parameters(parameters)
+    keys = list(parameters)
+    combinations = list(itertools.product(*(parameters[key] for key in keys)))
+    if len(combinations) > MAX_SWEEP_VARIANTS:
+        raise ValueError(
+            f"The sweep has {len(combinations)} variants; the limit is "
+            f"{MAX_SWEEP_VARIANTS}."
+        )
+    width = max(3, len(str(len(combinations))))
+    variants = []
+    for index, combination in enumerate(combinations, 1):
+        values = dict(zip(keys, combination))
+        building = variant_building_data(building_data, values)
+        name = f"v{index:0{width}d}"
+        try:
+            build_preview_geometry({"building_data": building})
+        except ValueError as exc:
+            raise ValueError(f"Variant {name} ({values}): {exc}") from exc
+        variants.append(
+            {"variant": name, "values": values, "building_data": building}
+        )
+    return variants
+
+
+def _init_sweep_worker() -> None:
+    """Load the section catalogue once in each sweep process."""
+
+    _WORKER_STATE["member_db"] = mdb.load_member_database()
+
+
+def _run_variant(task) -> dict[str, Any]:
+    """Pool entry point: design one variant and summarise its snapshot."""
+
+    variant, wind_data, project, directory = task
+    if "member_db" not in _WORKER_STATE:
+        _init_sweep_worker()
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    row: dict[str, Any] = {
+        "variant": variant["variant"],
+        **variant["values"],
+        "status": "FAILED",
+    }
+    start = time.perf_counter()
+    try:
+        with open(directory / "analysis.log", "w", encoding="utf-8") as log, \
+                contextlib.redirect_stdout(log):
+            snapshot_path = run_analysis(
+                variant["building_data"],
+                wind_data,
+                input_path=directory / "input_data.json",
+                snapshot_path=directory / "analysis_results.json",
+                render=False,
+                project_metadata=project,
+                workers=1,
+                member_db=_WORKER_STATE["member_db"],
+            )
+        if snapshot_path is None:
+            row.update(
+                status="NO SECTION",
+                error="No acceptable portal-frame section pair was found.",
+            )
+        else:
+            row.update(summary_row(load_analysis_snapshot(snapshot_path)))
+            row["snapshot_path"] = str(snapshot_path)
+    except Exception as exc:
+        row["error"] = f"{type(exc).__name__}: {exc}"
+    row["elapsed_s"] = round(time.perf_counter() - start, 2)
+    return row
+
+
+def summary_row(snapshot: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the compact sweep results of one analysis snapshot."""
+
+    results = snapshot["results"]
+    summary = results["frame_summary"]
+    project = results.get("project", {})
+    building = snapshot["input_data"]["frame_data"][0]
+    total_mass = float(
+        summary.get("steel_mass_breakdown", {}).get(
+            "total_steel_mass_kg", summary["estimated_frame_steel_mass_kg"]
+        )
+    )
+    floor_area_m2 = (
+        float(building["gable_width"]) * float(building["building_length"])
+        / 1e6
+    )
+    return {
+        "status": summary.get("overall_status", ""),
+        "rafter_section": project.get("rafter_section", ""),
+        "column_section": project.get("column_section", ""),
+        "frame_mass_kg": round(summary["estimated_frame_steel_mass_kg"], 1),
+        "total_steel_mass_kg": round(total_mass, 1),
+        "steel_mass_kg_per_m2": round(total_mass / floor_area_m2, 2),
+        "governing_utilisation": round(summary["governing_utilisation"], 3),
+        "governing_member": summary.get("governing_member", ""),
+        "governing_check": summary.get("governing_check", ""),
+        "governing_combination": summary.get("governing_combination", ""),
+        "max_vertical_deflection_mm": round(
+            summary["max_vertical_deflection_mm"], 2
+        ),
+        "vertical_deflection_ratio": summary.get("vertical_deflection_ratio"),
+        "max_horizontal_deflection_mm": round(
+            summary["max_horizontal_deflection_mm"], 2
+        ),
+        "horizontal_deflection_ratio": summary.get(
+            "horizontal_deflection_ratio"
+        ),
+    }
+
+
+def _selected_variants(
+    rows: Sequence[Mapping[str, Any]], keep_snapshots: str | Iterable[str]
+) -> set[str]:
+    if isinstance(keep_snapshots, str):
+        if keep_snapshots == "all":
+            return {row["variant"] for row in rows}
+        if keep_snapshots == "none":
+            return set()
+        if keep_snapshots == "best":
+            passing = [
+                row for row in rows
+                if row.get("status") == "PASS"
+                and row.get("total_steel_mass_kg") is not None
+            ]
+            best = min(
+                passing,
+                key=lambda row: row["steel_mass_kg_per_m2"],
+                default=None,
+            )
+            return {best["variant"]} if best else set()
+        keep_snapshots = [keep_snapshots]
+    return {str(name) for name in keep_snapshots}
+
+
+def write_sweep_results(
+    rows: Sequence[Mapping[str, Any]],
+    output_dir: str | Path,
+    parameters: Mapping[str, Sequence[float]],
+) -> tuple[Path, Path]:
+    """Write the sweep table as ``sweep_results.csv`` and ``.json``."""
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    columns = [
+        "variant", *parameters,
+        *(column for column in RESULT_COLUMNS if column != "variant"),
+        "snapshot_path",
+    ]
+    csv_path = output_dir / "sweep_results.csv"
+    with open(csv_path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({column: row.get(column, "") for column in columns})
+    json_path = output_dir / "sweep_results.json"
+    json_path.write_text(
+        json.dumps(
+            {"parameters": dict(parameters), "variants": list(rows)},
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    return csv_path, json_path
+
+
+def run_sweep(
+    building_data: Mapping[str, Any],
+    wind_data: Mapping[str, Any],
+    parameters: Mapping[str, Iterable[Any]],
+    *,
+    output_dir: str | Path = DEFAULT_SWEEP_ROOT,
+    project_metadata: Mapping[str, Any] | None = None,
+    keep_snapshots: str | Iterable[str] = "best",
+    workers: int | None = None,
+) -> dict[str, Any]:
+    """Design every parameter variant and write the sweep results table.
+
+    ``parameters`` maps ``span``, ``eaves_height`` and ``frame_spacing`` (or
+    their ``building_data`` keys) to value lists in millimetres, or to
+    ``"START:STOP:STEP"`` strings. ``keep_snapshots`` is ``"best"`` (the
+    passing variant with the least steel per floor area), ``"all"``,
+    ``"none"`` or a list of variant names; other variant folders are removed
+    once the table is written. ``workers`` defaults to the section-search
+    process count.
+    """
+
+    output_dir = Path(output_dir)
+    normalised = normalise_parameters(parameters)
+    variants = sweep_variants(building_data, normalised)
+    wind_data = dict(wind_data)
+    project = dict(project_metadata or {})
+    tasks = [
+        (variant, wind_data, project, str(output_dir / variant["variant"]))
+        for variant in variants
+    ]
+    workers = max(1, min(int(workers or num_cores), len(tasks)))
+    print(
+        f"Sweeping {len(tasks)} variant(s) of "
+        f"{', '.join(normalised)} using {workers} worker(s)..."
+    )
+    rows = []
+
+    def report(row):
+        rows.append(row)
+        print(
+            f"   {row['variant']}: {row['status']} "
+            f"{row.get('rafter_section', '')}/{row.get('column_section', '')} "
+            f"{row.get('total_steel_mass_kg', '')} kg ({row['elapsed_s']} s)"
+        )
+
+    if workers == 1:
+        _init_sweep_worker()
+        for task in tasks:
+            report(_run_variant(task))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_sweep_worker
+        ) as pool:
+            for future in as_completed(
+                pool.submit(_run_variant, task) for task in tasks
+            ):
+                report(future.result())
+    order = {variant["variant"]: index for index, variant in enumerate(variants)}
+    rows.sort(key=lambda row: order[row["variant"]])
+
+    kept = _selected_variants(rows, keep_snapshots)
+    for row in rows:
+        if row["variant"] in kept:
+            continue
+        row.pop("snapshot_path", None)
+        shutil.rmtree(output_dir / row["variant"], ignore_errors=True)
+    csv_path, json_path = write_sweep_results(rows, output_dir, normalised)
+    print(f"Sweep results written to {csv_path.resolve()}")
+    return {
+        "parameters": normalised,
+        "variants": rows,
+        "kept_snapshots": sorted(kept & {row["variant"] for row in rows}),
+        "csv_path": str(csv_path),
+        "json_path": str(json_path),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description=(
+            "Design one building at several spans, eaves heights and frame "
+            "spacings. PAYLOAD is an analysis request JSON with project, "
+            "building_data and wind_data."
+        )
+    )
+    parser.add_argument("payload")
+    parser.add_argument(
+        "--span", help="Spans in mm: 14000,16000 or 14000:20000:2000"
+    )
+    parser.add_argument("--eaves-height", help="Eaves heights in mm")
+    parser.add_argument("--frame-spacing", help="Frame spacings in mm")
+    parser.add_argument("--output", default=str(DEFAULT_SWEEP_ROOT))
+    parser.add_argument(
+        "--keep", nargs="+", default=["best"],
+        help="best, all, none or variant names whose snapshots are kept",
+    )
+    parser.add_argument("--workers", type=int)
+    arguments = parser.parse_args()
+
+    sweep_parameters = {
+        name: parse_values(value)
+        for name, value in (
+            ("span", arguments.span),
+            ("eaves_height", arguments.eaves_height),
+            ("frame_spacing", arguments.frame_spacing),
+        )
+        if value
+    }
+    request = json.loads(Path(arguments.payload).read_text(encoding="utf-8"))
+    result = run_sweep(
+        request["building_data"],
+        request["wind_data"],
+        sweep_parameters,
+        output_dir=arguments.output,
+        project_metadata=request.get("project"),
+        keep_snapshots=(
+            arguments.keep[0] if len(arguments.keep) == 1
+            and arguments.keep[0] in {"best", "all", "none"}
+            else arguments.keep
+        ),
+        workers=arguments.workers,
+    )
+    from tabulate import tabulate
+
+    columns = ["variant", *result["parameters"], "status", "rafter_section",
+               "column_section", "total_steel_mass_kg", "steel_mass_kg_per_m2",
+               "governing_utilisation", "max_vertical_deflection_mm",
+               "max_horizontal_deflection_mm"]
+    print(tabulate(
+        [[row.get(column, "") for column in columns]
+         for row in result["variants"]],
+        headers=columns,
+        tablefmt="pretty",
+    ))
@@ -0,0 +1,1036 @@
+"""Two-dimensional direct-stiffness engine for portal-frame trials.
+
+Portal frames are planar, so every node needs only DX, DY and RZ. The
+engine assembles the 3-DOF-per-node stiffness matrix, renumbers it with
+reverse Cuthill-McKee and solves every requested load combination with one
+banded Cholesky factorisation. Members are discretised at intermediate
+nodes exactly as PyNite does, and each sub-element takes its own section,
+which is how the tapered ``HaunchProfile`` segments are represented.
+
+Results are stored the way PyNite stores them: nodal displacement and
+reaction dictionaries keyed by combination, plus a 6-DOF-per-node ``_D``
+vector, so load superposition and result bundles work unchanged. Members
+expose the subset of the PyNite member API used by the portal checks,
+serviceability deflections and the analysis visualisation: ``L``, ``T``,
+``axial``, ``shear``, ``moment``, ``deflection`` and the axial, shear and
+moment extremes. PyNite's local axes and sign conventions are reproduced.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
+from typing import Any, Callable, Iterable, Mapping
+
+import numpy as np
+from scipy.linalg import LinAlgError, cho_solve_banded, cholesky_banded
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+
+_DISPLACEMENT_KEYS = ("DX", "DY", "DZ", "RX", "RY", "RZ")
+_REACTION_KEYS = ("RxnFX", "RxnFY", "RxnFZ", "RxnMX", "RxnMY", "RxnMZ")
+# Plane DOF order within a node and its position in PyNite's 6-DOF layout.
+_PLANE_DOFS = ("DX", "DY", "RZ")
+_PYNITE_OFFSETS = (0, 1, 5)
+_PLANE_REACTIONS = ("RxnFX", "RxnFY", "RxnMZ")
+_OUT_OF_PLANE_LOADS = ("FZ", "Fz", "MX", "MY", "Mx", "My")
+
+
+def _close(a: float, b: float) -> bool:
+    # PyNite compares load and segment positions at ten decimal places.
+    return round(a, 10) == round(b, 10)
+
+
+class PlaneLoadCombo:
+    """Named load-case factors, mirroring ``Pynite.LoadCombo``."""
+
+    def __init__(
+        self,
+        name: str,
+        factors: Mapping[str, float],
+        combo_tags: Iterable[str] | None = None,
+    ):
+        self.name = name
+        self.factors = dict(factors)
+        self.combo_tags = list(combo_tags or [])
+
+
+class PlaneNode:
+    """A frame node with PyNite-style result dictionaries."""
+
+    def __init__(self, name: str, X: float, Y: float, Z: float = 0.0):
+        self.name = name
+        self.X = float(X)
+        self.Y = float(Y)
+        self.Z = float(Z)
+        self.ID = None
+        self.support_DX = False
+        self.support_DY = False
+        self.support_RZ = False
+        self.springs: dict[str, float] = {}
+        self.NodeLoads: list[tuple[str, float, str]] = []
+        for key in _DISPLACEMENT_KEYS + _REACTION_KEYS:
+            setattr(self, key, {})
+
+
+class _Segment:
+    """A load-continuous length of one element for one combination."""
+
+    __slots__ = (
+        "x1", "h", "N", "V", "M", "theta", "v", "u", "pa", "pb", "wa", "wb",
+    )
+
+    def axial(self, xi: float) -> float:
+        return self.N + self.pa * xi + (self.pb - self.pa) * xi ** 2 / (2 * self.h)
+
+    def shear(self, xi: float) -> float:
+        return self.V + self.wa * xi + (self.wb - self.wa) * xi ** 2 / (2 * self.h)
+
+    def moment(self, xi: float) -> float:
+        return (
+            self.M - self.V * xi - self.wa * xi ** 2 / 2
+            - (self.wb - self.wa) * xi ** 3 / (6 * self.h)
+        )
+
+    def slope(self, xi: float, EI: float) -> float:
+        return self.theta - (
+            self.M * xi - self.V * xi ** 2 / 2 - self.wa * xi ** 3 / 6
+            - (self.wb - self.wa) * xi ** 4 / (24 * self.h)
+        ) / EI
+
+    def deflection(self, xi: float, EI: float) -> float:
+        return self.v + self.theta * xi - (
+            self.M * xi ** 2 / 2 - self.V * xi ** 3 / 6 - self.wa * xi ** 4 / 24
+            - (self.wb - self.wa) * xi ** 5 / (120 * self.h)
+        ) / EI
+
+    def axial_deflection(self, xi: float, EA: float) -> float:
+        return self.u - (
+            self.N * xi + self.pa * xi ** 2 / 2
+            + (self.pb - self.pa) * xi ** 3 / (6 * self.h)
+        ) / EA
+
+    def stationary_points(self, a: float, b: float, c: float) -> list[float]:
+        """Return ``[0, h]`` and the roots of ``a xi^2 + b xi + c`` inside."""
+
+        points = [0.0, self.h]
+        if abs(a) > 0.0:
+            discriminant = b * b - 4 * a * c
+            if discriminant >= 0.0:
+                root = math.sqrt(discriminant)
+                points += [(-b + root) / (2 * a), (-b - root) / (2 * a)]
+        elif abs(b) > 0.0:
+            points.append(-c / b)
+        return [xi for xi in points if 0.0 <= xi <= self.h]
+
+
+def _break_positions(L: float, distributed, points) -> list[float]:
+    """Return the sorted segment boundaries of local loads on length ``L``."""
+
+    breaks = {0.0: 0.0, round(L, 10): L}
+    for _, _, _, x1, x2 in distributed:
+        breaks.setdefault(round(x1, 10), x1)
+        breaks.setdefault(round(x2, 10), x2)
+    for _, _, x in points:
+        breaks.setdefault(round(x, 10), x)
+    return [breaks[key] for key in sorted(breaks) if 0.0 <= key <= round(L, 10)]
+
+
+def _load_actions(x: float, x_end: float, distributed, points) -> tuple:
+    """Return the load-only actions of the segment from ``x`` to ``x_end``.
+
+    The result is ``(N, V, M, pa, pb, wa, wb)``: axial force, shear and
+    moment at ``x`` from every load before it (the i-end forces excluded)
+    and the axial and transverse load intensities at both segment ends.
+    Loads are local ``(distributed, points)`` as from
+    ``PlaneElement._local_loads``; the result is linear in the loads.
+    """
+
+    N = V = M = 0.0
+    pa = pb = wa = wb = 0.0
+    for kind, P, xp in points:
+        if round(xp, 10) <= round(x, 10):
+            if kind == "x":
+                N += P
+            elif kind == "y":
+                V += P
+                M -= P * (x - xp)
+            else:
+                M += P
+    for kind, w1, w2, x1, x2 in distributed:
+        if round(x1, 10) > round(x, 10):
+            continue
+        slope = (w2 - w1) / (x2 - x1)
+        if round(x2, 10) > round(x, 10):
+            start = w1 + slope * (x - x1)
+            end = w1 + slope * (x_end - x1)
+            if kind == "x":
+                pa += start
+                pb += end
+            else:
+                wa += start
+                wb += end
+            w_end, x_stop = start, x
+        else:
+            w_end, x_stop = w2, x2
+        force = (w1 + w_end) / 2 * (x_stop - x1)
+        if kind == "x":
+            N += force
+        else:
+            V += force
+            M -= (x_stop - x1) * (
+                w1 * (3 * x - 2 * x1 - x_stop)
+                + w_end * (3 * x - x1 - 2 * x_stop)
+            ) / 6
+    return N, V, M, pa, pb, wa, wb
+
+
+def _orientation(i_node: PlaneNode, j_node: PlaneNode):
+    """Return ``(L, c, s, sign)``: PyNite's local y is ``sign * (-s, c)``."""
+
+    dx = j_node.X - i_node.X
+    dy = j_node.Y - i_node.Y
+    length = math.hypot(dx, dy)
+    vertical = math.isclose(i_node.X, j_node.X) and math.isclose(
+        i_node.Z, j_node.Z
+    )
+    sign = 1.0 if vertical or dx > 0.0 else -1.0
+    return length, dx / length, dy / length, sign
+
+
+class PlaneElement:
+    """One prismatic sub-element between two consecutive member nodes."""
+
+    def __init__(
+        self,
+        name: str,
+        i_node: PlaneNode,
+        j_node: PlaneNode,
+        E: float,
+        A: float,
+        Iz: float,
+        properties: Mapping[str, Any] | None = None,
+    ):
+        self.name = name
+        self.i_node = i_node
+        self.j_node = j_node
+        self.E = float(E)
+        self.A = float(A)
+        self.Iz = float(Iz)
+        if properties is not None:
+            self.portal_properties = dict(properties)
+        self.DistLoads: list[list] = []
+        self.PtLoads: list[list] = []
+        self.active: dict[str, bool] = {}
+        self.model: PlaneFrame | None = None
+        self._length, self._c, self._s, self._sign = _orientation(
+            i_node, j_node
+        )
+        self._case_fer: dict[str, np.ndarray] = {}
+        self._segments: dict[str, list[_Segment]] = {}
+
+    # --- geometry and stiffness -------------------------------------------
+    def L(self) -> float:
+        return self._length
+
+    def T(self) -> np.ndarray:
+        """Return PyNite's 12x12 transformation matrix for this element."""
+
+        return _transformation(self._c, self._s, self._sign)
+
+    def _rotation(self) -> np.ndarray:
+        c, s, sign = self._c, self._s, self._sign
+        rotation = np.zeros((6, 6))
+        block = np.array([
+            [c, s, 0.0],
+            [-sign * s, sign * c, 0.0],
+            [0.0, 0.0, sign],
+        ])
+        rotation[:3, :3] = block
+        rotation[3:, 3:] = block
+        return rotation
+
+    def k(self) -> np.ndarray:
+        """Return the 6x6 local stiffness matrix (u, v, theta at i and j)."""
+
+        L, EA, EI = self._length, self.E * self.A, self.E * self.Iz
+        axial = EA / L
+        a, b, c, d = 12 * EI / L ** 3, 6 * EI / L ** 2, 4 * EI / L, 2 * EI / L
+        return np.array([
+            [axial, 0.0, 0.0, -axial, 0.0, 0.0],
+            [0.0, a, b, 0.0, -a, b],
+            [0.0, b, c, 0.0, -b, d],
+            [-axial, 0.0, 0.0, axial, 0.0, 0.0],
+            [0.0, -a, -b, 0.0, a, -b],
+            [0.0, b, d, 0.0, -b, c],
+        ])
+
+    # --- loads ----------------------------------------------------------------
+    def _local_loads(self, factors: Mapping[str, float]):
+        """Return factored local ``(distributed, point)`` loads.
+
+        Distributed loads are ``(kind, w1, w2, x1, x2)`` with ``kind`` ``x``
+        (axial) or ``y`` (transverse). Point loads are ``(kind, P, x)`` with
+        ``kind`` ``x``, ``y`` or ``m``. Global loads act per unit member
+        length and are resolved onto the local axes as in PyNite.
+        """
+
+        c, s, sign = self._c, self._s, self._sign
+        distributed, points = [], []
+        for direction, w1, w2, x1, x2, case, *_ in self.DistLoads:
+            factor = factors.get(case)
+            if not factor or x2 - x1 <= 0.0:
+                continue
+            w1, w2 = factor * w1, factor * w2
+            if direction == "Fx":
+                distributed.append(("x", w1, w2, x1, x2))
+            elif direction == "Fy":
+                distributed.append(("y", w1, w2, x1, x2))
+            elif direction in ("FX", "FY"):
+                along, across = (
+                    (c, -sign * s) if direction == "FX" else (s, sign * c)
+                )
+                distributed.append(("x", along * w1, along * w2, x1, x2))
+                distributed.append(("y", across * w1, across * w2, x1, x2))
+            elif w1 or w2:
+                raise ValueError(
+                    f"Out-of-plane load '{direction}' on {self.name} is not "
+                    "supported by the plane-frame engine."
+                )
+        for direction, P, x, case in self.PtLoads:
+            factor = factors.get(case)
+            if not factor:
+                continue
+            P = factor * P
+            if direction == "Fx":
+                points.append(("x", P, x))
+            elif direction == "Fy":
+                points.append(("y", P, x))
+            elif direction == "Mz":
+                points.append(("m", P, x))
+            elif direction == "MZ":
+                points.append(("m", sign * P, x))
+            elif direction in ("FX", "FY"):
+                along, across = (
+                    (c, -sign * s) if direction == "FX" else (s, sign * c)
+                )
+                points.append(("x", along * P, x))
+                points.append(("y", across * P, x))
+            elif P:
+                raise ValueError(
+                    f"Out-of-plane load '{direction}' on {self.name} is not "
+                    "supported by the plane-frame engine."
+                )
+        return distributed, points
+
+    def _march(self, ends, distributed, points) -> list[_Segment]:
+        """Build the load-continuous segments from the i-end state.
+
+        ``ends`` is ``(f0, f1, f5, u_i, v_i, theta_i)``: the local i-end
+        forces and displacements. Axial force, shear and moment at each
+        segment start follow from equilibrium with every load before it;
+        slope and deflections are carried from the previous segment.
+        """
+
+        f0, f1, f5, u_i, v_i, theta_i = ends
+        L = self._length
+        EI, EA = self.E * self.Iz, self.E * self.A
+        positions = _break_positions(L, distributed, points)
+        segments = []
+        for x, x_end in zip(positions, positions[1:]):
+            segment = _Segment()
+            segment.x1 = x
+            segment.h = x_end - x
+            N, V, M, pa, pb, wa, wb = _load_actions(
+                x, x_end, distributed, points
+            )
+            N += f0
+            V += f1
+            M += f5 - f1 * x
+            segment.N, segment.V, segment.M = N, V, M
+            segment.pa, segment.pb, segment.wa, segment.wb = pa, pb, wa, wb
+            if segments:
+                previous = segments[-1]
+                segment.theta = previous.slope(previous.h, EI)
+                segment.v = previous.deflection(previous.h, EI)
+                segment.u = previous.axial_deflection(previous.h, EA)
+            else:
+                segment.theta, segment.v, segment.u = theta_i, v_i, u_i
+            segments.append(segment)
+        return segments
+
+    def _fer(self, distributed, points) -> np.ndarray:
+        """Return local fixed-end reactions ``(f0, f1, f5, f6, f7, f11)``."""
+
+        L = self._length
+        EI, EA = self.E * self.Iz, self.E * self.A
+        free = self._march((0.0, 0.0, 0.0, 0.0, 0.0, 0.0), distributed, points)
+        last = free[-1]
+        # End displacements of the load-only solution from a zero i-end state;
+        # the i-end forces restore u_j = v_j = theta_j = 0.
+        u_L = last.axial_deflection(last.h, EA)
+        theta_L = last.slope(last.h, EI)
+        v_L = last.deflection(last.h, EI)
+        f0 = EA * u_L / L
+        a = EI * theta_L
+        b = EI * v_L
+        f1 = 12 * (b - a * L / 2) / L ** 3
+        f5 = a / L + f1 * L / 2
+        return self._end_forces((f0, f1, f5), distributed, points)
+
+    def _end_forces(self, i_forces, distributed, points) -> np.ndarray:
+        f0, f1, f5 = i_forces
+        last = self._march(
+            (f0, f1, f5, 0.0, 0.0, 0.0), distributed, points
+        )[-1]
+        return np.array([
+            f0, f1, f5,
+            -last.axial(last.h), -last.shear(last.h), -last.moment(last.h),
+        ])
+
+    def case_fer(self, case: str) -> np.ndarray:
+        """Return the local fixed-end reactions of one unit-factor load case."""
+
+        if case not in self._case_fer:
+            distributed, points = self._local_loads({case: 1.0})
+            self._case_fer[case] = (
+                self._fer(distributed, points)
+                if distributed or points
+                else np.zeros(6)
+            )
+        return self._case_fer[case]
+
+    # --- results -------------------------------------------------------------
+    def d(self, combo_name: str) -> np.ndarray:
+        """Return the local end displacements ``(u, v, theta)`` at i and j."""
+
+        values = np.array([
+            getattr(node, key)[combo_name]
+            for node in (self.i_node, self.j_node)
+            for key in _PLANE_DOFS
+        ])
+        return self._rotation() @ values
+
+    def f(self, combo_name: str) -> np.ndarray:
+        """Return the local end forces ``(f0, f1, f5, f6, f7, f11)``."""
+
+        factors = self.model.load_combos[combo_name].factors
+        fer = np.zeros(6)
+        for case, factor in factors.items():
+            fer += factor * self.case_fer(case)
+        return self.k() @ self.d(combo_name) + fer
+
+    def segments(self, combo_name: str) -> list[_Segment]:
+        if combo_name not in self._segments:
+            d = self.d(combo_name)
+            f = self.f(combo_name)
+            distributed, points = self._local_loads(
+                self.model.load_combos[combo_name].factors
+            )
+            self._segments[combo_name] = self._march(
+                (f[0], f[1], f[2], d[0], d[1], d[2]), distributed, points
+            )
+        return self._segments[combo_name]
+
+    def _locate(self, x: float, combo_name: str) -> tuple[_Segment, float]:
+        segments = self.segments(combo_name)
+        starts = [round(segment.x1, 10) for segment in segments]
+        index = max(bisect_right(starts, round(x, 10)) - 1, 0)
+        segment = segments[index]
+        return segment, x - segment.x1
+
+    def axial(self, x: float, combo_name: str = "Combo 1") -> float:
+        segment, xi = self._locate(x, combo_name)
+        return segment.axial(xi)
+
+    def shear(self, Direction: str, x: float, combo_name: str = "Combo 1") -> float:
+        if Direction != "Fy":
+            return 0.0
+        segment, xi = self._locate(x, combo_name)
+        return segment.shear(xi)
+
+    def moment(self, Direction: str, x: float, combo_name: str = "Combo 1") -> float:
+        if Direction != "Mz":
+            return 0.0
+        segment, xi = self._locate(x, combo_name)
+        return segment.moment(xi)
+
+    def deflection(self, Direction: str, x: float, combo_name: str = "Combo 1") -> float:
+        segment, xi = self._locate(x, combo_name)
+        if Direction == "dx":
+            return segment.axial_deflection(xi, self.E * self.A)
+        if Direction == "dy":
+            return segment.deflection(xi, self.E * self.Iz)
+        return 0.0
+
+    def _extremes(self, quantity: str, combo_name: str) -> list[float]:
+        values = []
+        for segment in self.segments(combo_name):
+            if quantity == "axial":
+                slope = (segment.pb - segment.pa) / segment.h
+                candidates = segment.stationary_points(0.0, slope, segment.pa)
+                values += [segment.axial(xi) for xi in candidates]
+            elif quantity == "shear":
+                slope = (segment.wb - segment.wa) / segment.h
+                candidates = segment.stationary_points(0.0, slope, segment.wa)
+                values += [segment.shear(xi) for xi in candidates]
+            else:
+                candidates = segment.stationary_points(
+                    (segment.wb - segment.wa) / (2 * segment.h),
+                    segment.wa,
+                    segment.V,
+                )
+                values += [segment.moment(xi) for xi in candidates]
+        return values
+
+    def max_axial(self, combo_name: str = "Combo 1") -> float:
+        return max(self._extremes("axial", combo_name))
+
+    def min_axial(self, combo_name: str = "Combo 1") -> float:
+        return min(self._extremes("axial", combo_name))
+
+    def max_shear(self, Direction: str, combo_name: str = "Combo 1") -> float:
+        return max(self._extremes("shear", combo_name)) if Direction == "Fy" else 0.0
+
+    def min_shear(self, Direction: str, combo_name: str = "Combo 1") -> float:
+        return min(self._extremes("shear", combo_name)) if Direction == "Fy" else 0.0
+
+    def max_moment(self, Direction: str, combo_name: str = "Combo 1") -> float:
+        return max(self._extremes("moment", combo_name)) if Direction == "Mz" else 0.0
+
+    def min_moment(self, Direction: str, combo_name: str = "Combo 1") -> float:
+        return min(self._extremes("moment", combo_name)) if Direction == "Mz" else 0.0
+
+
+def _transformation(c: float, s: float, sign: float) -> np.ndarray:
+    directions = np.array([
+        [c, s, 0.0],
+        [-sign * s, sign * c, 0.0],
+        [0.0, 0.0, sign],
+    ])
+    transform = np.zeros((12, 12))
+    for index in range(4):
+        transform[3 * index:3 * index + 3, 3 * index:3 * index + 3] = directions
+    return transform
+
+
+class PlaneMember:
+    """A physical member: consecutive sub-elements between its end nodes."""
+
+    def __init__(
+        self,
+        name: str,
+        i_node: PlaneNode,
+        j_node: PlaneNode,
+        E: float,
+        A: float,
+        Iz: float,
+        section_selector: Callable[[float, float], Mapping[str, Any] | None]
+        | None = None,
+    ):
+        self.name = name
+        self.i_node = i_node
+        self.j_node = j_node
+        self.E = float(E)
+        self.A = float(A)
+        self.Iz = float(Iz)
+        self.section_selector = section_selector
+        self.DistLoads: list[list] = []
+        self.PtLoads: list[list] = []
+        self.sub_members: dict[str, PlaneElement] = {}
+        self.active: dict[str, bool] = {}
+        self._length, self._c, self._s, self._sign = _orientation(
+            i_node, j_node
+        )
+
+    def L(self) -> float:
+        return self._length
+
+    def T(self) -> np.ndarray:
+        return _transformation(self._c, self._s, self._sign)
+
+    def descritize(self, nodes: Iterable[PlaneNode]) -> None:
+        """Split the member at intermediate nodes as ``PhysMember`` does.
+
+        Each sub-element takes the section returned by ``section_selector``
+        for its midpoint, or the member section when it returns ``None``.
+        """
+
+        Xi, Yi, Zi = self.i_node.X, self.i_node.Y, self.i_node.Z
+        Xj, Yj, Zj = self.j_node.X, self.j_node.Y, self.j_node.Z
+        L = math.sqrt((Xj - Xi) ** 2 + (Yj - Yi) ** 2 + (Zj - Zi) ** 2)
+        u = ((Xj - Xi) / L, (Yj - Yi) / L, (Zj - Zi) / L)
+        tol = 1e-12 * (1.0 + L)
+        stations = [(self.i_node, 0.0), (self.j_node, L)]
+        for node in nodes:
+            if node is self.i_node or node is self.j_node:
+                continue
+            dx, dy, dz = node.X - Xi, node.Y - Yi, node.Z - Zi
+            t = dx * u[0] + dy * u[1] + dz * u[2]
+            if t <= 0.0 or t >= L:
+                continue
+            perpendicular = math.sqrt(
+                (dx - t * u[0]) ** 2 + (dy - t * u[1]) ** 2
+                + (dz - t * u[2]) ** 2
+            )
+            if perpendicular <= tol:
+                stations.append((node, t))
+        stations.sort(key=lambda station: station[1])
+
+        self.sub_members = {}
+        for index, ((i_node, xi), (j_node, xj)) in enumerate(
+            zip(stations, stations[1:])
+        ):
+            properties = None
+            if self.section_selector is not None:
+                properties = self.section_selector(
+                    (i_node.X + j_node.X) / 2, (i_node.Y + j_node.Y) / 2
+                )
+            if properties is None:
+                element = PlaneElement(
+                    self.name + chr(index + 97), i_node, j_node,
+                    self.E, self.A, self.Iz,
+                )
+            else:
+                element = PlaneElement(
+                    self.name + chr(index + 97), i_node, j_node, self.E,
+                    float(properties["A"]) * 1e3,
+                    float(properties["Ix"]) * 1e6,
+                    properties,
+                )
+            for direction, w1, w2, x1_load, x2_load, case, *_ in self.DistLoads:
+                if not (x1_load <= xj and x2_load > xi):
+                    continue
+
+                def w(x, w1=w1, w2=w2, x1_load=x1_load, x2_load=x2_load):
+                    return (w2 - w1) / (x2_load - x1_load) * (x - x1_load) + w1
+
+                if x1_load > xi:
+                    x1 = x1_load - xi
+                else:
+                    x1, w1 = 0.0, w(xi)
+                if x2_load < xj:
+                    x2 = x2_load - xi
+                else:
+                    x2, w2 = xj - xi, w(xj)
+                element.DistLoads.append([direction, w1, w2, x1, x2, case])
+            for direction, P, x, case in self.PtLoads:
+                if (xi <= x < xj) or (
+                    math.isclose(x, xj) and math.isclose(xj, L)
+                ):
+                    element.PtLoads.append([direction, P, x - xi, case])
+            self.sub_members[element.name] = element
+
+    def find_member(self, x: float) -> tuple[PlaneElement, float]:
+        total = 0.0
+        elements = list(self.sub_members.values())
+        for index, element in enumerate(elements):
+            total += element.L()
+            if x < total or (
+                math.isclose(x, total) and index == len(elements) - 1
+            ):
+                return element, x - (total - element.L())
+        raise ValueError(f"Location x={x} does not lie on this member")
+
+    def axial(self, x: float, combo_name: str = "Combo 1") -> float:
+        element, x_mod = self.find_member(x)
+        return element.axial(x_mod, combo_name)
+
+    def shear(self, Direction: str, x: float, combo_name: str = "Combo 1") -> float:
+        element, x_mod = self.find_member(x)
+        return element.shear(Direction, x_mod, combo_name)
+
+    def moment(self, Direction: str, x: float, combo_name: str = "Combo 1") -> float:
+        element, x_mod = self.find_member(x)
+        return element.moment(Direction, x_mod, combo_name)
+
+    def deflection(self, Direction: str, x: float, combo_name: str = "Combo 1") -> float:
+        element, x_mod = self.find_member(x)
+        return element.deflection(Direction, x_mod, combo_name)
+
+    def max_axial(self, combo_name: str = "Combo 1") -> float:
+        return max(e.max_axial(combo_name) for e in self.sub_members.values())
+
+    def min_axial(self, combo_name: str = "Combo 1") -> float:
+        return min(e.min_axial(combo_name) for e in self.sub_members.values())
+
+    def max_shear(self, Direction: str, combo_name: str = "Combo 1") -> float:
+        return max(
+            e.max_shear(Direction, combo_name) for e in self.sub_members.values()
+        )
+
+    def min_shear(self, Direction: str, combo_name: str = "Combo 1") -> float:
+        return min(
+            e.min_shear(Direction, combo_name) for e in self.sub_members.values()
+        )
+
+    def max_moment(self, Direction: str, combo_name: str = "Combo 1") -> float:
+        return max(
+            e.max_moment(Direction, combo_name) for e in self.sub_members.values()
+        )
+
+    def min_moment(self, Direction: str, combo_name: str = "Combo 1") -> float:
+        return min(
+            e.min_moment(Direction, combo_name) for e in self.sub_members.values()
+        )
+
+
+class PlaneFrame:
+    """Plane frame with a PyNite-compatible model and results interface."""
+
+    def __init__(self):
+        self.nodes: dict[str, PlaneNode] = {}
+        self.members: dict[str, PlaneMember] = {}
+        self.load_combos: dict[str, PlaneLoadCombo] = {}
+        self.springs: dict[str, Any] = {}
+        self._D: dict[str, np.ndarray] = {}
+        self.solution = None
+        self._prepared = False
+
+    # --- model definition -----------------------------------------------------
+    def add_node(self, name: str, X: float, Y: float, Z: float = 0.0) -> None:
+        self.nodes[name] = PlaneNode(name, X, Y, Z)
+        self._prepared = False
+
+    def def_support(
+        self,
+        node_name: str,
+        support_DX: bool = False,
+        support_DY: bool = False,
+        support_RZ: bool = False,
+    ) -> None:
+        node = self.nodes[node_name]
+        node.support_DX = bool(support_DX)
+        node.support_DY = bool(support_DY)
+        node.support_RZ = bool(support_RZ)
+
+    def def_support_spring(self, node_name: str, dof: str, stiffness: float) -> None:
+        if dof not in _PLANE_DOFS:
+            raise ValueError(
+                f"Spring DOF must be one of {_PLANE_DOFS}; got {dof!r}."
+            )
+        self.nodes[node_name].springs[dof] = float(stiffness)
+
+    def add_member(
+        self,
+        name: str,
+        i_node: str,
+        j_node: str,
+        E: float,
+        A: float,
+        Iz: float,
+        section_selector: Callable[[float, float], Mapping[str, Any] | None]
+        | None = None,
+    ) -> None:
+        self.members[name] = PlaneMember(
+            name, self.nodes[i_node], self.nodes[j_node], E, A, Iz,
+            section_selector,
+        )
+        self._prepared = False
+
+    def add_node_load(
+        self, node_name: str, direction: str, P: float, case: str = "Case 1"
+    ) -> None:
+        self.nodes[node_name].NodeLoads.append((direction, float(P), case))
+
+    def add_member_dist_load(
+        self,
+        member_name: str,
+        direction: str,
+        w1: float,
+        w2: float,
+        x1: float | None = None,
+        x2: float | None = None,
+        case: str = "Case 1",
+    ) -> None:
+        member = self.members[member_name]
+        member.DistLoads.append([
+            direction, float(w1), float(w2),
+            0.0 if x1 is None else float(x1),
+            member.L() if x2 is None else float(x2),
+            case,
+        ])
+        self._prepared = False
+
+    def add_member_pt_load(
+        self,
+        member_name: str,
+        direction: str,
+        P: float,
+        x: float,
+        case: str = "Case 1",
+    ) -> None:
+        self.members[member_name].PtLoads.append(
+            [direction, float(P), float(x), case]
+        )
+        self._prepared = False
+
+    def add_load_combo(
+        self,
+        name: str,
+        factors: Mapping[str, float],
+        combo_tags: Iterable[str] | None = None,
+    ) -> None:
+        self.load_combos[name] = PlaneLoadCombo(name, factors, combo_tags)
+
+    @classmethod
+    def from_pynite(cls, model: Any) -> "PlaneFrame":
+        """Return the plane equivalent of a loaded PyNite portal model.
+
+        Nodes, supports, rotational and translational support springs, nodal
+        loads, member loads and load combinations are copied. Tapered rafters
+        keep their property selector, so haunch sub-elements receive the same
+        composite sections as in PyNite, and their haunch design spans.
+        """
+
+        plane = cls()
+        for name, node in model.nodes.items():
+            plane.add_node(name, node.X, node.Y, node.Z)
+            plane.def_support(
+                name, node.support_DX, node.support_DY, node.support_RZ
+            )
+            for dof in _PLANE_DOFS:
+                stiffness, direction, active = getattr(node, f"spring_{dof}")
+                if stiffness is None or not active:
+                    continue
+                if direction is not None:
+                    raise ValueError(
+                        f"One-way spring at node {name} is not supported by "
+                        "the plane-frame engine."
+                    )
+                plane.def_support_spring(name, dof, stiffness)
+            for direction, P, case in node.NodeLoads:
+                plane.add_node_load(name, direction, P, case)
+        for name, physical in model.members.items():
+            if any(physical.Releases) or physical.rotation:
+                raise ValueError(
+                    f"Member {name} uses end releases or a rotation, which "
+                    "the plane-frame engine does not support."
+                )
+            plane.add_member(
+                name,
+                physical.i_node.name,
+                physical.j_node.name,
+                physical.material.E,
+                physical.section.A,
+                physical.section.Iz,
+                getattr(physical, "_property_selector", None),
+            )
+            member = plane.members[name]
+            member.DistLoads = [list(load[:6]) for load in physical.DistLoads]
+            member.PtLoads = [list(load[:4]) for load in physical.PtLoads]
+            if hasattr(physical, "design_spans"):
+                member.design_spans = list(physical.design_spans)
+        for name, combo in model.load_combos.items():
+            plane.add_load_combo(name, combo.factors, combo.combo_tags)
+        return plane
+
+    # --- analysis ---------------------------------------------------------------
+    def _prepare(self) -> None:
+        if self._prepared:
+            return
+        for index, node in enumerate(self.nodes.values()):
+            node.ID = index
+        nodes = list(self.nodes.values())
+        for member in self.members.values():
+            member.descritize(nodes)
+            for element in member.sub_members.values():
+                element.model = self
+        self._prepared = True
+
+    def _elements(self):
+        for member in self.members.values():
+            yield from member.sub_members.values()
+
+    def analyze(
+        self,
+        check_statics: bool = False,
+        combo_tags: Iterable[str] | None = None,
+        log: bool = False,
+    ) -> None:
+        """Solve the selected load combinations with one factorisation.
+
+        ``combo_tags`` selects combinations as PyNite does; ``None`` solves
+        every combination. ``check_statics`` and ``log`` are accepted for
+        PyNite compatibility and ignored.
+        """
+
+        self._prepare()
+        if combo_tags is None:
+            combos = list(self.load_combos.values())
+        else:
+            tags = list(combo_tags)
+            combos = [
+                combo for combo in self.load_combos.values()
+                if any(tag in combo.combo_tags for tag in tags)
+            ]
+        if not combos:
+            return
+
+        n_dof = 3 * len(self.nodes)
+        cases = sorted({case for combo in combos for case in combo.factors})
+        case_index = {case: index for index, case in enumerate(cases)}
+        factors = np.zeros((len(cases), len(combos)))
+        for column, combo in enumerate(combos):
+            for case, factor in combo.factors.items():
+                factors[case_index[case], column] += factor
+
+        # Member stiffness and the equivalent loads of every case.
+        rows, cols, values = [], [], []
+        equivalent = np.zeros((n_dof, len(cases)))
+        for element in self._elements():
+            element._segments.clear()
+            rotation = element._rotation()
+            dofs = np.array([
+                3 * node.ID + offset
+                for node in (element.i_node, element.j_node)
+                for offset in range(3)
+            ])
+            stiffness = rotation.T @ element.k() @ rotation
+            rows.append(np.repeat(dofs, 6))
+            cols.append(np.tile(dofs, 6))
+            values.append(stiffness.ravel())
+            for case in cases:
+                fer = element.case_fer(case)
+                if fer.any():
+                    equivalent[dofs, case_index[case]] -= rotation.T @ fer
+        member_stiffness = coo_matrix(
+            (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(n_dof, n_dof),
+        ).tocsr()
+        nodal = np.zeros((n_dof, len(cases)))
+        springs = np.zeros(n_dof)
+        supported = np.zeros(n_dof, dtype=bool)
+        for node in self.nodes.values():
+            for offset, dof in enumerate(_PLANE_DOFS):
+                supported[3 * node.ID + offset] = getattr(node, f"support_{dof}")
+                springs[3 * node.ID + offset] = node.springs.get(dof, 0.0)
+            for direction, P, case in node.NodeLoads:
+                if case not in case_index:
+                    continue
+                if direction in ("FX", "FY", "MZ"):
+                    offset = ("FX", "FY", "MZ").index(direction)
+                    nodal[3 * node.ID + offset, case_index[case]] += P
+                elif P:
+                    raise ValueError(
+                        f"Out-of-plane nodal load '{direction}' at "
+                        f"{node.name} is not supported by the plane-frame "
+                        "engine."
+                    )
+
+        free = np.flatnonzero(~supported)
+        stiffness = member_stiffness + coo_matrix(
+            (springs, (np.arange(n_dof), np.arange(n_dof))), shape=(n_dof, n_dof)
+        ).tocsr()
+        load = (nodal + equivalent) @ factors
+        displacement = np.zeros((n_dof, len(combos)))
+        if free.size:
+            displacement[free] = _solve_banded(
+                stiffness[free][:, free], load[free]
+            )
+        if not np.isfinite(displacement).all():
+            raise ValueError(
+                "Plane-frame stiffness matrix is singular: the structure is "
+                "unstable."
+            )
+
+        reaction = member_stiffness @ displacement - (
+            (nodal + equivalent) @ factors
+        )
+        reaction[~supported] = 0.0
+        reaction -= springs[:, None] * displacement
+
+        for column, combo in enumerate(combos):
+            name = combo.name
+            vector = np.zeros((len(self.nodes) * 6, 1))
+            for node in self.nodes.values():
+                base = 3 * node.ID
+                for key in _DISPLACEMENT_KEYS + _REACTION_KEYS:
+                    getattr(node, key)[name] = 0.0
+                for offset, key in enumerate(_PLANE_DOFS):
+                    value = float(displacement[base + offset, column])
+                    getattr(node, key)[name] = value
+                    vector[6 * node.ID + _PYNITE_OFFSETS[offset], 0] = value
+                for offset, key in enumerate(_PLANE_REACTIONS):
+                    getattr(node, key)[name] = float(
+                        reaction[base + offset, column]
+                    )
+            self._D[name] = vector
+            for member in self.members.values():
+                member.active[name] = True
+                for element in member.sub_members.values():
+                    element.active[name] = True
+        self.solution = "Linear"
+
+
+def _solve_banded(matrix, rhs: np.ndarray) -> np.ndarray:
+    """Solve a symmetric positive-definite system by banded Cholesky.
+
+    Reverse Cuthill-McKee keeps the band narrow even where haunch nodes are
+    numbered after the main frame nodes.
+    """
+
+    order = reverse_cuthill_mckee(matrix.tocsr(), symmetric_mode=True)
+    permuted = matrix[order][:, order].tocoo()
+    upper = permuted.col >= permuted.row
+    row, col, data = (
+        permuted.row[upper], permuted.col[upper], permuted.data[upper]
+    )
+    bandwidth = int((col - row).max(initial=0))
+    banded = np.zeros((bandwidth + 1, matrix.shape[0]))
+    np.add.at(banded, (bandwidth + row - col, col), data)
+    try:
+        factor = cholesky_banded(banded)
+    except LinAlgError as exc:
+        raise ValueError(
+            "Plane-frame stiffness matrix is singular: the structure is "
+            "unstable."
+        ) from exc
+    solution = np.empty_like(rhs)
+    solution[order] = cho_solve_banded((factor, False), rhs[order])
+    return solution
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    import member_database as mdb
+    from portal_frame_analysis import import_data, plane_frame_regression_check
+
+    parser = argparse.ArgumentParser(
+        description=(
+            "Cross-validate the plane-frame engine against PyNite for one or "
+            "more portal input files."
+        )
+    )
+    parser.add_argument("inputs", nargs="+", help="input_data.json files")
+    parser.add_argument("--rafter", required=True)
+    parser.add_argument("--column", required=True)
+    parser.add_argument("--tolerance", type=float, default=1e-6)
+    arguments = parser.parse_args()
+
+    member_db = mdb.load_member_database()
+    status = 0
+    for input_path in arguments.inputs:
+        frame_data = import_data(input_path)
+        settings = frame_data.frame_data[0]
+        comparison = plane_frame_regression_check(
+            mdb.member_properties(
+                settings.get("rafter_section_type", "I-Sections"),
+                arguments.rafter,
+                member_db,
+            ),
+            mdb.member_properties(
+                settings.get("column_section_type", "I-Sections"),
+                arguments.column,
+                member_db,
+            ),
+            frame_data,
+            tolerance=arguments.tolerance,
+        )
+        print(json.dumps({"input": input_path, **comparison["summary"]}, indent=2))
+        if comparison["summary"]["status"] != "PASS":
+            status = 1
+    raise SystemExit(status)
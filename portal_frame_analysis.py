@@ -1,28 +1,33 @@
+import atexit
+import hashlib
 import math
+import threading
 import time
+import uuid
 import multiprocessing
 import warnings
-from dataclasses import replace
-from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from collections import Counter, deque
+from dataclasses import dataclass, replace
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from scipy.sparse.linalg import MatrixRankWarning
 from Pynite import FEModel3D
 from Pynite.Visualization import Renderer
 from tabulate import tabulate
 import member_database as mdb
-from strength_checks import (
-    member_class_check,
-    element_properties,
-    member_design,
-)
+from strength_checks import member_design, member_design_grid
 from frame_model import (
     PortalFrame,
     foundation_characteristic_combinations,
     load_portal_frame,
 )
 from haunch_design import (
+    HAUNCH_STIFFNESS_ERROR,
     HaunchProfile,
     TaperedPhysMember,
     composite_haunch_properties,
+    haunch_discretisation_report,
     haunch_extra_mass_kg,
 )
 from haunch_geometry import (
@@ -30,10 +35,51 @@ from haunch_geometry import (
     governing_requested_haunch_cut_depth_mm,
     haunch_cut_depth_check,
     haunch_cut_error,
+    haunch_depth_follows_rafter,
     resolve_haunch_cut_depths,
 )
+from candidate_pruning import DominanceFrontier, warm_start_pairs
+from combination_pruning import (
+    SERVICEABILITY,
+    STRENGTH,
+    CombinationReduction,
+    keep_combinations,
+    reduce_combinations,
+    serviceability_responses,
+    strength_responses,
+)
+from member_actions import member_action_table
+from trial_cache import TrialCache, search_digest
+from portal_prescreen import (
+    DEFAULT_PRESCREEN_MARGIN,
+    SERVICEABILITY as PRESCREEN_SERVICEABILITY,
+    STRENGTH as PRESCREEN_STRENGTH,
+    PortalPrescreen,
+)
+from search_profile import (
+    SOURCE_CACHE,
+    SOURCE_DOMINANCE,
+    SOURCE_FE,
+    SOURCE_PRESCREEN,
+    SearchProfile,
+    profile_summary,
+    timed,
+    trial_timing,
+)
+from plane_frame import PlaneFrame
+from load_superposition import (
+    SOLVE_STATISTICS,
+    FactorisationCache,
+    analyze_by_superposition,
+    compare_combination_results,
+    factorised_linear_analysis,
+    restore_result_bundle,
+    result_bundle,
+    solve_primary_cases,
+    superpose_combinations,
+)
 from serviceability_deflection import (
-    add_permanent_baseline_combinations,
+    permanent_baseline_combinations,
     serviceability_deflection_rows,
     uses_permanent_deflection_baseline,
 )
@@ -42,6 +88,14 @@ from serviceability_deflection import (
 # number of PyNite worker processes.
 num_cores = min(12, multiprocessing.cpu_count())
 
+# ``direct`` analyses every combination in PyNite. ``superposition`` solves
+# each primary load case once, from one factorised stiffness matrix, and
+# factors the stored results. ``plane`` does the same with ``PlaneFrame``.
+SOLVER_DIRECT = "direct"
+SOLVER_SUPERPOSITION = "superposition"
+SOLVER_PLANE = "plane"
+SOLVERS = (SOLVER_DIRECT, SOLVER_SUPERPOSITION, SOLVER_PLANE)
+
 
 def _is_instability_error(exc: Exception) -> bool:
     msg = str(exc).lower()
@@ -116,166 +170,218 @@ def _vertical_deflection_limit_applies(
     return not (ignored and combination_name == "1.1 DL + 1.0 LL")
 
 
-def build_model(r_mem, c_mem, data: PortalFrame):
-    """
-    Builds and returns the FE model based on the imported JSON data.
-    """
-    requested_cut = governing_requested_haunch_cut_depth_mm(data.frame_data[0])
-    if requested_cut > 0.0:
-        cut_check = haunch_cut_depth_check(r_mem, requested_cut)
-        if not cut_check.is_valid:
-            raise ValueError(
-                haunch_cut_error(str(r_mem["Designation"]), cut_check)
-            )
-
-    # Create a new model
-    frame = FEModel3D()
-
-    # Add Sections to Frame
-    try:
-        frame.add_section(r_mem["Designation"], r_mem["A"] * 1e3, r_mem["Iy"] * 1e6, r_mem["Ix"] * 1e6, r_mem["J"] * 1e3)
-    except (NameError, AttributeError):
-        pass
-
-    try:
-        frame.add_section(c_mem["Designation"], c_mem["A"] * 1e3, c_mem["Iy"] * 1e6, c_mem["Ix"] * 1e6, c_mem["J"] * 1e3)
-    except (NameError, AttributeError):
-        pass
+# Prepared models, one per haunch layout, of the template most recently used
+# in this process.
+_PROCESS_TEMPLATE = {}
 
 
-    # Define materials
-    for name, props in data.materials.items():
-        frame.add_material(name, props['E'], props['G'], props['nu'], props['rho'])
+class PortalFrameTemplate:
+    """Candidate-independent portal model shared by every section trial.
 
-    # Define nodes
-    for name, node in data.nodes.items():
-        frame.add_node(name, node.x, node.y, node.z)
+    Nodes, haunch discretisation nodes, supports, springs, members and the
+    applied load vectors depend only on the frame input and the haunch
+    sub-member counts, so they are assembled once per count layout. Node
+    order, and therefore PyNite's DOF numbering, is identical for every
+    candidate with the same layout; adaptive haunch discretisation gives
+    rafters of similar depth ratio the same layout. Each trial only swaps
+    the rafter and column sections, the self-weight loads and the haunch
+    steel increment. The live PyNite model is process-local: worker
+    processes receive only the template description and keep one prepared
+    model for the template and layout they are currently evaluating.
+    """
 
-    haunch_profile = HaunchProfile(data.frame_data[0])
-    if haunch_profile.enabled:
-        existing = [
-            (float(node.X), float(node.Y)) for node in frame.nodes.values()
+    def __init__(self, data: PortalFrame):
+        self.data = data
+        self.haunch_enabled = HaunchProfile(data.frame_data[0]).enabled
+        self._layouts = {}
+        self._design_intervals = None
+        self.key = uuid.uuid4().hex
+
+    def segment_counts(self, r_mem, data: PortalFrame | None = None):
+        """Return the haunch sub-member count of each zone for ``r_mem``.
+
+        ``data`` must have its cut depths resolved for ``r_mem``.
+        """
+
+        if not self.haunch_enabled:
+            return {}
+        return HaunchProfile(
+            (data or self.data).frame_data[0]
+        ).segment_counts(r_mem)
+
+    def node_coordinates(self, segment_counts=None):
+        """Return ``(name, x, y, z)`` of every node for a count layout."""
+
+        layout = tuple(sorted((segment_counts or {}).items()))
+        if layout in self._layouts:
+            return self._layouts[layout]
+        data = self.data
+        coordinates = [
+            (name, node.x, node.y, node.z) for name, node in data.nodes.items()
         ]
-        for index, (x_value, y_value) in enumerate(
-            haunch_profile.discretisation_points(), 1
+        if self.haunch_enabled:
+            existing = [(x, y) for _, x, y, _ in coordinates]
+            names = {name for name, *_ in coordinates}
+            for index, (x_value, y_value) in enumerate(
+                HaunchProfile(data.frame_data[0]).discretisation_points(
+                    segment_counts
+                ),
+                1,
+            ):
+                x_value, y_value = _project_haunch_point_to_rafter(
+                    x_value, y_value, data
+                )
+                if any(
+                    math.hypot(x_value - x, y_value - y) <= 1e-4
+                    for x, y in existing
+                ):
+                    continue
+                name = f"HN{index}"
+                while name in names:
+                    name += "A"
+                coordinates.append((name, x_value, y_value, 0.0))
+                names.add(name)
+                existing.append((x_value, y_value))
+        self._layouts[layout] = coordinates
+        return coordinates
+
+    @staticmethod
+    def _property_selector(r_mem, data: PortalFrame):
+        haunch_profile = HaunchProfile(data.frame_data[0])
+
+        def select_properties(x_value, y_value):
+            added_depth = haunch_profile.added_depth_at(x_value, y_value)
+            if added_depth <= 1e-6:
+                return None
+            return composite_haunch_properties(r_mem, added_depth)
+
+        return select_properties
+
+    def _create(self, r_mem, c_mem, select_properties, segment_counts=None):
+        """Return a loaded PyNite model without self-weight or haunch steel."""
+
+        data = self.data
+        frame = FEModel3D()
+        for section in (r_mem, c_mem):
+            _add_catalogue_section(frame, section)
+
+        for name, props in data.materials.items():
+            frame.add_material(
+                name, props['E'], props['G'], props['nu'], props['rho']
+            )
+
+        for name, x_value, y_value, z_value in self.node_coordinates(
+            segment_counts
         ):
-            x_value, y_value = _project_haunch_point_to_rafter(
-                x_value, y_value, data
+            frame.add_node(name, x_value, y_value, z_value)
+
+        for node, support in data.supports.items():
+            frame.def_support(
+                node,
+                support.get('DX', False),
+                support.get('DY', False),
+                support.get('DZ', False),
+                support.get('RX', False),
+                support.get('RY', False),
+                support.get('RZ', False),
             )
-            if any(
-                math.hypot(x_value - x, y_value - y) <= 1e-4
-                for x, y in existing
-            ):
-                continue
-            name = f"HN{index}"
-            while name in frame.nodes:
-                name += "A"
-            frame.add_node(name, x_value, y_value, 0.0)
-            existing.append((x_value, y_value))
-
-    # Define supports
-    for node, support in data.supports.items():
-        frame.def_support(
-            node,
-            support.get('DX', False),
-            support.get('DY', False),
-            support.get('DZ', False),
-            support.get('RX', False),
-            support.get('RY', False),
-            support.get('RZ', False),
-        )
 
-    # Define members
-    for member in data.members:
-        name = member.name
-        i_node = member.i_node
-        j_node = member.j_node
-        material = member.material
-        member_type = member.type.lower()
-
-        # Select properties based on member-type
-        if member_type == 'rafter':
-            if haunch_profile.enabled:
-                def select_properties(x_value, y_value, *, base=r_mem):
-                    added_depth = haunch_profile.added_depth_at(
-                        x_value, y_value
+        for member in data.members:
+            name = member.name
+            member_type = member.type.lower()
+            if member_type == 'rafter':
+                if self.haunch_enabled:
+                    frame.members[name] = TaperedPhysMember(
+                        frame,
+                        name,
+                        frame.nodes[member.i_node],
+                        frame.nodes[member.j_node],
+                        member.material,
+                        r_mem["Designation"],
+                        property_selector=select_properties,
                     )
-                    if added_depth <= 1e-6:
-                        return None
-                    return composite_haunch_properties(base, added_depth)
-
-                frame.members[name] = TaperedPhysMember(
-                    frame,
-                    name,
-                    frame.nodes[i_node],
-                    frame.nodes[j_node],
-                    material,
-                    r_mem["Designation"],
-                    property_selector=select_properties,
+                else:
+                    frame.add_member(
+                        name, member.i_node, member.j_node,
+                        member.material, r_mem["Designation"],
+                    )
+            elif member_type == 'column':
+                frame.add_member(
+                    name, member.i_node, member.j_node,
+                    member.material, c_mem["Designation"],
                 )
             else:
-                frame.add_member(
-                    name, i_node, j_node, material, r_mem["Designation"]
+                raise ValueError(
+                    f"Invalid member type '{member.type}' for member '{name}'"
                 )
 
-        elif member_type == 'column':
-            frame.add_member(name, i_node, j_node, material, c_mem["Designation"])
-        else:
-            raise ValueError(f"Invalid member type '{member['type']}' for member '{name}'")
-
-    # Add nodal loads
-    for node in data.nodes.values():
-        for load in node.loads:
-            frame.add_node_load(node.name, load.direction, load.magnitude, load.case)
-
-    # Add member distributed loads
-    for m in data.members:
-        for load in m.loads:
-            # PyNite visualization fails on zero-magnitude distributed loads.
-            # They are analytically irrelevant, so skip them.
-            if abs(load.w1) < 1e-12 and abs(load.w2) < 1e-12:
-                continue
-            if (
-                load.x1 is not None and load.x2 is not None
-                and load.x2 - load.x1 <= 1e-6
-            ):
-                continue
-            frame.add_member_dist_load(
-                m.name,
-                load.direction,
-                load.w1,
-                load.w2,
-                load.x1,
-                load.x2,
-                load.case,
-            )
+        for node in data.nodes.values():
+            for load in node.loads:
+                frame.add_node_load(
+                    node.name, load.direction, load.magnitude, load.case
+                )
 
-        for load in m.point_loads:
-            frame.add_member_pt_load(
-                m.name,
-                load.direction,
-                load.magnitude,
-                load.x,
-                load.case,
-            )
+        for m in data.members:
+            for load in m.loads:
+                # PyNite visualization fails on zero-magnitude distributed
+                # loads. They are analytically irrelevant, so skip them.
+                if abs(load.w1) < 1e-12 and abs(load.w2) < 1e-12:
+                    continue
+                if (
+                    load.x1 is not None and load.x2 is not None
+                    and load.x2 - load.x1 <= 1e-6
+                ):
+                    continue
+                frame.add_member_dist_load(
+                    m.name,
+                    load.direction,
+                    load.w1,
+                    load.w2,
+                    load.x1,
+                    load.x2,
+                    load.case,
+                )
 
-    # Add the steel added by the haunch. The parent rafter self-weight is still
-    # applied through PyNite below; this load is only the composite increment.
-    if haunch_profile.enabled:
-        for data_member in data.members:
-            if data_member.type.lower() != "rafter":
-                continue
-            physical = frame.members[data_member.name]
-            physical.descritize()
-            axis_x = physical.j_node.X - physical.i_node.X
-            axis_y = physical.j_node.Y - physical.i_node.Y
-            length = physical.L()
-            unit_x = axis_x / length
-            unit_y = axis_y / length
-            for sub_member in physical.sub_members.values():
-                properties = getattr(
-                    sub_member, "portal_properties", None
+            for load in m.point_loads:
+                frame.add_member_pt_load(
+                    m.name,
+                    load.direction,
+                    load.magnitude,
+                    load.x,
+                    load.case,
                 )
+
+        for spring in data.rotational_springs:
+            frame.def_support_spring(
+                spring['node'],
+                spring['direction'],
+                spring['stiffness'],
+                direction=None,
+            )
+        return frame
+
+    def _prepare(self, frame, r_mem, c_mem, select_properties):
+        """Assign candidate sections and section-dependent dead load."""
+
+        sections = {
+            'rafter': _add_catalogue_section(frame, r_mem),
+            'column': _add_catalogue_section(frame, c_mem),
+        }
+        for member in self.data.members:
+            physical = frame.members[member.name]
+            physical.section = sections[member.type.lower()]
+            if isinstance(physical, TaperedPhysMember):
+                physical._property_selector = select_properties
+
+        # Add the steel added by the haunch. The parent rafter self-weight is
+        # applied below; this load is only the composite increment.
+        for name, spans in self.design_intervals().items():
+            physical = frame.members[name]
+            density = float(physical.material.rho)
+            physical.design_spans = []
+            for x1, x2, midpoint_x, midpoint_y in spans:
+                properties = select_properties(midpoint_x, midpoint_y)
+                physical.design_spans.append((x1, x2, properties))
                 if not properties:
                     continue
                 extra_area = float(
@@ -283,38 +389,229 @@ def build_model(r_mem, c_mem, data: PortalFrame):
                 )
                 if extra_area <= 1e-9:
                     continue
-                x1 = (
-                    (sub_member.i_node.X - physical.i_node.X) * unit_x
-                    + (sub_member.i_node.Y - physical.i_node.Y) * unit_y
-                )
-                x2 = (
-                    (sub_member.j_node.X - physical.i_node.X) * unit_x
-                    + (sub_member.j_node.Y - physical.i_node.Y) * unit_y
-                )
-                density = float(physical.material.rho)
                 added_weight = -extra_area * density
                 frame.add_member_dist_load(
-                    data_member.name,
-                    "FY",
-                    added_weight,
-                    added_weight,
-                    min(x1, x2),
-                    max(x1, x2),
-                    "D",
+                    name, "FY", added_weight, added_weight, x1, x2, "D"
                 )
 
-    # Add member self-weight (optional, adjust as needed)
-    frame.add_member_self_weight('FY', -1, 'D')  # Example: Adding self-weight in FY direction
+        frame.add_member_self_weight('FY', -1, 'D')
+        return frame
+
+    def design_intervals(self):
+        """Return the haunch design spans along each rafter.
+
+        The spans are the sub-members of the fixed ``HAUNCH_SEGMENTS``
+        layout whatever the analysis discretisation, so the haunch steel
+        load and the haunch member-check stations do not depend on it. Each
+        span is ``(x1, x2, midpoint_x, midpoint_y)``: rafter-local limits and
+        the global midpoint.
+        """
+
+        if not self.haunch_enabled:
+            return {}
+        if self._design_intervals is not None:
+            return self._design_intervals
+        coordinates = {
+            name: (x_value, y_value, z_value)
+            for name, x_value, y_value, z_value in self.node_coordinates()
+        }
+        intervals = {}
+        for data_member in self.data.members:
+            if data_member.type.lower() != "rafter":
+                continue
+            Xi, Yi, Zi = coordinates[data_member.i_node]
+            Xj, Yj, Zj = coordinates[data_member.j_node]
+            length = math.sqrt((Xj - Xi) ** 2 + (Yj - Yi) ** 2 + (Zj - Zi) ** 2)
+            unit = ((Xj - Xi) / length, (Yj - Yi) / length, (Zj - Zi) / length)
+            # Nodes on the rafter are found as PyNite's descritize finds them.
+            tolerance = 1e-12 * (1.0 + length)
+            stations = [(0.0, Xi, Yi), (length, Xj, Yj)]
+            for name, (X, Y, Z) in coordinates.items():
+                if name in (data_member.i_node, data_member.j_node):
+                    continue
+                dx, dy, dz = X - Xi, Y - Yi, Z - Zi
+                t = dx * unit[0] + dy * unit[1] + dz * unit[2]
+                if t <= 0.0 or t >= length:
+                    continue
+                perpendicular = math.sqrt(
+                    (dx - t * unit[0]) ** 2 + (dy - t * unit[1]) ** 2
+                    + (dz - t * unit[2]) ** 2
+                )
+                if perpendicular <= tolerance:
+                    stations.append((t, X, Y))
+            stations.sort()
+            intervals[data_member.name] = [
+                (x1, x2, (X1 + X2) / 2, (Y1 + Y2) / 2)
+                for (x1, X1, Y1), (x2, X2, Y2) in zip(stations, stations[1:])
+            ]
+        self._design_intervals = intervals
+        return intervals
+
+    def _candidate_selector(self, r_mem, data):
+        requested_cut = governing_requested_haunch_cut_depth_mm(
+            data.frame_data[0]
+        )
+        if requested_cut > 0.0:
+            cut_check = haunch_cut_depth_check(r_mem, requested_cut)
+            if not cut_check.is_valid:
+                raise ValueError(
+                    haunch_cut_error(str(r_mem["Designation"]), cut_check)
+                )
+        return self._property_selector(r_mem, data)
+
+    def build(self, r_mem, c_mem, data: PortalFrame | None = None,
+              segment_counts=None):
+        """Return an independent PyNite model for one section pair.
+
+        ``segment_counts`` overrides the haunch sub-member counts chosen for
+        ``r_mem``, as the haunch convergence check does.
+        """
+
+        select_properties = self._candidate_selector(r_mem, data or self.data)
+        if segment_counts is None:
+            segment_counts = self.segment_counts(r_mem, data)
+        frame = self._create(r_mem, c_mem, select_properties, segment_counts)
+        return self._prepare(frame, r_mem, c_mem, select_properties)
+
+    def frame(self, r_mem, c_mem, data: PortalFrame | None = None):
+        """Return the reused process-local model prepared for one pair.
+
+        The model is overwritten by the next call; use :meth:`build` for a
+        model that must outlive the trial.
+        """
+
+        select_properties = self._candidate_selector(r_mem, data or self.data)
+        segment_counts = self.segment_counts(r_mem, data)
+        layout = tuple(sorted(segment_counts.items()))
+        if _PROCESS_TEMPLATE.get("key") != self.key:
+            _PROCESS_TEMPLATE.clear()
+            _PROCESS_TEMPLATE.update(key=self.key, layouts={})
+        prepared = _PROCESS_TEMPLATE["layouts"].get(layout)
+        if prepared is None:
+            frame = self._create(
+                r_mem, c_mem, select_properties, segment_counts
+            )
+            # Every trial on this model shares its solver structure.
+            frame._portal_factorisation = FactorisationCache()
+            prepared = _PROCESS_TEMPLATE["layouts"][layout] = {
+                "frame": frame,
+                "dist_loads": {
+                    name: list(member.DistLoads)
+                    for name, member in frame.members.items()
+                },
+            }
+        frame = prepared["frame"]
+        for name, member in frame.members.items():
+            member.DistLoads = list(prepared["dist_loads"][name])
+            member.active = {}
+        frame.load_combos = {}
+        frame._D = {}
+        frame._portal_section_properties = {}
+        for node in frame.nodes.values():
+            for key in (
+                "RxnFX", "RxnFY", "RxnFZ", "RxnMX", "RxnMY", "RxnMZ"
+            ):
+                setattr(node, key, {})
+        return self._prepare(frame, r_mem, c_mem, select_properties)
+
+
+def _add_catalogue_section(frame, section):
+    """Add a member-database section to ``frame`` once and return it."""
 
-    # Add rotational springs
-    for spring in data.rotational_springs:
-        node = spring['node']
-        direction = spring['direction']
-        stiffness = spring['stiffness']
-        frame.def_support_spring(node, direction, stiffness, direction=None)
+    name = section["Designation"]
+    if name not in frame.sections:
+        frame.add_section(
+            name,
+            section["A"] * 1e3,
+            section["Iy"] * 1e6,
+            section["Ix"] * 1e6,
+            section["J"] * 1e3,
+        )
+    return frame.sections[name]
+
+
+def build_model(r_mem, c_mem, data: PortalFrame):
+    """
+    Builds and returns the FE model based on the imported JSON data.
+    """
+    return PortalFrameTemplate(data).build(r_mem, c_mem, data)
 
 
-    return frame
+def analysis_combinations(
+    data: PortalFrame,
+    include_foundation: bool = False,
+) -> list[dict]:
+    """Return SLS, permanent-baseline, ULS and optional footing combinations."""
+
+    combinations = [
+        *serviceability_combinations(data),
+        *data.load_combinations,
+    ]
+    if include_foundation:
+        combinations.extend(
+            foundation_characteristic_combinations(data.load_combinations)
+        )
+    return combinations
+
+
+def analyze_frame(frame, combinations, solver=SOLVER_SUPERPOSITION,
+                  solve_cases=None):
+    """Analyse ``combinations`` on ``frame`` with the selected linear solver.
+
+    Trials analyse in stages. With superposition, ``solve_cases`` lists the
+    combinations whose primary load cases are solved before ``combinations``
+    are superposed; an empty list reuses the cases already solved on
+    ``frame``. The direct solver only solves the combinations of this call,
+    and PyNite discards the results of earlier calls.
+
+    The plane solver superposes primary cases solved by :class:`PlaneFrame`.
+    Given a PyNite model, it solves a plane copy and loads the results back
+    into ``frame`` so reports keep using PyNite members.
+    """
+
+    if solver not in SOLVERS:
+        raise ValueError(
+            f"Unknown portal solver {solver!r}. Choose one of {SOLVERS}."
+        )
+    if solver == SOLVER_PLANE and not isinstance(frame, PlaneFrame):
+        combinations = list(combinations)
+        plane = PlaneFrame.from_pynite(frame)
+        analyze_by_superposition(plane, combinations)
+        restore_result_bundle(frame, result_bundle(plane, combinations))
+        return
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=MatrixRankWarning)
+        if solver != SOLVER_DIRECT:
+            # PlaneFrame already solves every case with one factorisation.
+            analyze = (
+                factorised_linear_analysis
+                if solver == SOLVER_SUPERPOSITION
+                else None
+            )
+            if solve_cases is None:
+                analyze_by_superposition(frame, combinations, analyze)
+                return
+            if solve_cases:
+                solve_primary_cases(frame, solve_cases, analyze)
+            superpose_combinations(frame, combinations)
+            return
+        stage = f"__STAGE_{len(frame.load_combos)}__"
+        for combination in combinations:
+            frame.add_load_combo(
+                combination['name'], combination['factors'], [stage]
+            )
+        frame.analyze(check_statics=False, combo_tags=[stage])
+
+
+def serviceability_combinations(data: PortalFrame) -> list[dict]:
+    """Return the SLS and permanent-baseline combinations."""
+
+    return [
+        *data.serviceability_load_combinations,
+        *permanent_baseline_combinations(
+            data.serviceability_load_combinations
+        ),
+    ]
 
 
 def resolve_candidate_haunch_data(
@@ -329,17 +626,44 @@ def resolve_candidate_haunch_data(
         frame_data=[resolved_frame, *data.frame_data[1:]],
     )
 
-def analyze_combination(args):
+REJECTED_FLANGE = "flange width"
+REJECTED_UNSTABLE = "unstable"
+REJECTED_SERVICEABILITY = "serviceability"
+REJECTED_STRENGTH = "strength"
+PRESCREEN_REJECTIONS = {
+    PRESCREEN_SERVICEABILITY: REJECTED_SERVICEABILITY,
+    PRESCREEN_STRENGTH: REJECTED_STRENGTH,
+}
+
+
+@dataclass(frozen=True)
+class TrialRejection:
+    """Reason an automatic-sizing trial did not produce a passing pair."""
+
+    reason: str
+
+
+def analyze_combination(args, timings=None, strength_first=False,
+                         governing=None):
     """
     Analyse ONE rafter/column pair for all serviceability load-combinations
-    and return the lightest acceptable option, or None if it fails limits.
+    and return the lightest acceptable option, or a :class:`TrialRejection`
+    naming the first failed check. ``timings``, when given, accumulates the
+    seconds spent in each :data:`search_profile.PHASES` entry.
+
+    ``strength_first`` runs the ultimate combinations and member checks
+    before the serviceability deflection rows, so a pair expected to fail on
+    strength is rejected without the more expensive deflection stage. The
+    pass or fail result is the same in either order. ``governing`` is the
+    search's count of strength failures per ULS combination; see
+    :func:`member_design_checks`.
     """
     (r_type, r_name,
      c_type, c_name,
-     member_db, data,
+     member_db, data, template,
      v_lim, h_lim,
      r_total_m, c_total_m,
-     allow_failed_checks) = args
+     allow_failed_checks, solver) = args
 
     # --- section properties -------------------------------------------------
     r_mem = mdb.member_properties(r_type, r_name, member_db)
@@ -347,94 +671,354 @@ def analyze_combination(args):
 
     # ❶ Reject combos where the rafter flange is wider than the column flange
     if r_mem['b'] > c_mem['b'] + 3.5 and not allow_failed_checks:
-        return None
+        return TrialRejection(REJECTED_FLANGE)
 
     data = resolve_candidate_haunch_data(data, r_mem)
 
-    # --- build and analyse FE model ----------------------------------------
-    frame = build_model(r_mem, c_mem, data)
+    # --- prepare and analyse FE model --------------------------------------
+    with timed(timings, "build"):
+        frame = template.frame(r_mem, c_mem, data)
+        if solver == SOLVER_PLANE:
+            frame = PlaneFrame.from_pynite(frame)
+
+    # Serviceability and permanent-baseline combos are normally analysed
+    # first: superposition solves every primary case in the first stage and
+    # ULS combos are only built if SLS passes.
+    stages = (REJECTED_SERVICEABILITY, REJECTED_STRENGTH)
+    if strength_first and not allow_failed_checks:
+        stages = stages[::-1]
+    solve_cases = analysis_combinations(data)
+    for stage in stages:
+        try:
+            with timed(timings, "solve"):
+                analyze_frame(
+                    frame,
+                    serviceability_combinations(data)
+                    if stage == REJECTED_SERVICEABILITY
+                    else data.load_combinations,
+                    solver,
+                    solve_cases=solve_cases,
+                )
+        except Exception as exc:
+            if _is_instability_error(exc):
+                return TrialRejection(REJECTED_UNSTABLE)
+            # Data errors and broken load cases must remain visible. Treating
+            # every ValueError/RuntimeError as a failed trial section can hide
+            # unsafe input.
+            raise
+        solve_cases = []
+
+        if stage == REJECTED_STRENGTH:
+            if not allow_failed_checks:
+                with timed(timings, "member_checks"):
+                    passed = member_design_checks(
+                        frame, r_type, r_mem, c_type, c_mem, data, member_db,
+                        governing,
+                    )
+                if not passed:
+                    # automatic sizing rejects strength failures
+                    return TrialRejection(REJECTED_STRENGTH)
+            continue
 
-    # add serviceability and ultimate combos
-    for SLS_combo in data.serviceability_load_combinations:
-        frame.add_load_combo(SLS_combo['name'], SLS_combo['factors'])
-    add_permanent_baseline_combinations(
-        frame, data.serviceability_load_combinations
+        # --- deflection checks ----------------------------------------------
+        try:
+            with timed(timings, "deflections"):
+                deflection_rows = serviceability_deflection_rows(frame, data)
+        except ValueError:
+            # PyNite can complete a singular analysis with NaN results. Do not
+            # let those trials appear to have zero serviceability demand.
+            return TrialRejection(REJECTED_UNSTABLE)
+        worst_v_row = max(
+            deflection_rows,
+            key=lambda item: float(item["max_dy"]),
+            default={"max_dy": 0.0, "load_combination": ""},
+        )
+        worst_h_row = max(
+            deflection_rows,
+            key=lambda item: float(item["max_dx"]),
+            default={"max_dx": 0.0, "load_combination": ""},
+        )
+        checked_vertical = [
+            item
+            for item in deflection_rows
+            if _vertical_deflection_limit_applies(
+                data.frame_data[0], str(item["load_combination"])
+            )
+        ]
+        worst_checked_v = max(
+            (float(item["max_dy"]) for item in checked_vertical),
+            default=0.0,
+        )
+        ponding_failures = [
+            item
+            for item in deflection_rows
+            if item["roof_drainage"]["status"] != "PASS"
+        ]
+        worst_v = float(worst_v_row["max_dy"])
+        worst_v_combo = str(worst_v_row["load_combination"])
+        worst_h = float(worst_h_row["max_dx"])
+        worst_h_combo = str(worst_h_row["load_combination"])
+
+        if not allow_failed_checks:
+            if worst_checked_v > v_lim or worst_h > h_lim or ponding_failures:
+                # automatic sizing rejects serviceability failures
+                return TrialRejection(REJECTED_SERVICEABILITY)
+
+    # --- weight (kN) --------------------------------------------------------
+    weight = round(
+        r_mem['m'] * r_total_m
+        + c_mem['m'] * c_total_m
+        + haunch_extra_mass_kg(r_mem, data.frame_data[0]),
+        1,
     )
 
-    for ULS_combo in data.load_combinations:
-        frame.add_load_combo(ULS_combo['name'], ULS_combo['factors'])
+    # --- result bundle ----------------------------------------------------
+    # Footing combinations are factor sums of the solved primary cases, so
+    # the winning pair's results need no second solve in the parent process.
+    bundle = None
+    if solver != SOLVER_DIRECT:
+        with timed(timings, "solve"):
+            superpose_combinations(
+                frame,
+                foundation_characteristic_combinations(data.load_combinations),
+            )
+        bundle = result_bundle(
+            frame, analysis_combinations(data, include_foundation=True)
+        )
+
+    return (weight,          # 0  – used for min()
+            r_name,          # 1
+            c_name,          # 2
+            worst_v,         # 3
+            worst_v_combo,   # 4
+            worst_h,         # 5
+            worst_h_combo,   # 6
+            bundle)          # 7  – analysed results, or None
+
+def reference_combination_reduction(
+    data: PortalFrame,
+    template,
+    r_type,
+    r_name,
+    c_type,
+    c_name,
+    member_db,
+    solver=SOLVER_SUPERPOSITION,
+):
+    """Return the :class:`CombinationReduction` found at one section pair.
 
+    Every SLS and ULS combination is analysed once on the reference pair and
+    combinations enveloped by another are left out; see
+    :mod:`combination_pruning`. ``None`` is returned when the reference pair
+    is unstable.
+    """
+
+    r_mem = mdb.member_properties(r_type, r_name, member_db)
+    c_mem = mdb.member_properties(c_type, c_name, member_db)
+    data = resolve_candidate_haunch_data(data, r_mem)
+    frame = template.frame(r_mem, c_mem, data)
     try:
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore", category=MatrixRankWarning)
-            frame.analyze(check_statics=False)
+        analyze_frame(frame, analysis_combinations(data), solver)
     except Exception as exc:
         if _is_instability_error(exc):
             return None
-        # Data errors and broken load cases must remain visible. Treating every
-        # ValueError/RuntimeError as a failed trial section can hide unsafe input.
         raise
 
-    # --- deflection checks --------------------------------------------------
-    try:
-        deflection_rows = serviceability_deflection_rows(frame, data)
-    except ValueError:
-        # PyNite can complete a singular analysis with NaN results. Do not let
-        # those trials appear to have zero serviceability demand.
-        return None
-    worst_v_row = max(
-        deflection_rows,
-        key=lambda item: float(item["max_dy"]),
-        default={"max_dy": 0.0, "load_combination": ""},
+    serviceability = list(data.serviceability_load_combinations)
+    gated = [
+        _vertical_deflection_limit_applies(
+            data.frame_data[0], str(combination["name"])
+        )
+        for combination in serviceability
+    ]
+    kept_sls, pruned_sls = reduce_combinations(
+        SERVICEABILITY,
+        serviceability,
+        *serviceability_responses(frame, data, gated),
+        gated=gated,
+    )
+    table = member_action_table(
+        frame, r_type, r_mem, c_type, c_mem, data,
+        [str(combination["name"]) for combination in data.load_combinations],
+    )
+    kept_uls, pruned_uls = reduce_combinations(
+        STRENGTH,
+        data.load_combinations,
+        *strength_responses(
+            table, member_action_ratios(table, member_db, data.steel_grade)
+        ),
     )
-    worst_h_row = max(
-        deflection_rows,
-        key=lambda item: float(item["max_dx"]),
-        default={"max_dx": 0.0, "load_combination": ""},
+    return CombinationReduction(
+        serviceability=tuple(kept_sls),
+        strength=tuple(kept_uls),
+        pruned=tuple(pruned_sls + pruned_uls),
+        reference=(r_name, c_name),
     )
-    checked_vertical = [
-        item
-        for item in deflection_rows
-        if _vertical_deflection_limit_applies(
-            data.frame_data[0], str(item["load_combination"])
+
+
+@dataclass(frozen=True)
+class SearchContext:
+    """Picklable description of one section search for pool workers.
+
+    Workers reload the frame input from ``input_path`` once per search and
+    check it against ``input_digest``; each task then only carries the two
+    section names. ``combinations``, when set, names the SLS and ULS
+    combinations the search keeps after combination pruning. ``search_key``
+    tells two searches of the same input apart, so no worker state such as
+    the governing-combination counts carries over from one to the next.
+    """
+
+    input_path: str
+    input_digest: str
+    r_section_type: str
+    c_section_type: str
+    vert_limit: float
+    horiz_limit: float
+    r_total_m: float
+    c_total_m: float
+    allow_failed_checks: bool
+    solver: str
+    combinations: tuple[tuple[str, ...], tuple[str, ...]] | None = None
+    search_key: str = ""
+
+
+# Pairs sent to a pool worker at a time.
+SEARCH_BLOCK_SIZE = 4
+
+# Long-lived section-search workers, shared by every sls_check call in this
+# process (including the backend), and the read-only state of a pool worker.
+_ANALYSIS_POOL = None
+_ANALYSIS_POOL_WORKERS = 0
+_ANALYSIS_POOL_LOCK = threading.Lock()
+_WORKER_STATE = {}
+
+
+def _file_digest(path) -> str:
+    with open(path, "rb") as handle:
+        return hashlib.sha256(handle.read()).hexdigest()
+
+
+def _init_analysis_worker():
+    """Load the section catalogue once in each pool process."""
+
+    _WORKER_STATE.clear()
+    _WORKER_STATE["member_db"] = mdb.load_member_database()
+
+
+def _worker_search_state(context: SearchContext):
+    """Return the cached frame input and template for ``context``."""
+
+    if _WORKER_STATE.get("context") != context:
+        if "member_db" not in _WORKER_STATE:
+            _init_analysis_worker()
+        if _file_digest(context.input_path) != context.input_digest:
+            raise RuntimeError(
+                f"{context.input_path} changed while the section search "
+                "was running."
+            )
+        data = import_data(context.input_path)
+        if context.combinations is not None:
+            data = keep_combinations(data, *context.combinations)
+        _WORKER_STATE.update(
+            context=context,
+            data=data,
+            template=PortalFrameTemplate(data),
+            governing=Counter(),
         )
-    ]
-    worst_checked_v = max(
-        (float(item["max_dy"]) for item in checked_vertical),
-        default=0.0,
+    return _WORKER_STATE
+
+
+def _profiled_trial(args, strength_first=False, governing=None):
+    """Run :func:`analyze_combination` and return ``(result, timing)``."""
+
+    timings = {}
+    solves = Counter(SOLVE_STATISTICS)
+    started = time.time()
+    result = analyze_combination(args, timings, strength_first, governing)
+    return result, trial_timing(
+        timings, started, SOLVE_STATISTICS - solves
     )
-    ponding_failures = [
-        item
-        for item in deflection_rows
-        if item["roof_drainage"]["status"] != "PASS"
-    ]
-    worst_v = float(worst_v_row["max_dy"])
-    worst_v_combo = str(worst_v_row["load_combination"])
-    worst_h = float(worst_h_row["max_dx"])
-    worst_h_combo = str(worst_h_row["load_combination"])
 
-    if not allow_failed_checks:
-        if worst_checked_v > v_lim or worst_h > h_lim or ponding_failures:
-            return None   # automatic sizing rejects serviceability failures
 
-        if not member_design_checks(frame, r_type, r_mem, c_type, c_mem, data, member_db):
-            return None   # automatic sizing rejects strength failures
+def _analyze_section_block(task):
+    """Pool entry point: analyse a ``(context, pairs, pruning)`` block.
 
-    # --- weight (kN) --------------------------------------------------------
-    weight = round(
-        r_mem['m'] * r_total_m
-        + c_mem['m'] * c_total_m
-        + haunch_extra_mass_kg(r_mem, data.frame_data[0]),
-        1,
+    ``pairs`` lists ``(rafter, column, mass, strength_first)`` in dispatch
+    order. Every pair runs on the worker's prepared model, so the stiffness
+    structure and the load vectors are shared across the block. A pair
+    heavier than a pass earlier in the block, or, with ``pruning``, no
+    stiffer than a serviceability failure earlier in the block, is not
+    analysed; its entry is ``None`` and the search settles it.
+    """
+
+    context, pairs, pruning = task
+    state = _worker_search_state(context)
+    member_db = state["member_db"]
+    frontier = DominanceFrontier(
+        record_failures=not haunch_depth_follows_rafter(
+            state["data"].frame_data[0]
+        )
     )
+    lightest_pass = math.inf
+    results = []
+    for r_name, c_name, mass, strength_first in pairs:
+        stiffness = (
+            float(member_db[context.r_section_type][r_name]["Ix"]),
+            float(member_db[context.c_section_type][c_name]["Ix"]),
+        )
+        if mass >= lightest_pass or (
+            pruning
+            and frontier.dominated(*stiffness, mass, r_name, c_name)
+        ):
+            results.append(None)
+            continue
+        result, timing = _profiled_trial((
+            context.r_section_type, r_name,
+            context.c_section_type, c_name,
+            member_db, state["data"], state["template"],
+            context.vert_limit, context.horiz_limit,
+            context.r_total_m, context.c_total_m,
+            context.allow_failed_checks, context.solver,
+        ), strength_first, state["governing"])
+        if not isinstance(result, TrialRejection):
+            lightest_pass = min(lightest_pass, mass)
+        elif result.reason == REJECTED_SERVICEABILITY:
+            frontier.add_failure(*stiffness, r_name, c_name)
+        results.append((result, timing))
+    return results
+
+
+def analysis_pool(workers=num_cores) -> ProcessPoolExecutor:
+    """Return the persistent section-search pool with ``workers`` processes."""
+
+    global _ANALYSIS_POOL, _ANALYSIS_POOL_WORKERS
+    workers = max(1, int(workers))
+    with _ANALYSIS_POOL_LOCK:
+        if _ANALYSIS_POOL is not None and _ANALYSIS_POOL_WORKERS != workers:
+            _ANALYSIS_POOL.shutdown(wait=True)
+            _ANALYSIS_POOL = None
+        if _ANALYSIS_POOL is None:
+            _ANALYSIS_POOL = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_analysis_worker,
+            )
+            _ANALYSIS_POOL_WORKERS = workers
+        return _ANALYSIS_POOL
+
+
+def shutdown_analysis_pool() -> None:
+    """Stop the persistent section-search workers, if any are running."""
+
+    global _ANALYSIS_POOL, _ANALYSIS_POOL_WORKERS
+    with _ANALYSIS_POOL_LOCK:
+        if _ANALYSIS_POOL is not None:
+            _ANALYSIS_POOL.shutdown(wait=True, cancel_futures=True)
+        _ANALYSIS_POOL = None
+        _ANALYSIS_POOL_WORKERS = 0
+
+
+atexit.register(shutdown_analysis_pool)
 
-    return (weight,          # 0  – used for min()
-            r_name,          # 1
-            c_name,          # 2
-            worst_v,         # 3
-            worst_v_combo,   # 4
-            worst_h,         # 5
-            worst_h_combo)   # 6
 
 def get_member_lengths(data: PortalFrame):
     """Return total rafter and column lengths in metres."""
@@ -448,18 +1032,70 @@ def get_member_lengths(data: PortalFrame):
 
     return r_len, c_len
 
-def directional_search(primary, r_list, c_list, r_section_type, c_section_type,
-                       member_db, data: PortalFrame, r_total_m, c_total_m,
-                       vert_limit, horiz_limit, num_core,
-                       allow_failed_checks=False):
+def _trial_cache_record(result):
+    """Return the JSON-serialisable cache entry for one trial result."""
+
+    if isinstance(result, TrialRejection):
+        return {"status": result.reason}
+    weight, _, _, worst_v, worst_v_combo, worst_h, worst_h_combo, _ = result
+    return {
+        "status": "PASS",
+        "weight": weight,
+        "worst_v": worst_v,
+        "worst_v_combo": worst_v_combo,
+        "worst_h": worst_h,
+        "worst_h_combo": worst_h_combo,
+    }
+
+
+def _trial_from_cache(task, record):
+    """Rebuild an ``analyze_combination`` result from a cache entry."""
+
+    if record["status"] != "PASS":
+        return TrialRejection(record["status"])
+    return (
+        record["weight"],
+        task[1],
+        task[3],
+        record["worst_v"],
+        record["worst_v_combo"],
+        record["worst_h"],
+        record["worst_h_combo"],
+        None,
+    )
+
+
+def _task_mass(task):
+    """Return the total steel mass of an ``analyze_combination`` task."""
+
+    member_db = task[4]
+    return (
+        member_db[task[0]][task[1]]["m"] * task[9]
+        + member_db[task[2]][task[3]]["m"] * task[10]
+    )
+
+
+def _task_stiffness(task):
+    """Return the rafter and column ``Ix`` of an ``analyze_combination`` task."""
+
+    member_db = task[4]
+    return (
+        float(member_db[task[0]][task[1]]["Ix"]),
+        float(member_db[task[2]][task[3]]["Ix"]),
+    )
+
+
+def _search_tasks(primary, r_list, c_list, r_section_type, c_section_type,
+                  member_db, data: PortalFrame, template, vert_limit,
+                  horiz_limit, r_total_m, c_total_m, allow_failed_checks,
+                  solver):
+    """Return the ``analyze_combination`` tasks of a search, lightest first."""
 
     # Decide which list is the outer loop
     if primary == 'column':
         outer_list, inner_list = c_list, r_list
-        outer_type, inner_type = c_section_type, r_section_type
     else:
         outer_list, inner_list = r_list, c_list
-        outer_type, inner_type = r_section_type, c_section_type
 
     tasks = []
     for o_name in outer_list:
@@ -479,79 +1115,624 @@ def directional_search(primary, r_list, c_list, r_section_type, c_section_type,
 
             tasks.append((r_section_type, r_name,
              c_section_type, c_name,
-             member_db, data,
+             member_db, data, template,
              vert_limit, horiz_limit,
              r_total_m, c_total_m,
-             allow_failed_checks))
+             allow_failed_checks, solver))
+    return sorted(tasks, key=_task_mass)
 
-    if not tasks:          # nothing to do
+
+def _search_combination_reduction(tasks, data: PortalFrame, template, solver,
+                                  prescreen=None, prescreen_margin=None,
+                                  warm_start=None):
+    """Return the combination reduction of a search and its audit.
+
+    Combinations enveloped by another at a reference pair are left out of
+    the trials. The reference is the previous winner or else the lightest
+    pair the pre-screen keeps, both usually close to the winner.
+    ``(None, None)`` means every combination is searched.
+    """
+
+    member_db = tasks[0][4]
+    reference = next(
+        (task for task in tasks
+         if warm_start is not None
+         and (task[1], task[3])
+         == (warm_start["rafter"], warm_start["column"])),
+        None,
+    ) or next(
+        (task for task in tasks
+         if prescreen is None or not prescreen.estimate(
+             member_db[task[0]][task[1]], member_db[task[2]][task[3]]
+         ).rejects(prescreen_margin or 0.0)),
+        tasks[0],
+    )
+    started = time.perf_counter()
+    reduction = reference_combination_reduction(
+        data, template, reference[0], reference[1], reference[2],
+        reference[3], member_db, solver,
+    )
+    if reduction is None or not reduction.pruned:
+        return None, None
+    audit = reduction.audit()
+    audit["reference_analysis_s"] = round(time.perf_counter() - started, 6)
+    print(
+        f"Combination pruning at {reduction.reference[0]} / "
+        f"{reduction.reference[1]} keeps "
+        f"{len(reduction.serviceability)} of "
+        f"{len(data.serviceability_load_combinations)} SLS and "
+        f"{len(reduction.strength)} of "
+        f"{len(data.load_combinations)} ULS combinations:"
+    )
+    print(reduction.table())
+    return reduction, audit
+
+
+def _warm_start_plan(warm_start, tasks, r_list, c_list):
+    """Return the warm-start pairs, previous outcomes and strength default.
+
+    A previous winning pair and its Ix neighbours are trialled before the
+    ascending scan: the previous pair first, heavier neighbours until one
+    passes, then lighter neighbours heaviest first so their serviceability
+    failures prune as much of the lighter region as possible. The scan then
+    proves every lighter pair, so the result equals a cold search. Pairs
+    that failed on strength last time are checked for strength first, as
+    are untried pairs when strength rejected most previous FE trials.
+    """
+
+    r_section_type, c_section_type = tasks[0][0], tasks[0][2]
+    member_db = tasks[0][4]
+    previous_r, previous_c = warm_start["rafter"], warm_start["column"]
+    previous_outcomes = {
+        (rafter, column): outcome
+        for rafter, column, outcome in warm_start.get("outcomes", ())
+    }
+    stages = Counter(previous_outcomes.values())
+    strength_by_default = (
+        stages[REJECTED_STRENGTH] > stages[REJECTED_SERVICEABILITY]
+    )
+    if (
+        previous_r not in member_db[r_section_type]
+        or previous_c not in member_db[c_section_type]
+    ):
+        return [], previous_outcomes, strength_by_default
+
+    by_pair = {(task[1], task[3]): task for task in tasks}
+    neighbours = [
+        by_pair[pair]
+        for pair in warm_start_pairs(
+            float(member_db[r_section_type][previous_r]["Ix"]),
+            float(member_db[c_section_type][previous_c]["Ix"]),
+            {
+                name: float(member_db[r_section_type][name]["Ix"])
+                for name in r_list
+            },
+            {
+                name: float(member_db[c_section_type][name]["Ix"])
+                for name in c_list
+            },
+        )
+        if pair in by_pair
+    ]
+    bound = (
+        member_db[r_section_type][previous_r]["m"] * tasks[0][9]
+        + member_db[c_section_type][previous_c]["m"] * tasks[0][10]
+    )
+    warm_tasks = (
+        [task for task in neighbours
+         if (task[1], task[3]) == (previous_r, previous_c)]
+        + sorted(
+            (task for task in neighbours if _task_mass(task) > bound),
+            key=_task_mass,
+        )
+        + sorted(
+            (task for task in neighbours
+             if _task_mass(task) <= bound
+             and (task[1], task[3]) != (previous_r, previous_c)),
+            key=_task_mass,
+            reverse=True,
+        )
+    )
+    print(
+        f"Warm start from {previous_r} / {previous_c}: "
+        f"{len(warm_tasks)} neighbouring pair(s) trialled first."
+    )
+    return warm_tasks, previous_outcomes, strength_by_default
+
+
+class SectionSearch:
+    """Mutable state of one mass-ordered rafter/column section search.
+
+    :meth:`next_task` serves the warm-start pairs, pairs a pool worker handed
+    back and then the ascending scan, and settles every pair it can without
+    an FE trial. :meth:`record` takes each trial outcome; the first passing
+    pair bounds the mass of every pair still worth analysing.
+    """
+
+    def __init__(self, tasks, frontier, pruning=True, prescreen=None,
+                 prescreen_margin=None, trial_cache=None, search=None,
+                 warm_tasks=(), previous_outcomes=None,
+                 strength_by_default=False):
+        self.tasks = tasks
+        self.frontier = frontier
+        self.pruning = pruning
+        self.prescreen = prescreen
+        self.prescreen_margin = prescreen_margin
+        self.trial_cache = trial_cache
+        self.search = search
+        self.warm_tasks = list(warm_tasks)
+        self.previous_outcomes = dict(previous_outcomes or {})
+        self.strength_by_default = strength_by_default
+        self.profile = SearchProfile()
+        # Strength failures per ULS combination, checked first in later trials.
+        self.governing = Counter()
+        # Trials rejected by each stage of analyze_combination, cached or not.
+        self.rejections = Counter()
+        self.acceptable = []
+        self.prescreened = []
+        self.cache_hits = 0
+        self.lightest_pass = math.inf
+        self.seen = set()
+        # Pairs a pool worker left unanalysed; they are settled like warm tasks.
+        self.returned = deque()
+        self._pending = iter(
+            [(True, task) for task in self.warm_tasks]
+            + [(False, task) for task in tasks]
+        )
+
+    def record(self, task, result, cached=False, timing=None):
+        """Log one trial outcome and update the frontier and lightest pass."""
+
+        if self.search is not None and not cached:
+            self.trial_cache.put(
+                self.search, task[1], task[3], _trial_cache_record(result)
+            )
+        self.profile.add(
+            task[1], task[3], _task_mass(task),
+            result.reason if isinstance(result, TrialRejection) else "pass",
+            SOURCE_CACHE if cached else SOURCE_FE,
+            timing,
+        )
+        if isinstance(result, TrialRejection):
+            self.rejections[result.reason] += 1
+            if result.reason == REJECTED_SERVICEABILITY:
+                self.frontier.add_failure(
+                    *_task_stiffness(task), task[1], task[3]
+                )
+            return
+        self.frontier.add_pass(
+            *_task_stiffness(task), _task_mass(task), task[1], task[3]
+        )
+        self.acceptable.append(result)
+        self.lightest_pass = min(self.lightest_pass, _task_mass(task))
+
+    def strength_first(self, task):
+        """Return whether ``task`` should be checked for strength first."""
+
+        outcome = self.previous_outcomes.get((task[1], task[3]))
+        if outcome is None:
+            return self.strength_by_default
+        return outcome == REJECTED_STRENGTH
+
+    def _settled(self, task):
+        """Return whether ``task`` is decided without a new FE trial."""
+
+        mass = _task_mass(task)
+        if self.pruning:
+            decision = self.frontier.dominated(
+                *_task_stiffness(task), mass, task[1], task[3]
+            )
+            if decision is not None:
+                print(f"   {decision.message()}")
+                self.profile.add(
+                    task[1], task[3], mass,
+                    REJECTED_SERVICEABILITY
+                    if decision.reason == "failed"
+                    else "dominated",
+                    SOURCE_DOMINANCE,
+                )
+                return True
+        if self.prescreen is not None and self.prescreen_margin is not None:
+            member_db = task[4]
+            estimate = self.prescreen.estimate(
+                member_db[task[0]][task[1]],
+                member_db[task[2]][task[3]],
+            )
+            reason = estimate.rejection(self.prescreen_margin)
+            if reason is not None:
+                self.prescreened.append((task[1], task[3], estimate))
+                self.profile.add(
+                    task[1], task[3], mass,
+                    PRESCREEN_REJECTIONS[reason], SOURCE_PRESCREEN,
+                )
+                return True
+        if self.search is not None:
+            cached = self.trial_cache.get(self.search, task[1], task[3])
+            if cached is not None:
+                self.cache_hits += 1
+                self.record(task, _trial_from_cache(task, cached), cached=True)
+                return True
+        return False
+
+    def next_task(self):
+        """Return the next pair needing an FE trial lighter than any pass."""
+
+        while self.returned or (
+            item := next(self._pending, None)
+        ) is not None:
+            warm, task = self.returned.popleft() if self.returned else item
+            if (task[1], task[3]) in self.seen:
+                continue
+            if _task_mass(task) >= self.lightest_pass:
+                if warm:
+                    continue
+                return None
+            self.seen.add((task[1], task[3]))
+            if not self._settled(task):
+                return task
         return None
 
-    tasks.sort(key=lambda task: (
-        member_db[task[0]][task[1]]["m"] * r_total_m
-        + member_db[task[2]][task[3]]["m"] * c_total_m
-    ))
+    def run_serial(self):
+        """Analyse the pairs one at a time in this process."""
 
-    acceptable = []
-    workers = max(1, min(int(num_core), len(tasks)))
-    print(f"Checking {len(tasks)} compatible section pairs using {workers} worker(s)...")
-    if workers == 1:
-        for task in tasks:
-            result = analyze_combination(task)
-            if result is not None:
-                acceptable.append(result)
-                # The first passing pair is globally lightest because the
-                # candidate matrix is ordered by total steel mass.
-                break
-    else:
-        # Evaluate small, mass-ordered batches. Waiting for each complete batch
-        # preserves the guarantee that the first passing result is globally
-        # lightest, while avoiding submission/analysis of the entire matrix.
-        with ProcessPoolExecutor(max_workers=workers) as ex:
-            for start in range(0, len(tasks), workers):
-                batch = tasks[start:start + workers]
-                results = list(ex.map(analyze_combination, batch))
-                passing = [result for result in results if result is not None]
-                if passing:
-                    acceptable.extend(passing)
+        # The first passing pair is globally lightest because the candidate
+        # matrix is ordered by total steel mass.
+        while (task := self.next_task()) is not None:
+            result, timing = _profiled_trial(
+                task, self.strength_first(task), self.governing
+            )
+            self.record(task, result, timing=timing)
+
+    def run_pool(self, context: SearchContext, num_core, workers):
+        """Analyse the pairs in blocks on the persistent worker pool."""
+
+        pool = analysis_pool(num_core)
+        # Keep every worker busy with blocks of consecutive pairs from the
+        # mass-ordered queue; a worker reuses one prepared model, its solver
+        # structure and its load vectors across the block. Once a pair passes,
+        # nothing heavier is submitted and queued heavier blocks are cancelled
+        # (running ones are ignored), but every lighter trial already in
+        # flight is still awaited, so the lightest passing pair is proven.
+        running = {}
+        try:
+            while True:
+                while len(running) < workers:
+                    block = self._next_block()
+                    if not block:
+                        break
+                    future = pool.submit(_analyze_section_block, (
+                        context,
+                        [
+                            (task[1], task[3], _task_mass(task),
+                             self.strength_first(task))
+                            for task in block
+                        ],
+                        self.pruning,
+                    ))
+                    running[future] = block
+                    self.profile.blocks += 1
+                if not running:
                     break
-
-    if not acceptable:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    block = running.pop(future)
+                    self._record_block(block, future.result())
+                for future, block in list(running.items()):
+                    if min(map(_task_mass, block)) > self.lightest_pass:
+                        future.cancel()
+                        del running[future]
+        except BrokenProcessPool:
+            # A crashed worker poisons the executor; start afresh next time.
+            shutdown_analysis_pool()
+            raise
+
+    def _next_block(self):
+        """Return up to ``SEARCH_BLOCK_SIZE`` pairs needing an FE trial."""
+
+        block = []
+        while len(block) < SEARCH_BLOCK_SIZE and (
+            task := self.next_task()
+        ) is not None:
+            block.append(task)
+        return block
+
+    def _record_block(self, block, outcomes):
+        """Record the outcomes of one pool block."""
+
+        for task, outcome in zip(block, outcomes):
+            if outcome is None:
+                continue
+            result, timing = outcome
+            if _task_mass(task) > self.lightest_pass:
+                # Still counted as pool work in the search profile.
+                self.profile.add(
+                    task[1], task[3], _task_mass(task), "discarded",
+                    SOURCE_FE, timing,
+                )
+                continue
+            self.record(task, result, timing=timing)
+        # Pairs the worker skipped are settled by the frontier or, failing
+        # that, analysed in a later block.
+        for task, outcome in zip(block, outcomes):
+            if outcome is None and _task_mass(task) < self.lightest_pass:
+                self.seen.discard((task[1], task[3]))
+                self.returned.append((True, task))
+
+    def report(self):
+        """Print how the pairs of the search were settled."""
+
+        pairs = len(self.tasks)
+        if self.cache_hits:
+            print(f"Reused {self.cache_hits} cached section trial(s).")
+        if self.prescreened:
+            print(
+                f"Closed-form pre-screen rejected {len(self.prescreened)} of "
+                f"{pairs} section pairs "
+                f"(margin {self.prescreen_margin:.0%})."
+            )
+        if self.frontier.decisions:
+            print(
+                f"Dominance pruning skipped {len(self.frontier.decisions)} "
+                f"of {pairs} section pairs."
+            )
+        if self.rejections:
+            print("Rejected by stage: " + ", ".join(
+                f"{reason} {self.rejections[reason]}"
+                for reason in (REJECTED_UNSTABLE, REJECTED_SERVICEABILITY,
+                               REJECTED_STRENGTH)
+                if self.rejections[reason]
+            ))
+
+    def winner(self):
+        """Return the lightest passing trial result, if any."""
+
+        return min(self.acceptable, key=lambda r: r[0], default=None)
+
+    def full_set_check(self, data: PortalFrame, audit):
+        """Re-check the winner with every combination of ``data``.
+
+        A pair rejected with fewer combinations also fails with all of them,
+        so a winner passing the full set is the full-search winner; its
+        result then replaces the reduced-set results. Returns the rejection
+        of a failing winner, else ``None``.
+        """
+
+        winner = self.winner()
+        task = next(
+            task for task in self.tasks
+            if (task[1], task[3]) == (winner[1], winner[2])
+        )
+        started = time.perf_counter()
+        result = analyze_combination(task[:5] + (data,) + task[6:])
+        audit["full_set_check_s"] = round(time.perf_counter() - started, 6)
+        if isinstance(result, TrialRejection):
+            audit["full_set_check"] = "FAIL"
+            return result
+        audit["full_set_check"] = "PASS"
+        self.acceptable = [result]
         return None
 
-    # tuple order: (wt, r_name, c_name, dy, dy_comb, dx, dx_comb)
-    wt, r_name, c_name, dy, dy_comb, dx, dx_comb = min(acceptable, key=lambda r: r[0])
+    def summary(self):
+        """Return the ``search_summary`` counts of the search."""
+
+        return {
+            'pairs': len(self.tasks),
+            'cache_hits': self.cache_hits,
+            'dominance_pruned': len(self.frontier.decisions),
+            'prescreen_rejected': len(self.prescreened),
+            'rejected_unstable': self.rejections[REJECTED_UNSTABLE],
+            'rejected_serviceability': (
+                self.rejections[REJECTED_SERVICEABILITY]
+            ),
+            'rejected_strength': self.rejections[REJECTED_STRENGTH],
+            'passed': len(self.acceptable),
+            'warm_start_pairs': len(self.warm_tasks),
+        }
+
+
+def _rebuild_best_frame(template, data: PortalFrame, r_mem, c_mem, bundle,
+                        solver):
+    """Return the analysed PyNite model of the winning pair."""
 
-    # --- rebuild the FE model for the best pair ------------------------
-    r_mem = mdb.member_properties(r_section_type, r_name, member_db)
-    c_mem = mdb.member_properties(c_section_type, c_name, member_db)
     resolved_data = resolve_candidate_haunch_data(data, r_mem)
-    best_frame = build_model(r_mem, c_mem, resolved_data)
+    best_frame = template.build(r_mem, c_mem, resolved_data)
+    if bundle is not None:
+        restore_result_bundle(best_frame, bundle)
+    else:
+        # Cached trials and the direct solver carry no analysed results.
+        analyze_frame(
+            best_frame,
+            analysis_combinations(data, include_foundation=True),
+            solver,
+        )
+    best_frame._portal_resolved_frame_data = dict(
+        resolved_data.frame_data[0]
+    )
+    best_frame._portal_foundation_characteristic_combinations = (
+        foundation_characteristic_combinations(data.load_combinations)
+    )
+    return best_frame
+
+
+def _run_section_search(tasks, reduction, r_list, c_list, num_core,
+                        input_path=None, trial_cache=None, warm_start=None,
+                        dominance_pruning=True, prescreen=None,
+                        prescreen_margin=None):
+    """Run one section search over ``tasks`` and return its state.
+
+    ``reduction`` names the combinations the tasks' analysis input keeps,
+    or is ``None`` when they carry every combination.
+    """
 
-    for combo in data.serviceability_load_combinations:
-        best_frame.add_load_combo(combo['name'], combo['factors'])
-    add_permanent_baseline_combinations(
-        best_frame, data.serviceability_load_combinations
+    (r_section_type, _, c_section_type, _, _, search_data, _,
+     vert_limit, horiz_limit, r_total_m, c_total_m,
+     allow_failed_checks, solver) = tasks[0]
+    # Trials already run for identical analysis input and engine sources.
+    search = None
+    if trial_cache is not None and input_path is not None:
+        settings = {
+            "r_section_type": r_section_type,
+            "c_section_type": c_section_type,
+            "vert_limit": vert_limit,
+            "horiz_limit": horiz_limit,
+            "r_total_m": r_total_m,
+            "c_total_m": c_total_m,
+            "allow_failed_checks": allow_failed_checks,
+            "solver": solver,
+        }
+        if reduction is not None:
+            settings["combinations"] = [
+                list(reduction.serviceability), list(reduction.strength)
+            ]
+        search = search_digest(input_path, settings)
+    warm_plan = ([], {}, False)
+    if warm_start is not None and not allow_failed_checks:
+        warm_plan = _warm_start_plan(warm_start, tasks, r_list, c_list)
+
+    # Serviceability is monotonic in the rafter and column Ix, unless the
+    # haunch depth is cut from the rafter. Forced sections evaluate every
+    # pair and therefore skip nothing.
+    frontier = DominanceFrontier(
+        record_failures=not haunch_depth_follows_rafter(
+            search_data.frame_data[0]
+        )
+    )
+    state = SectionSearch(
+        tasks,
+        frontier,
+        pruning=dominance_pruning and not allow_failed_checks,
+        prescreen=prescreen,
+        prescreen_margin=prescreen_margin,
+        trial_cache=trial_cache,
+        search=search,
+        warm_tasks=warm_plan[0],
+        previous_outcomes=warm_plan[1],
+        strength_by_default=warm_plan[2],
     )
+    workers = max(1, min(int(num_core), len(tasks)))
+    if input_path is None:
+        # Pool workers reload the frame input from disk.
+        workers = 1
+    print(f"Checking {len(tasks)} compatible section pairs using {workers} worker(s)...")
+    state.profile.workers = workers
+    if workers == 1:
+        state.run_serial()
+    else:
+        # Pool workers already hold the catalogue and, after their first task,
+        # the frame input, so each task only names its two sections.
+        state.run_pool(
+            SearchContext(
+                input_path=str(input_path),
+                input_digest=_file_digest(input_path),
+                r_section_type=r_section_type,
+                c_section_type=c_section_type,
+                vert_limit=vert_limit,
+                horiz_limit=horiz_limit,
+                r_total_m=r_total_m,
+                c_total_m=c_total_m,
+                allow_failed_checks=allow_failed_checks,
+                solver=solver,
+                combinations=(
+                    (reduction.serviceability, reduction.strength)
+                    if reduction is not None
+                    else None
+                ),
+                search_key=uuid.uuid4().hex,
+            ),
+            num_core,
+            workers,
+        )
+    state.report()
+    return state
 
-    for combo in data.load_combinations:  # e.g. '1.1 DL + 1.0 LL'
-        best_frame.add_load_combo(combo['name'], combo['factors'])
 
-    foundation_combinations = foundation_characteristic_combinations(
-        data.load_combinations
+def directional_search(primary, r_list, c_list, r_section_type, c_section_type,
+                       member_db, data: PortalFrame, r_total_m, c_total_m,
+                       vert_limit, horiz_limit, num_core,
+                       allow_failed_checks=False,
+                       solver=SOLVER_SUPERPOSITION,
+                       template=None,
+                       input_path=None,
+                       dominance_pruning=True,
+                       prescreen_margin=None,
+                       trial_cache=None,
+                       warm_start=None,
+                       combination_pruning=True):
+
+    if template is None:
+        template = PortalFrameTemplate(data)
+
+    tasks = _search_tasks(
+        primary, r_list, c_list, r_section_type, c_section_type, member_db,
+        data, template, vert_limit, horiz_limit, r_total_m, c_total_m,
+        allow_failed_checks, solver,
     )
-    for combo in foundation_combinations:
-        best_frame.add_load_combo(combo['name'], combo['factors'])
+    if not tasks:          # nothing to do
+        return None
 
-    with warnings.catch_warnings():
-        warnings.filterwarnings("ignore", category=MatrixRankWarning)
-        best_frame.analyze(check_statics=False)
-    best_frame._portal_resolved_frame_data = dict(
-        resolved_data.frame_data[0]
+    # The closed-form estimate picks the combination-pruning reference pair.
+    # No FE trial confirms its rejections, so it only removes pairs failing
+    # by more than ``prescreen_margin`` when a margin is given; for haunched
+    # frames only its strength estimate does.
+    prescreen = None
+    if not allow_failed_checks:
+        prescreen = portal_prescreen(data, vert_limit, horiz_limit)
+    search_options = dict(
+        input_path=input_path,
+        trial_cache=trial_cache,
+        warm_start=warm_start,
+        dominance_pruning=dominance_pruning,
+        prescreen=prescreen,
+        prescreen_margin=prescreen_margin,
     )
-    best_frame._portal_foundation_characteristic_combinations = (
-        foundation_combinations
+    # The winner of a search over a reduced combination set is re-checked
+    # with every combination. If it fails, the search falls back once to the
+    # full combination set.
+    reduction = pruning_audit = None
+    searched = tasks
+    if combination_pruning and not allow_failed_checks and len(tasks) > 1:
+        reduction, pruning_audit = _search_combination_reduction(
+            tasks, data, template, solver, prescreen, prescreen_margin,
+            warm_start,
+        )
+        if reduction is not None:
+            search_data = reduction.apply(data)
+            searched = [
+                task[:5] + (search_data,) + task[6:] for task in tasks
+            ]
+    state = _run_section_search(
+        searched, reduction, r_list, c_list, num_core, **search_options
     )
+    if reduction is not None and state.acceptable:
+        rejection = state.full_set_check(data, pruning_audit)
+        if rejection is not None:
+            winner = state.winner()
+            print(
+                f"{winner[1]} / {winner[2]} fails the full combination set "
+                f"({rejection.reason}); repeating the search with every "
+                "combination."
+            )
+            state = _run_section_search(
+                tasks, None, r_list, c_list, num_core, **search_options
+            )
+
+    search_profile = state.profile.finish(len(tasks))
+    if pruning_audit is not None:
+        search_profile["combination_pruning"] = pruning_audit
+    print(profile_summary(search_profile))
+    winner = state.winner()
+    if winner is None:
+        return None
+
+    # tuple order: (wt, r_name, c_name, dy, dy_comb, dx, dx_comb, bundle)
+    wt, r_name, c_name, dy, dy_comb, dx, dx_comb, bundle = winner
+
+    # --- rebuild the FE model for the best pair ------------------------
+    r_mem = mdb.member_properties(r_section_type, r_name, member_db)
+    c_mem = mdb.member_properties(c_section_type, c_name, member_db)
+    best_frame = _rebuild_best_frame(template, data, r_mem, c_mem, bundle,
+                                     solver)
+    best_frame._portal_search_profile = search_profile
 
     return {
         'weight': wt,
@@ -565,7 +1746,114 @@ def directional_search(primary, r_list, c_list, r_section_type, c_section_type,
         'dy': dy,
         'dy_comb': dy_comb,
         'dx': dx,
-        'dx_comb': dx_comb
+        'dx_comb': dx_comb,
+        'search_summary': {
+            **state.summary(),
+            'combinations_pruned': (
+                len(reduction.pruned) if reduction is not None else 0
+            ),
+        },
+        'search_profile': search_profile,
+    }
+
+
+def portal_prescreen(data: PortalFrame, vert_limit, horiz_limit):
+    """Return the closed-form pre-screen for automatic section sizing."""
+
+    return PortalPrescreen(
+        data,
+        vertical_combinations=[
+            combination["name"]
+            for combination in data.serviceability_load_combinations
+            if _vertical_deflection_limit_applies(
+                data.frame_data[0], str(combination["name"])
+            )
+        ],
+        vertical_limit=vert_limit,
+        horizontal_limit=horiz_limit,
+    )
+
+
+def prescreen_audit(
+    input_path="input_data.json",
+    margin=DEFAULT_PRESCREEN_MARGIN,
+    limit=None,
+    solver=SOLVER_SUPERPOSITION,
+):
+    """Run the pre-screen and the full FE trial on every compatible pair.
+
+    Pairs are taken in ascending mass order, optionally only the first
+    ``limit``. A false rejection is a pair the pre-screen would reject that
+    the full serviceability and strength trial accepts.
+    """
+
+    member_db = mdb.load_member_database()
+    data = import_data(str(input_path))
+    settings = data.frame_data[0]
+    r_type = settings.get("rafter_section_type", "I-Sections")
+    c_type = settings.get("column_section_type", "I-Sections")
+    r_total_m, c_total_m = get_member_lengths(data)
+    vert_limit = settings['gable_width'] / 180
+    horiz_limit = settings['eaves_height'] / 180
+    requested_cut = governing_specified_haunch_cut_depth_mm(settings)
+    pairs = sorted(
+        (
+            (r_name, c_name)
+            for r_name in section_candidates(member_db, r_type)
+            for c_name in section_candidates(member_db, c_type)
+            if member_db[r_type][r_name]["b"]
+            <= member_db[c_type][c_name]["b"] + 3.5
+            and (
+                requested_cut <= 0.0
+                or haunch_cut_depth_check(
+                    member_db[r_type][r_name], requested_cut
+                ).is_valid
+            )
+        ),
+        key=lambda pair: (
+            member_db[r_type][pair[0]]["m"] * r_total_m
+            + member_db[c_type][pair[1]]["m"] * c_total_m
+        ),
+    )[:limit]
+    prescreen = portal_prescreen(data, vert_limit, horiz_limit)
+    template = PortalFrameTemplate(data)
+    rows = []
+    for r_name, c_name in pairs:
+        estimate = prescreen.estimate(
+            member_db[r_type][r_name], member_db[c_type][c_name]
+        )
+        result = analyze_combination((
+            r_type, r_name, c_type, c_name,
+            member_db, data, template,
+            vert_limit, horiz_limit,
+            r_total_m, c_total_m,
+            False, solver,
+        ))
+        passed = not isinstance(result, TrialRejection)
+        reason = estimate.rejection(margin)
+        rejected = reason is not None
+        rows.append({
+            "rafter": r_name,
+            "column": c_name,
+            "estimated_utilisation": estimate.utilisation,
+            "prescreen": "REJECT" if rejected else "ANALYSE",
+            "prescreen_reason": reason,
+            "fe_result": "PASS" if passed else result.reason,
+            "false_rejection": rejected and passed,
+        })
+    rejected = sum(row["prescreen"] == "REJECT" for row in rows)
+    false_rejections = sum(row["false_rejection"] for row in rows)
+    return {
+        "summary": {
+            "pairs": len(rows),
+            "margin": margin,
+            "prescreen_rejections": rejected,
+            "false_rejections": false_rejections,
+            "false_rejection_rate": (
+                false_rejections / rejected if rejected else 0.0
+            ),
+        },
+        "pairs": rows,
     }
 
 
@@ -600,10 +1888,29 @@ def sls_check(
     input_path="input_data.json",
     selected_rafter_section=None,
     selected_column_section=None,
+    solver=SOLVER_SUPERPOSITION,
+    use_trial_cache=True,
+    workers=None,
+    member_db=None,
+    warm_start_key=None,
+    data=None,
+    prescreen_margin=None,
 ):
-    """Runs 'rafter-first' and 'column-first' searches, then returns the single lightest solution."""
+    """Runs 'rafter-first' and 'column-first' searches, then returns the single lightest solution.
+
+    ``workers`` overrides the number of section-search processes; ``1`` runs
+    the search in this process. ``member_db`` reuses an already loaded
+    section catalogue. With the trial cache enabled, ``warm_start_key`` names
+    the project whose previous winning pair and trial outcomes start the
+    search; the new winner and outcomes are stored under the same key.
+    ``data`` is the already loaded content of ``input_path``; it is read
+    from the file when omitted. ``prescreen_margin`` opts in to rejecting
+    pairs whose closed-form estimate fails by more than that margin without
+    an FE trial; check it first with ``python portal_prescreen.py``.
+    """
     start = time.time()
-    member_db = mdb.load_member_database()
+    if member_db is None:
+        member_db = mdb.load_member_database()
 
     r_list = section_candidates(
         member_db, r_section_type, preferred_section, selected_rafter_section
@@ -614,7 +1921,8 @@ def sls_check(
     if not r_list or not c_list:
         raise ValueError(f"No sections flagged as Preferred='{preferred_section}' found.")
 
-    data = import_data(str(input_path))
+    if data is None:
+        data = import_data(str(input_path))
     requested_cut = governing_specified_haunch_cut_depth_mm(
         data.frame_data[0]
     )
@@ -661,6 +1969,13 @@ def sls_check(
         for section in (selected_rafter_section, selected_column_section)
     )
 
+    # Topology, supports and applied loads are shared by every trial.
+    template = PortalFrameTemplate(data)
+    trial_cache = TrialCache() if use_trial_cache else None
+    warm_start = None
+    if trial_cache is not None and warm_start_key and not forced_sections:
+        warm_start = trial_cache.warm_start(warm_start_key)
+
     # Search the full rafter/column matrix once in ascending mass order.
     best_r = directional_search(
         'rafter',  # primary search direction
@@ -669,8 +1984,14 @@ def sls_check(
         member_db, data,
         r_total_m, c_total_m,  # totals still needed for weight ranking
         vert_limit, horiz_limit,
-        num_cores,
+        num_cores if workers is None else workers,
         allow_failed_checks=forced_sections,
+        solver=solver,
+        template=template,
+        input_path=input_path,
+        trial_cache=trial_cache,
+        warm_start=warm_start,
+        prescreen_margin=prescreen_margin,
     )
 
     # ❷ Search by fixing columns first, then rafters
@@ -681,6 +2002,18 @@ def sls_check(
         return None, None, member_db, r_section_type, c_section_type, None
 
     best = min(candidates, key=lambda d: d['weight'])
+    if trial_cache is not None and warm_start_key and not forced_sections:
+        trial_cache.set_warm_start(
+            warm_start_key,
+            best['r_name'],
+            best['c_name'],
+            [
+                (row['rafter'], row['column'], row['outcome'])
+                for row in best['search_profile']['trials']
+                if row['source'] in (SOURCE_FE, SOURCE_CACHE)
+                and row['outcome'] != "discarded"
+            ],
+        )
     print(
         "Selected combination:" if forced_sections else "Lightest combination:"
     )
@@ -734,108 +2067,130 @@ def sls_check(
 
     return best['frame'], render_combo, member_db, r_section_type, c_section_type, (best['r_name'], best['c_name'])
 
-def extract_member_actions(frame, r_type, r_mem, c_type, c_mem,
-                           data: PortalFrame, combo):
-    """Extract final member actions once for analysis and downstream reports."""
+def superposition_regression_check(r_mem, c_mem, data: PortalFrame,
+                                   tolerance=1e-6):
+    """Compare superposed combination results with PyNite's direct solve.
 
-    steel_grade = data.steel_grade
-    fr = data.frame_data[0]
-    rafter_span = fr['gable_width'] / (2 if fr['building_roof'] == "Duo Pitched" else 1)
-    raf_kx = rafter_span
-    internal_loads = []
-
-    for mem in data.members:
-        physical = frame.members[mem.name]
-        base_properties = r_mem if mem.type == "rafter" else c_mem
-        design_segments = []
-        if mem.type == "rafter":
-            haunched = [
-                (name, sub_member)
-                for name, sub_member in physical.sub_members.items()
-                if hasattr(sub_member, "portal_properties")
-            ]
-            if haunched:
-                design_segments = list(physical.sub_members.items())
-        if not design_segments:
-            design_segments = [(mem.name, physical)]
+    Both models are built for the same section pair and analysed for every
+    SLS, permanent-baseline, ULS and foundation combination. Displacements,
+    reactions and sampled member actions must agree within ``tolerance``.
+    """
 
-        for segment_index, (segment_name, analysis_member) in enumerate(
-            design_segments, 1
-        ):
-            properties = getattr(
-                analysis_member, "portal_properties", base_properties
-            )
-            is_haunch = properties is not base_properties
-            result_name = (
-                f"{mem.name}[H{segment_index}]"
-                if is_haunch
-                else (
-                    f"{mem.name}[R{segment_index}]"
-                    if len(design_segments) > 1
-                    else mem.name
-                )
-            )
-            member_length_mm = analysis_member.L()
-            end_position = max(member_length_mm - 1e-6, 0.0)
-            Cu = round(analysis_member.max_axial(combo), 3)
-            Mx_max = round(
-                max(
-                    analysis_member.max_moment('Mz', combo),
-                    abs(analysis_member.min_moment('Mz', combo)),
-                ) / 1000,
-                3,
-            )
-            Mx_top = round(
-                analysis_member.moment('Mz', 0, combo) / 1000, 3
+    data = resolve_candidate_haunch_data(data, r_mem)
+    combinations = analysis_combinations(data, include_foundation=True)
+    reference = build_model(r_mem, c_mem, data)
+    analyze_frame(reference, combinations, SOLVER_DIRECT)
+    candidate = build_model(r_mem, c_mem, data)
+    analyze_frame(candidate, combinations, SOLVER_SUPERPOSITION)
+    return compare_combination_results(
+        reference, candidate, combinations, tolerance=tolerance
+    )
+
+
+def plane_frame_regression_check(r_mem, c_mem, data: PortalFrame,
+                                 tolerance=1e-6):
+    """Compare the plane-frame engine with PyNite's direct solve.
+
+    The PyNite model of the section pair is analysed directly; its plane
+    copy is analysed by :class:`PlaneFrame` and compared on its own members,
+    so sub-element actions and deflections are checked as well as nodes.
+    """
+
+    data = resolve_candidate_haunch_data(data, r_mem)
+    combinations = analysis_combinations(data, include_foundation=True)
+    reference = build_model(r_mem, c_mem, data)
+    candidate = PlaneFrame.from_pynite(reference)
+    analyze_frame(reference, combinations, SOLVER_DIRECT)
+    analyze_frame(candidate, combinations, SOLVER_PLANE)
+    return compare_combination_results(
+        reference, candidate, combinations, tolerance=tolerance
+    )
+
+
+def haunch_convergence_check(r_mem, c_mem, data: PortalFrame, refinement=2,
+                             tolerance=HAUNCH_STIFFNESS_ERROR):
+    """Compare the selected haunch discretisation with a refined one.
+
+    Every zone's sub-member count is multiplied by ``refinement``. Both
+    models are analysed for all combinations and compared on the
+    displacement envelope of the input nodes and on each physical member's
+    largest moment and axial force, relative to the refined values.
+    """
+
+    data = resolve_candidate_haunch_data(data, r_mem)
+    template = PortalFrameTemplate(data)
+    selected = template.segment_counts(r_mem, data)
+    refined = {zone: count * refinement for zone, count in selected.items()}
+    combinations = analysis_combinations(data, include_foundation=True)
+    frames = []
+    for segment_counts in (selected, refined):
+        frame = template.build(r_mem, c_mem, data, segment_counts)
+        analyze_frame(frame, combinations, SOLVER_PLANE)
+        frames.append(frame)
+
+    def envelope(frame, kind, key, name):
+        if kind == "displacement":
+            return max(
+                abs(getattr(frame.nodes[node], key)[name])
+                for node in data.nodes
             )
-            Mx_bot = round(
-                analysis_member.moment('Mz', end_position, combo) / 1000, 3
+        physical = frame.members[key]
+        if kind == "moment":
+            return max(
+                physical.max_moment('Mz', name),
+                -physical.min_moment('Mz', name),
             )
+        return max(
+            abs(physical.max_axial(name)), abs(physical.min_axial(name))
+        )
 
-            w1, w2 = element_properties(Mx_max, Mx_top, Mx_bot)
-            mem_type = mem.type
-            lx = (
-                raf_kx
-                if mem_type == 'rafter'
-                else data.frame_data[0]['eaves_height']
-            ) / 1000
-            kx = 1.0 if mem_type == 'rafter' else 1.2
-            # Stability lengths remain the physical brace-panel length; the
-            # numerical haunch sub-elements are not additional restraints.
-            ly = mem.length
-            ky = 1.0
-
-            action = {
-                'Name': result_name,
-                'parent_member': mem.name,
-                'kly': ky * ly,
-                'klx': kx * lx,
-                'kx': kx,
-                'lx': lx,
-                'ky': ky,
-                'ly': ly,
-                'type': mem_type,
-                'section_type': (
-                    "Haunched rafter"
-                    if is_haunch
-                    else (r_type if mem.type == "rafter" else c_type)
-                ),
-                'section': properties['Designation'],
-                'Cu': Cu,
-                'Class': member_class_check(
-                    Cu, properties, steel_grade
-                ),
-                'Mx_max': Mx_max,
-                'Mx_top': Mx_top,
-                'Mx_bot': Mx_bot,
-                'w1': w1,
-                'w2': w2,
-            }
-            if is_haunch:
-                action['section_properties'] = dict(properties)
-            internal_loads.append(action)
+    # Differences are relative to the refined envelope over all
+    # combinations, so lightly loaded combinations do not dominate.
+    differences = {"displacement": 0.0, "moment": 0.0, "axial": 0.0}
+    names = [combination['name'] for combination in combinations]
+    for kind, keys in (
+        ("displacement", ("DX", "DY")),
+        ("moment", [member.name for member in data.members]),
+        ("axial", [member.name for member in data.members]),
+    ):
+        for key in keys:
+            values = np.array([
+                [envelope(frame, kind, key, name) for name in names]
+                for frame in frames
+            ])
+            scale = values[1].max()
+            if scale > 1e-9:
+                differences[kind] = max(
+                    differences[kind],
+                    float(np.abs(values[0] - values[1]).max() / scale),
+                )
+
+    return {
+        "zones": haunch_discretisation_report(data.frame_data[0], r_mem),
+        "summary": {
+            "status": (
+                "PASS"
+                if max(differences.values()) <= tolerance
+                else "FAIL"
+            ),
+            "rafter": r_mem["Designation"],
+            "segments": selected,
+            "refined_segments": refined,
+            "tolerance": tolerance,
+            "max_displacement_difference": differences["displacement"],
+            "max_moment_difference": differences["moment"],
+            "max_axial_difference": differences["axial"],
+        },
+    }
 
-    return internal_loads
+
+def extract_member_actions(frame, r_type, r_mem, c_type, c_mem,
+                           data: PortalFrame, combo):
+    """Extract final member actions once for analysis and downstream reports."""
+
+    return member_action_table(
+        frame, r_type, r_mem, c_type, c_mem, data, [combo]
+    ).actions(combo)
 
 
 def internal_forces(frame, r_type, r_mem, c_type, c_mem, data: PortalFrame, combo, md):
@@ -861,23 +2216,86 @@ def internal_forces(frame, r_type, r_mem, c_type, c_mem, data: PortalFrame, comb
 
     return member_des
 
-def member_design_checks(frame, r_type, r_mem, c_type, c_mem, data, md):
-    """Return True if all members pass design checks for all ULS combos."""
-    for combo in data.load_combinations:
-        results = internal_forces(frame, r_type, r_mem, c_type, c_mem,
-                                 data, combo['name'], md)
-        for res in results:
-            ratios = (res['CSS'], res['OMS'], res['LTB'][0], res['LTB'][1])
-            # Never interpret NaN or infinity as a passing utilisation ratio.
-            if not all(math.isfinite(float(ratio)) for ratio in ratios):
-                return False
-            if (
-                res['CSS'] > 1
-                or res['OMS'] > 1
-                or res['LTB'][0] > 1
-                or res['LTB'][1] > 1
-            ):
-                return False
+def member_action_ratios(table, md, steel_grade, rows=slice(None)):
+    """Return CSS, OMS and LTB arrays of shape (combinations, segments).
+
+    ``table`` is a :class:`member_actions.MemberActionTable` and ``rows``
+    selects its combinations. The grid is checked by ``member_design_grid``;
+    the scalar ``internal_forces`` path gives the same ratios for reports.
+    """
+
+    properties = [
+        memb.get('section_properties')
+        or mdb.member_properties(memb['section_type'], memb['section'], md)
+        for memb in table.segments
+    ]
+    keys = ('b', 'h', 'tf', 'tw', 'A', 'Ix', 'Iy', 'rx', 'ry',
+            'Zplx', 'Zex', 'Cw', 'J')
+    sections = {
+        key: [float(prop[key]) for prop in properties] for key in keys
+    }
+
+    return member_design_grid(
+        table.Cu[rows], table.Mx_max[rows], table.Mx_top[rows],
+        table.Mx_bot[rows],
+        [memb['klx'] for memb in table.segments],
+        [memb['kly'] for memb in table.segments],
+        sections,
+        steel_grade[0],
+    )
+
+
+# Process-local count of the ULS combinations that ended strength trials.
+def _combinations_by_severity(frame, combinations, governing=None):
+    """Order ULS combos by past failures, then by largest nodal movement."""
+
+    governing = governing if governing is not None else Counter()
+
+    def severity(combination):
+        name = combination['name']
+        movement = max(
+            (
+                abs(node.DX.get(name, 0.0)) + abs(node.DY.get(name, 0.0))
+                for node in frame.nodes.values()
+            ),
+            default=0.0,
+        )
+        return (-governing[name], -movement)
+
+    return sorted(combinations, key=severity)
+
+
+def member_design_checks(frame, r_type, r_mem, c_type, c_mem, data, md,
+                         governing=None):
+    """Return True if all members pass design checks for all ULS combos.
+
+    Combinations are checked in order of likely severity and the check stops
+    at the first failure. ``governing`` counts the failures of each
+    combination over one section search; it ranks the combinations and is
+    updated here. Without it only the nodal movement ranks them.
+    """
+    combinations = _combinations_by_severity(
+        frame, data.load_combinations, governing
+    )
+    table = member_action_table(
+        frame, r_type, r_mem, c_type, c_mem, data,
+        [combo['name'] for combo in combinations],
+    )
+    # The likeliest failure is checked alone, the rest as one grid.
+    for batch in (slice(0, 1), slice(1, None)):
+        if not combinations[batch]:
+            continue
+        CSS, OMS, LTB = member_action_ratios(
+            table, md, data.steel_grade, batch
+        )
+        ratios = np.stack((CSS, OMS, *LTB))
+        # Never interpret NaN or infinity as a passing utilisation ratio.
+        failed = (~np.isfinite(ratios) | (ratios > 1)).any(axis=(0, 2))
+        if failed.any():
+            combo = combinations[batch][int(np.argmax(failed))]
+            if governing is not None:
+                governing[combo['name']] += 1
+            return False
     return True
 
 def uls_results(frame, r_type, r_mem, c_type, c_mem, data, md,
@@ -1046,11 +2464,22 @@ def main(
     snapshot_path="output/analysis/analysis_results.json",
     input_path="input_data.json",
     project_metadata=None,
+    workers=None,
+    member_db=None,
+    use_trial_cache=True,
+    warm_start_key=None,
+    data=None,
 ):
-    """Run one analysis, store its complete results, and optionally render it."""
+    """Run one analysis, store its complete results, and optionally render it.
+
+    ``data`` is the already loaded content of ``input_path``, as built by
+    :class:`model_builder.ModelBuilder`; it is read from the file when
+    omitted.
+    """
 
     preferred_section = 'Yes'
-    data = import_data(str(input_path))
+    if data is None:
+        data = import_data(str(input_path))
     frame_input = data.frame_data[0]
     r_section_type = frame_input.get('rafter_section_type', 'I-Sections')
     c_section_type = frame_input.get('column_section_type', 'I-Sections')
@@ -1064,6 +2493,11 @@ def main(
         input_path=input_path,
         selected_rafter_section=selected_rafter,
         selected_column_section=selected_column,
+        use_trial_cache=use_trial_cache,
+        workers=workers,
+        member_db=member_db,
+        warm_start_key=warm_start_key,
+        data=data,
     )
 
 
@@ -1077,18 +2511,18 @@ def main(
             data.frame_data[0] = dict(resolved_frame_data)
         r_mem = mdb.member_properties(r_section_typ, best_section[0], member_db)
         c_mem = mdb.member_properties(c_section_typ, best_section[1], member_db)
-        actions_by_combination = {
-            load_combination['name']: extract_member_actions(
-                frame,
-                r_section_typ,
-                r_mem,
-                c_section_typ,
-                c_mem,
-                data,
-                load_combination['name'],
-            )
-            for load_combination in data.load_combinations
-        }
+        actions_by_combination = member_action_table(
+            frame,
+            r_section_typ,
+            r_mem,
+            c_section_typ,
+            c_mem,
+            data,
+            [
+                load_combination['name']
+                for load_combination in data.load_combinations
+            ],
+        ).by_combination()
 
         # Import locally so multiprocessing section-search workers do not load
         # report/export dependencies. The snapshot is written before rendering.
@@ -1112,7 +2546,9 @@ def main(
             project_metadata=project_metadata,
         )
         snapshot = create_analysis_snapshot(
-            input_path, calculation_data.to_dict()
+            input_path,
+            calculation_data.to_dict(),
+            search_profile=getattr(frame, "_portal_search_profile", None),
         )
         written_snapshot = write_analysis_snapshot(snapshot, snapshot_path)
         print(f"Analysis results written to {written_snapshot.resolve()}")
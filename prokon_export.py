@@ -16,11 +16,10 @@ import gzip
 import json
 import math
 from pathlib import Path
-import tempfile
 from typing import Any, Iterable, Mapping
 
 import member_database as mdb
-from frame_model import load_portal_frame
+from frame_model import portal_frame_from_dict
 from portal_frame_analysis import build_model, resolve_candidate_haunch_data
 
 
@@ -173,19 +172,9 @@ def build_portal_comparison(snapshot: Mapping[str, Any]) -> dict[str, Any]:
     column = mdb.member_properties(_section_family(column_name), column_name, database)
     rafter = mdb.member_properties(_section_family(rafter_name), rafter_name, database)
 
-    temporary_path: Path | None = None
-    try:
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", encoding="utf-8", delete=False
-        ) as temporary:
-            json.dump(embedded, temporary)
-            temporary_path = Path(temporary.name)
-        data = resolve_candidate_haunch_data(
-            load_portal_frame(str(temporary_path)), rafter
-        )
-    finally:
-        if temporary_path is not None:
-            temporary_path.unlink(missing_ok=True)
+    data = resolve_candidate_haunch_data(
+        portal_frame_from_dict(embedded), rafter
+    )
     frame = build_model(rafter, column, data)
     for physical in frame.members.values():
         physical.descritize()
@@ -327,7 +316,7 @@ def build_portal_comparison(snapshot: Mapping[str, Any]) -> dict[str, Any]:
         "source_member_node_paths": {name: [members[index - 1].i_node for index in chain] + [members[chain[-1] - 1].j_node] for name, chain in source_chains.items()},
         "prokon_node_rules": {
             "bracing": "PortalFrame rafter/column subdivisions are retained as Prokon nodes.",
-            "haunch": "Each PortalFrame eight-segment haunch station is an explicit Prokon node and section segment.",
+            "haunch": "Each PortalFrame haunch analysis station is an explicit Prokon node and section segment.",
         },
         "warnings": [
             "The Prokon model is an analysis comparison input, not an independent design verification.",
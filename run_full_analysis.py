@@ -1,6 +1,37 @@
 import user_input
 import portal_frame_analysis
 from crawl_beam_inputs import crawl_beam_library
+from model_builder import ModelBuilder
+
+
+def model_builder(building_data, wind_data, input_path=None):
+    """Return the :class:`ModelBuilder` of one analysis request.
+
+    Entries of an existing ``input_path`` that the generator does not
+    replace are kept, as the file-based generators keep them.
+    """
+
+    building_data = dict(building_data)
+    if "crawl_beams" not in building_data:
+        building_data["crawl_beams"] = crawl_beam_library()
+    base = user_input.safe_load_json(input_path) if input_path else None
+    return ModelBuilder(building_data, dict(wind_data), base)
+
+
+def _write_input(building_data, wind_data, input_path):
+    """Write the input file of one request and return its builder."""
+
+    builder = model_builder(building_data, wind_data, input_path)
+    builder.write(input_path)
+    print(f"Portal frame data saved to {input_path}")
+    return builder
+
+
+def prepare_input_file(building_data, wind_data, input_path="input_data.json"):
+    """Write the analysis input file with wind, live and dead member loads."""
+
+    _write_input(building_data, wind_data, input_path)
+    return input_path
 
 
 def run_analysis(
@@ -11,21 +42,27 @@ def run_analysis(
     snapshot_path="output/analysis/analysis_results.json",
     render=False,
     project_metadata=None,
+    workers=None,
+    member_db=None,
+    warm_start_key=None,
 ):
-    """Generate one isolated input file and run the complete design workflow."""
+    """Generate one isolated input file and run the complete design workflow.
 
-    building_data = dict(building_data)
-    if "crawl_beams" not in building_data:
-        building_data["crawl_beams"] = crawl_beam_library()
+    The input is generated in memory and written once; the analysis starts
+    from the generated model rather than reading the file back.
 
-    user_input.update_json_file(input_path, building_data, dict(wind_data))
-    user_input.add_wind_member_loads(input_path)
-    user_input.add_live_loads(input_path)
-    user_input.add_dead_loads(input_path)
+    ``workers``, ``member_db`` and ``warm_start_key`` are passed to the
+    section search; see :func:`portal_frame_analysis.sls_check`.
+    """
 
+    builder = _write_input(building_data, wind_data, input_path)
     return portal_frame_analysis.main(
         render=render,
         snapshot_path=snapshot_path,
         input_path=input_path,
         project_metadata=project_metadata,
+        workers=workers,
+        member_db=member_db,
+        warm_start_key=warm_start_key,
+        data=builder.portal_frame(),
     )
@@ -0,0 +1,261 @@
+"""Timing profile of the rafter/column section search.
+
+Each FE trial records how long its model build, solves, serviceability
+deflection rows and member checks took, which process ran it and when.
+Pairs settled without an FE trial (trial cache, closed-form pre-screen or
+dominance pruning) are recorded with their outcome only. The finished profile
+holds per-trial rows, phase totals, per-worker load, pool utilisation and the
+share of stiffness solves done as low-rank updates; it is stored as the
+``search_profile`` section of the analysis snapshot and can be exported as
+JSON or as collapsed stacks for flame-graph tools.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Mapping, MutableMapping
+
+
+PHASES = ("build", "solve", "deflections", "member_checks")
+
+SOURCE_FE = "fe"
+SOURCE_CACHE = "cache"
+SOURCE_PRESCREEN = "prescreen"
+SOURCE_DOMINANCE = "dominance"
+
+
+@contextmanager
+def timed(timings: MutableMapping[str, float] | None, phase: str):
+    """Add the duration of the ``with`` block to ``timings[phase]``."""
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timings is not None:
+            timings[phase] = (
+                timings.get(phase, 0.0) + time.perf_counter() - start
+            )
+
+
+def trial_timing(
+    timings: Mapping[str, float],
+    started: float,
+    solves: Mapping[str, int] | None = None,
+) -> dict[str, Any]:
+    """Return the timing record of one trial started at ``started``.
+
+    ``solves`` counts the trial's stiffness solves by kind, as recorded in
+    :data:`load_superposition.SOLVE_STATISTICS`.
+    """
+
+    return {
+        "worker": os.getpid(),
+        "started": started,
+        "finished": time.time(),
+        "phases": dict(timings),
+        "solves": dict(solves or {}),
+    }
+
+
+class SearchProfile:
+    """Collects trial records during one directional search."""
+
+    def __init__(self, workers: int = 1):
+        self.workers = workers
+        # Blocks of pairs submitted to pool workers; none in a serial search.
+        self.blocks = 0
+        self.started = time.time()
+        self.trials: list[dict[str, Any]] = []
+
+    def add(
+        self,
+        rafter: str,
+        column: str,
+        mass_kg: float,
+        outcome: str,
+        source: str = SOURCE_FE,
+        timing: Mapping[str, Any] | None = None,
+    ) -> None:
+        row: dict[str, Any] = {
+            "rafter": rafter,
+            "column": column,
+            "mass_kg": round(float(mass_kg), 1),
+            "source": source,
+            "outcome": outcome,
+        }
+        if timing is not None:
+            phases = timing["phases"]
+            elapsed = timing["finished"] - timing["started"]
+            row.update(
+                worker=timing["worker"],
+                start_s=round(timing["started"] - self.started, 6),
+                end_s=round(timing["finished"] - self.started, 6),
+                elapsed_s=round(elapsed, 6),
+                **{
+                    f"{phase}_s": round(phases.get(phase, 0.0), 6)
+                    for phase in PHASES
+                },
+                other_s=round(
+                    max(elapsed - sum(phases.values()), 0.0), 6
+                ),
+            )
+            if timing.get("solves"):
+                row["solves"] = dict(timing["solves"])
+        self.trials.append(row)
+
+    def finish(self, pairs: int) -> dict[str, Any]:
+        """Return the serialisable profile of the completed search."""
+
+        wall = max(time.time() - self.started, 1e-9)
+        timed_trials = [row for row in self.trials if "elapsed_s" in row]
+        busy = sum(row["elapsed_s"] for row in timed_trials)
+        workers: dict[str, dict[str, float]] = defaultdict(
+            lambda: {"trials": 0, "busy_s": 0.0}
+        )
+        for row in timed_trials:
+            load = workers[str(row["worker"])]
+            load["trials"] += 1
+            load["busy_s"] = round(load["busy_s"] + row["elapsed_s"], 6)
+        sources = Counter(row["source"] for row in self.trials)
+        solves = Counter()
+        for row in timed_trials:
+            solves.update(row.get("solves", {}))
+        return {
+            "workers": self.workers,
+            "pool_blocks": self.blocks,
+            "wall_time_s": round(wall, 6),
+            "pairs": pairs,
+            "fe_trials": sources[SOURCE_FE],
+            "cache_hits": sources[SOURCE_CACHE],
+            "prescreen_rejected": sources[SOURCE_PRESCREEN],
+            "dominance_pruned": sources[SOURCE_DOMINANCE],
+            "not_evaluated": pairs - len(self.trials),
+            "outcomes": dict(Counter(row["outcome"] for row in self.trials)),
+            "phase_totals_s": {
+                phase: round(
+                    sum(row[f"{phase}_s"] for row in timed_trials), 6
+                )
+                for phase in (*PHASES, "other")
+            },
+            "trial_time_s": round(busy, 6),
+            "stiffness_solves": {
+                "full": solves["full"],
+                "low_rank": solves["low_rank"],
+                "low_rank_hit_rate": round(
+                    solves["low_rank"]
+                    / max(solves["full"] + solves["low_rank"], 1),
+                    4,
+                ),
+            },
+            "pool_utilisation": round(busy / (self.workers * wall), 4),
+            "worker_load": dict(workers),
+            "trials": self.trials,
+        }
+
+
+def profile_summary(profile: Mapping[str, Any]) -> str:
+    """Return a one-line console summary of a finished profile."""
+
+    totals = profile["phase_totals_s"]
+    # Profiles stored before stiffness solves were counted have no entry.
+    solves = profile.get("stiffness_solves", {})
+    return (
+        f"Trial time {profile['trial_time_s']:.2f} s over "
+        f"{profile['fe_trials']} FE trial(s): "
+        + ", ".join(
+            f"{phase.replace('_', ' ')} {totals[phase]:.2f} s"
+            for phase in (*PHASES, "other")
+        )
+        + f"; pool utilisation {profile['pool_utilisation']:.0%}"
+        + (
+            f"; low-rank stiffness updates "
+            f"{solves['low_rank_hit_rate']:.0%}"
+            if solves.get("low_rank")
+            else ""
+        )
+    )
+
+
+def folded_stacks(profile: Mapping[str, Any]) -> list[str]:
+    """Return collapsed stacks in microseconds for flame-graph tools.
+
+    Each line is ``section_search;<outcome>;<rafter> x <column>;<phase> <us>``,
+    the format read by ``flamegraph.pl`` and speedscope.
+    """
+
+    lines = []
+    for row in profile["trials"]:
+        if "elapsed_s" not in row:
+            continue
+        pair = f"{row['rafter']} x {row['column']}"
+        for phase in (*PHASES, "other"):
+            microseconds = int(round(row[f"{phase}_s"] * 1e6))
+            if microseconds > 0:
+                lines.append(
+                    f"section_search;{row['outcome']};{pair};{phase} "
+                    f"{microseconds}"
+                )
+    return lines
+
+
+def write_search_profile(
+    profile: Mapping[str, Any], path: str | Path
+) -> Path:
+    """Write ``profile`` as JSON, or as collapsed stacks for ``.folded``."""
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".folded":
+        path.write_text("\n".join(folded_stacks(profile)) + "\n", encoding="utf-8")
+    else:
+        path.write_text(json.dumps(dict(profile), indent=2), encoding="utf-8")
+    return path
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from tabulate import tabulate
+
+    parser = argparse.ArgumentParser(
+        description=(
+            "Summarise or export the section-search profile stored in an "
+            "analysis snapshot."
+        )
+    )
+    parser.add_argument("snapshot", help="analysis_results.json")
+    parser.add_argument(
+        "--output", nargs="*", default=[],
+        help="JSON file(s), or .folded file(s) for flame graphs",
+    )
+    parser.add_argument("--top", type=int, default=10)
+    arguments = parser.parse_args()
+
+    snapshot = json.loads(Path(arguments.snapshot).read_text(encoding="utf-8"))
+    search = snapshot.get("search_profile")
+    if not search:
+        raise SystemExit("The snapshot has no search_profile section.")
+    print(profile_summary(search))
+    slowest = sorted(
+        (row for row in search["trials"] if "elapsed_s" in row),
+        key=lambda row: row["elapsed_s"],
+        reverse=True,
+    )[: arguments.top]
+    print(tabulate(
+        [
+            [row["rafter"], row["column"], row["outcome"], row["worker"],
+             row["elapsed_s"], *(row[f"{phase}_s"] for phase in PHASES)]
+            for row in slowest
+        ],
+        headers=["Rafter", "Column", "Outcome", "Worker", "Total s",
+                 *(phase.replace("_", " ") for phase in PHASES)],
+        tablefmt="pretty",
+    ))
+    for output in arguments.output:
+        print(f"Search profile written to {write_search_profile(search, output)}")
@@ -4,8 +4,40 @@ from __future__ import annotations
 
 import math
 import re
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Any, Iterable, Mapping
 
+import numpy as np
+
+from member_actions import _plane_element
+
+
+# Rafter stations, including both ends, at which roof fall is checked.
+DRAINAGE_STATIONS = 13
+# Relative margin within which two magnitudes count as equal, so rounding
+# noise between symmetric nodes does not decide which node is reported.
+TIE_TOLERANCE = 1e-9
+
+
+def _tie_floor(peak):
+    return peak - TIE_TOLERANCE * abs(peak)
+
+
+def first_largest(items: Iterable[Any], key, default=None):
+    """Return the first item whose ``key`` ties with the largest value.
+
+    Values within :data:`TIE_TOLERANCE` of the largest count as ties, so
+    equally loaded nodes always report the first one in order.
+    """
+
+    items = list(items)
+    if not items:
+        return default
+    values = [key(item) for item in items]
+    floor = _tie_floor(max(values))
+    return next(item for item, value in zip(items, values) if value >= floor)
+
 
 def is_permanent_case(case_name: str) -> bool:
     """Return whether a generated load case is a permanent action."""
@@ -30,30 +62,49 @@ def permanent_baseline_name(combination: Mapping[str, Any]) -> str | None:
     factors = permanent_factors(combination)
     if not factors:
         return None
+    return _baseline_name(tuple(sorted(factors.items())))
+
+
+@lru_cache(maxsize=1024)
+def _baseline_name(factors: tuple[tuple[str, float], ...]) -> str:
+    # Crane scenarios repeat a few permanent factor sets many times.
     tokens = []
-    for case, factor in sorted(factors.items()):
+    for case, factor in factors:
         value = f"{factor:.6g}".replace("-", "m").replace(".", "p")
         tokens.append(f"{re.sub(r'[^A-Za-z0-9_]+', '_', case)}_{value}")
     return "__PERMANENT_BASELINE__" + "__".join(tokens)
 
 
+def permanent_baseline_combinations(
+    combinations: Iterable[Mapping[str, Any]],
+) -> list[dict[str, Any]]:
+    """Return each distinct permanent-action baseline as a combination."""
+
+    baselines: dict[str, dict[str, Any]] = {}
+    for combination in combinations:
+        baseline = permanent_baseline_name(combination)
+        if baseline is None or baseline in baselines:
+            continue
+        baselines[baseline] = {
+            "name": baseline,
+            "factors": permanent_factors(combination),
+        }
+    return list(baselines.values())
+
+
 def add_permanent_baseline_combinations(
     frame: Any,
     combinations: Iterable[Mapping[str, Any]],
 ) -> dict[str, str | None]:
     """Add each distinct permanent-action baseline to an FE model."""
 
-    mapping: dict[str, str | None] = {}
-    added: set[str] = set()
-    for combination in combinations:
-        name = str(combination["name"])
-        baseline = permanent_baseline_name(combination)
-        mapping[name] = baseline
-        if baseline is None or baseline in added:
-            continue
-        frame.add_load_combo(baseline, permanent_factors(combination))
-        added.add(baseline)
-    return mapping
+    combinations = list(combinations)
+    for baseline in permanent_baseline_combinations(combinations):
+        frame.add_load_combo(baseline["name"], baseline["factors"])
+    return {
+        str(combination["name"]): permanent_baseline_name(combination)
+        for combination in combinations
+    }
 
 
 def uses_permanent_deflection_baseline(data: Any) -> bool:
@@ -82,6 +133,267 @@ def _result_value(result_map: Any, combination: str | None) -> float:
     return float(value)
 
 
+def _element_deflections(
+    element: Any,
+    distances: np.ndarray,
+    combination_names: list[str],
+    factors: np.ndarray,
+    cases: list[str],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return local ``(dx, dy)`` at ``distances`` for every combination.
+
+    The deflected shape is the cubic Hermite interpolation of the local end
+    displacements plus, for each unit load case, the deflection of the
+    fixed-ended element under that case alone, scaled by its factor.
+    """
+
+    plane = _plane_element(element)
+    length = plane.L()
+    EI, EA = plane.E * plane.Iz, plane.E * plane.A
+    displacements = np.array([
+        [
+            getattr(node, key)[name]
+            for node in (element.i_node, element.j_node)
+            for key in ("DX", "DY", "RZ")
+        ]
+        for name in combination_names
+    ]).reshape(len(combination_names), 6)
+    local = displacements @ plane._rotation().T
+    xi = distances / length
+    dx = local[:, [0]] * (1.0 - xi) + local[:, [3]] * xi
+    dy = (
+        local[:, [1]] * (1.0 - 3.0 * xi ** 2 + 2.0 * xi ** 3)
+        + local[:, [2]] * length * (xi - 2.0 * xi ** 2 + xi ** 3)
+        + local[:, [4]] * (3.0 * xi ** 2 - 2.0 * xi ** 3)
+        + local[:, [5]] * length * (xi ** 3 - xi ** 2)
+    )
+
+    fixed_dx = np.zeros((len(cases), len(distances)))
+    fixed_dy = np.zeros((len(cases), len(distances)))
+    for row, case in enumerate(cases):
+        distributed, points = plane._local_loads({case: 1.0})
+        if not (distributed or points):
+            continue
+        fer = plane.case_fer(case)
+        segments = plane._march(
+            (fer[0], fer[1], fer[2], 0.0, 0.0, 0.0), distributed, points
+        )
+        starts = [round(segment.x1, 10) for segment in segments]
+        for column, x in enumerate(distances):
+            index = max(bisect_right(starts, round(float(x), 10)) - 1, 0)
+            segment = segments[index]
+            fixed_dx[row, column] = segment.axial_deflection(
+                x - segment.x1, EA
+            )
+            fixed_dy[row, column] = segment.deflection(x - segment.x1, EI)
+    return dx + factors @ fixed_dx, dy + factors @ fixed_dy
+
+
+def _physical_deflections(
+    frame: Any,
+    physical: Any,
+    distances: np.ndarray,
+    combination_names: list[str],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return local ``(dx, dy)`` along a physical member for all combinations.
+
+    Stations are assigned to sub-members as ``PhysMember.find_member`` does
+    and each sub-member is evaluated once for all of its stations.
+    """
+
+    combination_factors = [
+        frame.load_combos[name].factors for name in combination_names
+    ]
+    cases = sorted({case for combo in combination_factors for case in combo})
+    factors = np.array([
+        [combo.get(case, 0.0) for case in cases]
+        for combo in combination_factors
+    ]).reshape(len(combination_names), len(cases))
+
+    sub_members = list(getattr(physical, "sub_members", {}).values())
+    elements = sub_members or [physical]
+    located: dict[int, tuple[list[int], list[float]]] = {}
+    for column, x in enumerate(distances):
+        total = 0.0
+        for index, element in enumerate(elements):
+            total += element.L()
+            if x < total or (
+                math.isclose(x, total) and index == len(elements) - 1
+            ):
+                columns, offsets = located.setdefault(index, ([], []))
+                columns.append(column)
+                offsets.append(x - (total - element.L()))
+                break
+        else:
+            raise ValueError(
+                f"Location x={x} does not lie on member {physical.name}"
+            )
+
+    dx = np.zeros((len(combination_names), len(distances)))
+    dy = np.zeros_like(dx)
+    for index, (columns, offsets) in located.items():
+        dx[:, columns], dy[:, columns] = _element_deflections(
+            elements[index],
+            np.array(offsets),
+            combination_names,
+            factors,
+            cases,
+        )
+    return dx, dy
+
+
+def _queried_deflections(
+    physical: Any,
+    distances: np.ndarray,
+    combination_names: list[str],
+    cos_z: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return local deflections through the member API, station by station."""
+
+    values = np.array([
+        [
+            [
+                float(physical.deflection(component, float(x), name))
+                for component in ("dx", "dy", "dz")
+            ]
+            for x in distances
+        ]
+        for name in combination_names
+    ]).reshape(len(combination_names), len(distances), 3)
+    return values[..., 0], values[..., 1], values[..., 2] * cos_z[1]
+
+
+def _rafter_ordinates(
+    frame: Any,
+    data: Any,
+    member: Any,
+    combination_names: list[str],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return station positions, original and deformed global ordinates.
+
+    The deformed ordinates are a ``(combinations, stations)`` array. Members
+    with end releases or a rotation about their axis are queried through the
+    member API; other members are evaluated in closed form.
+    """
+
+    physical = getattr(frame, "members", {}).get(str(member.name))
+    if physical is None or not hasattr(physical, "deflection"):
+        i_data = data.nodes[str(member.i_node)]
+        j_data = data.nodes[str(member.j_node)]
+        i_node = frame.nodes[str(member.i_node)]
+        j_node = frame.nodes[str(member.j_node)]
+        distances = np.array([0.0, float(getattr(member, "length", 1.0))])
+        original = np.array([float(i_data.y), float(j_data.y)])
+        displacement = np.array([
+            [
+                _result_value(i_node.DY, name),
+                _result_value(j_node.DY, name),
+            ]
+            for name in combination_names
+        ]).reshape(len(combination_names), 2)
+        return distances, original, original + displacement
+
+    transform = physical.T()
+    cos_x = np.array([float(transform[0, index]) for index in range(3)])
+    cos_y = np.array([float(transform[1, index]) for index in range(3)])
+    cos_z = np.array([float(transform[2, index]) for index in range(3)])
+    length = float(physical.L())
+    distances = np.array([
+        length * index / (DRAINAGE_STATIONS - 1.0)
+        for index in range(DRAINAGE_STATIONS)
+    ])
+    original = float(physical.i_node.Y) + distances * cos_x[1]
+    elements = [physical, *getattr(physical, "sub_members", {}).values()]
+    released = any(
+        any(getattr(element, "Releases", ())) for element in elements
+    )
+    if released or getattr(physical, "rotation", 0.0) or cos_z[1]:
+        dx, dy, out_of_plane = _queried_deflections(
+            physical, distances, combination_names, cos_z
+        )
+    else:
+        dx, dy = _physical_deflections(
+            frame, physical, distances, combination_names
+        )
+        out_of_plane = 0.0
+    global_dy = dx * cos_x[1] + dy * cos_y[1] + out_of_plane
+    return distances, original, original + global_dy
+
+
+def roof_drainage_checks(
+    frame: Any,
+    data: Any,
+    combination_names: Iterable[str],
+) -> dict[str, dict[str, Any]]:
+    """Return :func:`roof_drainage_check` for several combinations at once.
+
+    The deformed rafter ordinates at every station are computed for all
+    combinations together, so each rafter element is processed once.
+    """
+
+    names = [str(name) for name in combination_names]
+    checked = 0
+    minimum_remaining_fall = np.full(len(names), math.inf)
+    failures: list[list[dict[str, Any]]] = [[] for _ in names]
+    for member in data.members:
+        if str(member.type).lower() != "rafter":
+            continue
+        distances, original, deformed = _rafter_ordinates(
+            frame, data, member, names
+        )
+        original_delta_y = np.diff(original)
+        deformed_delta_y = np.diff(deformed, axis=1)
+        sloped = np.abs(original_delta_y) > 1e-9
+        remaining_fall = np.sign(original_delta_y) * deformed_delta_y
+        checked += int(np.count_nonzero(sloped))
+        minimum_remaining_fall = np.minimum(
+            minimum_remaining_fall,
+            np.min(
+                np.where(
+                    sloped & ~np.isnan(remaining_fall),
+                    remaining_fall,
+                    math.inf,
+                ),
+                axis=1,
+                initial=math.inf,
+            ),
+        )
+        reversed_segments = sloped & (
+            ~np.isfinite(deformed_delta_y) | (remaining_fall <= 0.0)
+        )
+        for row, segment in zip(*np.nonzero(reversed_segments)):
+            failures[row].append({
+                "member": str(member.name),
+                "sample_segment": int(segment) + 1,
+                "start_x_mm": float(distances[segment]),
+                "end_x_mm": float(distances[segment + 1]),
+                "i_node": str(member.i_node),
+                "j_node": str(member.j_node),
+                "original_delta_y_mm": float(original_delta_y[segment]),
+                "deformed_delta_y_mm": float(deformed_delta_y[row, segment]),
+                "remaining_fall_mm": float(remaining_fall[row, segment]),
+            })
+    return {
+        name: {
+            "status": "PASS" if not failures[row] else "FAIL",
+            "combination": name,
+            "checked_rafter_segments": checked,
+            "samples_per_member": DRAINAGE_STATIONS,
+            "minimum_remaining_fall_mm": (
+                float(minimum_remaining_fall[row])
+                if math.isfinite(minimum_remaining_fall[row])
+                else None
+            ),
+            "reversed_segments": failures[row],
+            "criterion": (
+                "Every deformed rafter segment must retain the sign of its "
+                "original roof fall under the total serviceability combination."
+            ),
+        }
+        for row, name in enumerate(names)
+    }
+
+
 def roof_drainage_check(
     frame: Any,
     data: Any,
@@ -95,167 +407,106 @@ def roof_drainage_check(
     treated as a ponding risk.
     """
 
-    failures = []
-    checked = 0
-    minimum_remaining_fall = math.inf
-    for member in data.members:
-        if str(member.type).lower() != "rafter":
-            continue
-        points = []
-        physical = getattr(frame, "members", {}).get(str(member.name))
-        if physical is not None and hasattr(physical, "deflection"):
-            transform = physical.T()
-            cos_x = [float(transform[0, index]) for index in range(3)]
-            cos_y = [float(transform[1, index]) for index in range(3)]
-            cos_z = [float(transform[2, index]) for index in range(3)]
-            origin = [
-                float(physical.i_node.X),
-                float(physical.i_node.Y),
-                float(physical.i_node.Z),
-            ]
-            length = float(physical.L())
-            for index in range(13):
-                distance = length * index / 12.0
-                local = [
-                    float(
-                        physical.deflection(
-                            component, distance, combination_name
-                        )
-                    )
-                    for component in ("dx", "dy", "dz")
-                ]
-                global_dy = (
-                    local[0] * cos_x[1]
-                    + local[1] * cos_y[1]
-                    + local[2] * cos_z[1]
-                )
-                original_y = origin[1] + distance * cos_x[1]
-                points.append((distance, original_y, original_y + global_dy))
-        if not points:
-            i_data = data.nodes[str(member.i_node)]
-            j_data = data.nodes[str(member.j_node)]
-            i_node = frame.nodes[str(member.i_node)]
-            j_node = frame.nodes[str(member.j_node)]
-            points = [
-                (
-                    0.0,
-                    float(i_data.y),
-                    float(i_data.y)
-                    + _result_value(i_node.DY, combination_name),
-                ),
-                (
-                    float(getattr(member, "length", 1.0)),
-                    float(j_data.y),
-                    float(j_data.y)
-                    + _result_value(j_node.DY, combination_name),
-                ),
-            ]
-        for segment_index, (start, end) in enumerate(
-            zip(points, points[1:]), 1
-        ):
-            original_delta_y = end[1] - start[1]
-            if abs(original_delta_y) <= 1e-9:
-                continue
-            deformed_delta_y = end[2] - start[2]
-            remaining_fall = (
-                math.copysign(1.0, original_delta_y) * deformed_delta_y
-            )
-            minimum_remaining_fall = min(
-                minimum_remaining_fall, remaining_fall
-            )
-            checked += 1
-            if not math.isfinite(deformed_delta_y) or remaining_fall <= 0.0:
-                failures.append({
-                    "member": str(member.name),
-                    "sample_segment": segment_index,
-                    "start_x_mm": start[0],
-                    "end_x_mm": end[0],
-                    "i_node": str(member.i_node),
-                    "j_node": str(member.j_node),
-                    "original_delta_y_mm": original_delta_y,
-                    "deformed_delta_y_mm": deformed_delta_y,
-                    "remaining_fall_mm": remaining_fall,
-                })
-    return {
-        "status": "PASS" if not failures else "FAIL",
-        "combination": combination_name,
-        "checked_rafter_segments": checked,
-        "samples_per_member": 13,
-        "minimum_remaining_fall_mm": (
-            minimum_remaining_fall
-            if math.isfinite(minimum_remaining_fall)
-            else None
-        ),
-        "reversed_segments": failures,
-        "criterion": (
-            "Every deformed rafter segment must retain the sign of its "
-            "original roof fall under the total serviceability combination."
-        ),
-    }
+    return roof_drainage_checks(frame, data, [combination_name])[
+        str(combination_name)
+    ]
+
+
+def _governing_nodes(magnitudes: np.ndarray) -> np.ndarray:
+    """Return each row's first node of largest positive magnitude, else -1.
+
+    Nodes within :data:`TIE_TOLERANCE` of the row's largest magnitude tie.
+    """
+
+    if magnitudes.shape[1] == 0:
+        return np.full(magnitudes.shape[0], -1)
+    peak = magnitudes.max(axis=1)
+    index = np.argmax(magnitudes >= _tie_floor(peak)[:, None], axis=1)
+    return np.where(peak > 0.0, index, -1)
 
 
 def serviceability_deflection_rows(
     frame: Any,
     data: Any,
 ) -> list[dict[str, Any]]:
-    """Return total, permanent, and incremental-variable SLS deflections."""
+    """Return total, permanent, and incremental-variable SLS deflections.
+
+    Nodal displacements of every combination and its permanent baseline are
+    gathered into ``(combinations, nodes)`` arrays and the governing nodes
+    are found by array reductions.
+    """
 
     rows = []
     use_baseline = uses_permanent_deflection_baseline(data)
-    for combination in data.serviceability_load_combinations:
-        name = str(combination["name"])
-        baseline = permanent_baseline_name(combination)
-        max_dx = max_total_dy = max_permanent_dy = max_variable_dy = 0.0
-        dx_node = total_dy_node = permanent_dy_node = variable_dy_node = ""
-        governing_total_dy = governing_permanent_dy = 0.0
-        governing_variable_dy = 0.0
-        total_node_values = (0.0, 0.0, 0.0)
-        for node_name, node in frame.nodes.items():
-            dx = abs(_result_value(node.DX, name))
-            total_dy_value = _result_value(node.DY, name)
-            permanent_dy_value = _result_value(node.DY, baseline)
-            variable_dy_value = total_dy_value - permanent_dy_value
-            total_dy = abs(total_dy_value)
-            permanent_dy = abs(permanent_dy_value)
-            variable_dy = abs(variable_dy_value)
-            values = (dx, total_dy, permanent_dy, variable_dy)
-            if not all(math.isfinite(value) for value in values):
-                raise ValueError(
-                    f"Non-finite serviceability displacement in {name}."
-                )
-            if dx > max_dx:
-                max_dx, dx_node = dx, str(node_name)
-            if total_dy > max_total_dy:
-                max_total_dy, total_dy_node = total_dy, str(node_name)
-                total_node_values = (
-                    total_dy_value,
-                    permanent_dy_value,
-                    variable_dy_value,
-                )
-            if permanent_dy > max_permanent_dy:
-                max_permanent_dy = permanent_dy
-                permanent_dy_node = str(node_name)
-            if variable_dy > max_variable_dy:
-                max_variable_dy = variable_dy
-                variable_dy_node = str(node_name)
-                governing_total_dy = total_dy_value
-                governing_permanent_dy = permanent_dy_value
-                governing_variable_dy = variable_dy_value
+    combinations = list(data.serviceability_load_combinations)
+    names = [str(combination["name"]) for combination in combinations]
+    baselines = [
+        permanent_baseline_name(combination) for combination in combinations
+    ]
+    node_names = [str(node_name) for node_name in frame.nodes]
+    nodes = list(frame.nodes.values())
+    shape = (len(names), len(nodes))
+    dx_values = np.array([
+        [_result_value(node.DX, name) for node in nodes] for name in names
+    ]).reshape(shape)
+    total_values = np.array([
+        [_result_value(node.DY, name) for node in nodes] for name in names
+    ]).reshape(shape)
+    permanent_values = np.array([
+        [_result_value(node.DY, baseline) for node in nodes]
+        for baseline in baselines
+    ]).reshape(shape)
+    variable_values = total_values - permanent_values
+    magnitudes = [
+        np.abs(values)
+        for values in (
+            dx_values, total_values, permanent_values, variable_values
+        )
+    ]
+    finite = np.all(
+        [np.isfinite(values) for values in magnitudes], axis=(0, 2)
+    )
+    if not np.all(finite):
+        name = names[int(np.argmin(finite))]
+        raise ValueError(f"Non-finite serviceability displacement in {name}.")
+    dx_nodes, total_nodes, permanent_nodes, variable_nodes = (
+        _governing_nodes(values) for values in magnitudes
+    )
+    drainage = roof_drainage_checks(frame, data, names)
+
+    def at(values, row, column):
+        return float(values[row, column]) if column >= 0 else 0.0
+
+    def node(column):
+        return node_names[column] if column >= 0 else ""
+
+    for row, (name, baseline) in enumerate(zip(names, baselines)):
+        dx_node, total_node = dx_nodes[row], total_nodes[row]
+        permanent_node = permanent_nodes[row]
+        variable_node = variable_nodes[row]
+        total_node_values = (
+            at(total_values, row, total_node),
+            at(permanent_values, row, total_node),
+            at(variable_values, row, total_node),
+        )
+        variable_node_values = (
+            at(total_values, row, variable_node),
+            at(permanent_values, row, variable_node),
+            at(variable_values, row, variable_node),
+        )
+        max_total_dy = at(magnitudes[1], row, total_node)
+        max_variable_dy = at(magnitudes[3], row, variable_node)
         if use_baseline:
             checked_max_dy = max_variable_dy
-            checked_dy_node = variable_dy_node
-            checked_values = (
-                governing_total_dy,
-                governing_permanent_dy,
-                governing_variable_dy,
-            )
+            checked_dy_node = node(variable_node)
+            checked_values = variable_node_values
             basis = (
                 "Incremental variable-action deflection relative to the "
                 "matching permanent-action baseline."
             )
         else:
             checked_max_dy = max_total_dy
-            checked_dy_node = total_dy_node
+            checked_dy_node = node(total_node)
             checked_values = total_node_values
             basis = (
                 "Total serviceability deflection including permanent and "
@@ -264,22 +515,22 @@ def serviceability_deflection_rows(
         rows.append({
             "load_combination": name,
             "permanent_baseline_combination": baseline or "Zero permanent action",
-            "max_dx": max_dx,
-            "dx_node": dx_node,
+            "max_dx": at(magnitudes[0], row, dx_node),
+            "dx_node": node(dx_node),
             "max_dy": checked_max_dy,
             "dy_node": checked_dy_node,
             "total_max_dy": max_total_dy,
-            "total_dy_node": total_dy_node,
-            "permanent_max_dy": max_permanent_dy,
-            "permanent_dy_node": permanent_dy_node,
-            "total_dy_at_variable_node": governing_total_dy,
-            "permanent_dy_at_variable_node": governing_permanent_dy,
-            "variable_dy_at_variable_node": governing_variable_dy,
+            "total_dy_node": node(total_node),
+            "permanent_max_dy": at(magnitudes[2], row, permanent_node),
+            "permanent_dy_node": node(permanent_node),
+            "total_dy_at_variable_node": variable_node_values[0],
+            "permanent_dy_at_variable_node": variable_node_values[1],
+            "variable_dy_at_variable_node": variable_node_values[2],
             "total_dy_at_checked_node": checked_values[0],
             "permanent_dy_at_checked_node": checked_values[1],
             "variable_dy_at_checked_node": checked_values[2],
             "uses_permanent_deflection_baseline": use_baseline,
             "vertical_deflection_basis": basis,
-            "roof_drainage": roof_drainage_check(frame, data, name),
+            "roof_drainage": drainage[name],
         })
     return rows
@@ -1,6 +1,7 @@
 import math
 import member_database as mdb
 import json
+import numpy as np
 
 def member_class_details(Cu, member_prop, grade):
     """Return the flange/web classification calculation and governing class."""
@@ -246,6 +247,120 @@ def member_design(mb, mem, mat_prop):
 
     return CSS, OMS, LTB
 
+def _python_round(values, digits):
+    """Round like the scalar path; ``np.round`` can differ on binary ties."""
+    return np.array(
+        [round(float(value), digits) for value in values.ravel()]
+    ).reshape(values.shape)
+
+
+def member_design_grid(Cu, Mx_max, Mx_top, Mx_bot, klx, kly, sections, mat_prop):
+    """Vectorised ``member_design`` over a combination x segment grid.
+
+    ``Cu`` and the three moments are arrays of one shape, usually
+    ``(combinations, segments)``. ``klx``, ``kly`` and each value of
+    ``sections`` (the member property keys used by the scalar checks) must
+    broadcast against them, usually as ``(segments,)``. Class and omega2 are
+    derived exactly as in ``member_class_details`` and
+    ``element_property_details``. Returns ``CSS, OMS, (LTB1, LTB2)`` arrays;
+    tension members follow ``tension_and_bending``. Divisions by zero give
+    non-finite ratios instead of raising.
+    """
+    fy = mat_prop['fy']
+    E = mat_prop['E']
+    G = mat_prop['G']
+    Cu = np.asarray(Cu, dtype=float)
+    Mx_max = np.asarray(Mx_max, dtype=float)
+    Mx_top = np.asarray(Mx_top, dtype=float)
+    Mx_bot = np.asarray(Mx_bot, dtype=float)
+    klx = np.asarray(klx, dtype=float)
+    kly = np.asarray(kly, dtype=float)
+    mb = {key: np.asarray(value, dtype=float) for key, value in sections.items()}
+    b, h, tf, tw, A = mb['b'], mb['h'], mb['tf'], mb['tw'], mb['A']
+    Zplx = mb['Zplx']
+    Zex = mb.get('Zex', Zplx)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # member_class_details
+        flange_ratio = b / (2 * tf)
+        fl_cl = np.select(
+            [flange_ratio < limit / math.sqrt(fy) for limit in (145, 170, 200)],
+            [1, 2, 3],
+            4,
+        )
+        web_ratio = (h - 2 * tf) / tw
+        compression_ratio = np.maximum(Cu, 0.0) / (0.9 * (A * fy))
+        cl_w = np.select(
+            [
+                web_ratio < (limit / math.sqrt(fy)) * (1 - coeff * compression_ratio)
+                for limit, coeff in ((1100, 0.39), (1700, 0.61), (1900, 0.65))
+            ],
+            [1, 2, 3],
+            4,
+        )
+        compact = np.maximum(fl_cl, cl_w) < 3
+
+        # element_property_details
+        top_governs_min = np.abs(Mx_top) <= np.abs(Mx_bot)
+        m_min = np.where(top_governs_min, Mx_top, Mx_bot)
+        m_max = np.where(np.abs(Mx_top) >= np.abs(Mx_bot), Mx_top, Mx_bot)
+        kappa = np.where(np.abs(m_max) > 1e-12, -m_min / m_max, 0.0)
+        w1 = 1.0
+        intermediate_peak = (Mx_max > np.abs(Mx_top) * 1.1) & (
+            Mx_max > np.abs(Mx_bot) * 1.1
+        )
+        w2 = np.where(
+            intermediate_peak,
+            1.0,
+            np.minimum(1.75 + 1.05 * kappa + 0.3 * kappa ** 2, 2.5),
+        )
+        w2 = _python_round(w2, 4)
+
+        # section_properties
+        Zx = np.where(compact, Zplx, Zex)
+        lamda_x = (klx * 1000 / mb['rx']) * math.sqrt(fy / ((math.pi ** 2) * (E * 10 ** 3)))
+        lamda_y = (kly * 1000 / mb['ry']) * math.sqrt(fy / ((math.pi ** 2) * (E * 10 ** 3)))
+        Cr = 0.9 * A * fy
+        Crx = 0.9 * A * fy * (1 + lamda_x ** (2 * 1.34)) ** (-1 / 1.34)
+        Cry = 0.9 * A * fy * (1 + lamda_y ** (2 * 1.34)) ** (-1 / 1.34)
+        Cex = math.pi ** 2 * E * mb['Ix'] / (klx ** 2)
+        Mrx = 0.9 * fy * Zx / 1000
+
+        # ltb_properties
+        Iy, Cw, J = mb['Iy'], mb['Cw'], mb['J']
+        i1 = E * 10 ** 3 * (Iy * 10 ** 6) * G * 10 ** 3 * J * 10 ** 3
+        i2 = ((math.pi * (E * 10 ** 3) / (kly / 10 ** 3)) ** 2 * Iy * 10 ** 3 * Cw)
+        i3 = (w2 * math.pi / kly) / 1000
+        Mcr = i3 * ((i1 + i2) ** 0.5) / 10 ** 6
+        Mi = np.where(compact, fy * Zplx / 1000, fy * Zex / 1000)
+        Mrx_ltb = np.where(
+            Mcr > 0.67 * Mi,
+            np.minimum(1.15 * 0.9 * Mi * (1 - (0.28 * Mi / Mcr)), 0.9 * Mi),
+            0.9 * Mcr,
+        )
+
+        # cross_sectional_strength, overall_member_strength and
+        # lateral_torsional_buckling
+        Mx = np.abs(Mx_max)
+        m_fac = np.where(compact, 0.85, 1.0)
+        U1x = w1 / (1 - (Cu / Cex))
+        U1x_min = np.maximum(1, U1x)
+        CSS = (Cu / Cr) + m_fac * U1x_min * Mx / Mrx
+        OMS = (Cu / Crx) + m_fac * U1x * Mx / Mrx
+        LTB1 = (Cu / Cry) + m_fac * U1x_min * Mx / Mrx_ltb
+        LTB2 = Mx / Mrx_ltb
+
+        # tension_and_bending
+        Tu = np.abs(Cu)
+        cross_section = Tu / Cr + Mx / Mrx
+        ltb_stress = np.maximum(0.0, Mx / Mrx_ltb - Tu * Zx / (Mrx_ltb * A))
+
+    tension = Cu < 0
+    CSS = np.where(tension, cross_section, CSS)
+    OMS = np.where(tension, cross_section, OMS)
+    LTB1 = np.where(tension, ltb_stress, LTB1)
+    return CSS, OMS, (LTB1, LTB2)
+
 # member_db = mdb.load_member_database()
 # mem_props = mdb.member_properties("I-Sections", '457x191x74', member_db)
 # mem = {'Name': 'M1', 'kly': 3.5, 'klx': 8.4, 'type': 'column', 'section': '457x191x74', 'Cu': 30.571,
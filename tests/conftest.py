@@ -0,0 +1,78 @@
+"""Shared fixtures for the engine regression tests.
+
+The tests run against the benchmark fixtures in ``benchmarks/fixtures`` and
+the section catalogue in the repository root, which the engine opens by a
+relative path.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from benchmarks.run import load_fixture  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def repository_root():
+    """Run every test from the repository root."""
+
+    previous = Path.cwd()
+    os.chdir(ROOT)
+    try:
+        yield ROOT
+    finally:
+        os.chdir(previous)
+
+
+@pytest.fixture(scope="session")
+def member_db(repository_root):
+    import member_database as mdb
+
+    return mdb.load_member_database()
+
+
+def portal_data(name):
+    """Return the analysis input of benchmark fixture ``name``."""
+
+    from run_full_analysis import model_builder
+
+    payload = load_fixture(name)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return model_builder(
+            payload["building_data"], payload["wind_data"]
+        ).portal_frame()
+
+
+def write_portal_input(name, path):
+    """Write the analysis input of benchmark fixture ``name`` to ``path``."""
+
+    from run_full_analysis import model_builder
+
+    payload = load_fixture(name)
+    with contextlib.redirect_stdout(io.StringIO()):
+        model_builder(payload["building_data"], payload["wind_data"]).write(
+            path
+        )
+    return path
+
+
+def section_pair(member_db, rafter, column):
+    """Return the catalogue properties of a rafter/column pair."""
+
+    import member_database as mdb
+
+    return (
+        mdb.member_properties("I-Sections", rafter, member_db),
+        mdb.member_properties("I-Sections", column, member_db),
+    )
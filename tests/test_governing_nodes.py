@@ -0,0 +1,30 @@
+"""Reported governing nodes do not depend on rounding noise."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from serviceability_deflection import _governing_nodes, first_largest
+
+
+def test_first_largest_prefers_the_first_of_tied_items():
+    reactions = [("N1", -62.6425020629947), ("N7", -62.642502062981876)]
+
+    assert first_largest(reactions, key=lambda item: abs(item[1]))[0] == "N1"
+    assert first_largest(
+        reversed(reactions), key=lambda item: abs(item[1])
+    )[0] == "N7"
+    assert first_largest([("N1", 1.0), ("N7", 1.001)], key=lambda i: i[1]) == (
+        "N7", 1.001
+    )
+    assert first_largest([], key=abs) is None
+
+
+def test_governing_nodes_break_ties_by_node_order():
+    magnitudes = np.array([
+        [0.0, 12.5, 3.0, 12.5 * (1 + 1e-13)],
+        [0.0, 12.5, 3.0, 12.6],
+        [0.0, 0.0, 0.0, 0.0],
+    ])
+
+    assert _governing_nodes(magnitudes).tolist() == [1, 3, -1]
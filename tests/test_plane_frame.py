@@ -0,0 +1,122 @@
+"""Plane-frame engine results against PyNite's FEModel3D."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+
+import pytest
+from Pynite import FEModel3D
+
+import portal_frame_analysis as pfa
+from conftest import portal_data, section_pair
+from load_superposition import compare_combination_results
+from plane_frame import PlaneFrame
+
+
+TOLERANCE = 1e-6
+
+# Fixture and the section pair it selects. Every fixture carries distributed
+# roof and wall loads; crawl_beam_heavy adds member point loads from the
+# crawl beam, large_span_haunched tapered haunches and mono_pitch pinned
+# rather than spring bases.
+CASES = {
+    "small_duo_pitch": ("254x146x37", "305x165x40"),
+    "large_span_haunched": ("533x210x109", "533x210x92"),
+    "crawl_beam_heavy": ("457x191x74", "457x191x74"),
+    "mono_pitch": ("305x165x40", "356x171x51"),
+}
+
+
+def _assert_agrees(comparison):
+    summary = comparison["summary"]
+    assert summary["combinations"] > 0
+    assert summary["status"] == "PASS", [
+        row for row in comparison["combinations"] if row["status"] != "PASS"
+    ]
+    assert summary["max_relative_difference"] < TOLERANCE
+
+
+@pytest.mark.parametrize("fixture", sorted(CASES))
+def test_plane_frame_matches_pynite(fixture, member_db):
+    r_mem, c_mem = section_pair(member_db, *CASES[fixture])
+
+    comparison = pfa.plane_frame_regression_check(
+        r_mem, c_mem, portal_data(fixture), tolerance=TOLERANCE
+    )
+
+    _assert_agrees(comparison)
+
+
+# A spring/fixed-base portal carrying every load type the engine supports.
+NODES = {
+    "A": (0.0, 0.0), "B": (0.0, 5.0), "C": (6.0, 6.0),
+    "D": (12.0, 5.0), "E": (12.0, 0.0),
+}
+MEMBERS = {
+    "left": ("A", "B"), "rafter1": ("B", "C"),
+    "rafter2": ("C", "D"), "right": ("D", "E"),
+}
+E, A, IZ = 210e6, 5.0e-3, 1.2e-4
+DISTRIBUTED = [
+    ("rafter1", "FY", -4.0, -4.0, None, None, "G"),
+    ("rafter2", "FY", -4.0, -4.0, None, None, "G"),
+    ("rafter1", "Fy", -2.0, -6.0, 1.0, 4.5, "W"),
+    ("left", "Fy", 3.0, 3.0, None, None, "W"),
+]
+POINTS = [("rafter2", "FY", -15.0, 2.0, "G"), ("right", "Fy", 8.0, 3.5, "W")]
+COMBINATIONS = [
+    {"name": "ULS", "factors": {"G": 1.35, "W": 1.5}},
+    {"name": "SLS", "factors": {"G": 1.0, "W": 1.0}},
+]
+
+
+def _apply_loads(model):
+    for member, direction, w1, w2, x1, x2, case in DISTRIBUTED:
+        model.add_member_dist_load(member, direction, w1, w2, x1, x2, case)
+    for member, direction, P, x, case in POINTS:
+        model.add_member_pt_load(member, direction, P, x, case)
+    model.add_node_load("D", "FX", 5.0, "W")
+    for combination in COMBINATIONS:
+        model.add_load_combo(combination["name"], combination["factors"])
+
+
+def _pynite_frame():
+    model = FEModel3D()
+    model.add_material("Steel", E, 81e6, 0.3, 78.5)
+    model.add_section("Section", A, 1.0e-6, IZ, 1.0e-7)
+    for name, (x, y) in NODES.items():
+        model.add_node(name, x, y, 0.0)
+    model.def_support("A", True, True, True, True, True, False)
+    model.def_support_spring("A", "RZ", 10000.0)
+    model.def_support("E", True, True, True, True, True, True)
+    for name, (i_node, j_node) in MEMBERS.items():
+        model.add_member(name, i_node, j_node, "Steel", "Section")
+    _apply_loads(model)
+    return model
+
+
+def _plane_frame():
+    model = PlaneFrame()
+    for name, (x, y) in NODES.items():
+        model.add_node(name, x, y)
+    model.def_support("A", True, True, False)
+    model.def_support_spring("A", "RZ", 10000.0)
+    model.def_support("E", True, True, True)
+    for name, (i_node, j_node) in MEMBERS.items():
+        model.add_member(name, i_node, j_node, E, A, IZ)
+    _apply_loads(model)
+    return model
+
+
+def test_plane_frame_matches_pynite_point_and_distributed_loads():
+    reference = _pynite_frame()
+    candidate = _plane_frame()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        reference.analyze(check_statics=False)
+    candidate.analyze()
+
+    _assert_agrees(compare_combination_results(
+        reference, candidate, COMBINATIONS, tolerance=TOLERANCE
+    ))
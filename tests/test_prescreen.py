@@ -0,0 +1,61 @@
+"""Closed-form pre-screen audits and its opt-in use in the section search."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+
+import pytest
+
+import portal_frame_analysis as pfa
+from conftest import portal_data, write_portal_input
+
+
+# Fixture and the number of lightest compatible pairs audited.
+AUDITS = {
+    "small_duo_pitch": None,
+    "mono_pitch": 150,
+    "crawl_beam_heavy": 150,
+    "large_span_haunched": 60,
+}
+
+
+@pytest.mark.parametrize("fixture", sorted(AUDITS))
+def test_prescreen_never_rejects_a_passing_pair(fixture, tmp_path):
+    input_path = write_portal_input(fixture, tmp_path / "input_data.json")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        audit = pfa.prescreen_audit(
+            input_path, pfa.DEFAULT_PRESCREEN_MARGIN, AUDITS[fixture]
+        )
+
+    summary = audit["summary"]
+    assert summary["prescreen_rejections"] > 0
+    assert summary["false_rejections"] == 0, [
+        row for row in audit["pairs"] if row["false_rejection"]
+    ]
+
+
+def _search(data, **options):
+    with contextlib.redirect_stdout(io.StringIO()):
+        frame, *_, sections = pfa.sls_check(
+            "Yes", "I-Sections", "I-Sections",
+            input_path=None, use_trial_cache=False, workers=1, data=data,
+            **options,
+        )
+    return sections, frame._portal_search_profile
+
+
+def test_prescreen_rejection_is_opt_in(member_db):
+    data = portal_data("small_duo_pitch")
+
+    default_sections, default_profile = _search(data, member_db=member_db)
+    screened_sections, screened_profile = _search(
+        data,
+        member_db=member_db,
+        prescreen_margin=pfa.DEFAULT_PRESCREEN_MARGIN,
+    )
+
+    assert default_profile["prescreen_rejected"] == 0
+    assert screened_profile["prescreen_rejected"] > 0
+    assert screened_sections == default_sections
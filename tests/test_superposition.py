@@ -0,0 +1,76 @@
+"""Superposed combination results against PyNite's per-combination solve."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+
+import pytest
+
+import portal_frame_analysis as pfa
+from conftest import portal_data, section_pair
+
+
+TOLERANCE = 1e-6
+
+# Fixture, winning pair and a window of neighbouring catalogue sections.
+CASES = {
+    "small_duo_pitch": (
+        ("254x146x37", "305x165x40"),
+        ("254x146x31", "254x146x37", "305x165x40"),
+        ("254x146x37", "305x165x40", "254x146x43"),
+    ),
+    "large_span_haunched": (
+        ("533x210x109", "533x210x92"),
+        ("533x210x101", "533x210x109"),
+        ("533x210x82", "533x210x92"),
+    ),
+}
+
+
+@pytest.mark.parametrize("fixture", sorted(CASES))
+def test_superposition_matches_direct_solve(fixture, member_db):
+    (rafter, column), _, _ = CASES[fixture]
+    r_mem, c_mem = section_pair(member_db, rafter, column)
+
+    comparison = pfa.superposition_regression_check(
+        r_mem, c_mem, portal_data(fixture), tolerance=TOLERANCE
+    )
+
+    summary = comparison["summary"]
+    assert summary["combinations"] > 0
+    assert summary["status"] == "PASS", [
+        row for row in comparison["combinations"] if row["status"] != "PASS"
+    ]
+    assert summary["max_relative_difference"] < TOLERANCE
+
+
+def _lightest_pair(data, solver, rafters, columns, member_db):
+    r_total_m, c_total_m = pfa.get_member_lengths(data)
+    settings = data.frame_data[0]
+    with contextlib.redirect_stdout(io.StringIO()):
+        best = pfa.directional_search(
+            "rafter", list(rafters), list(columns),
+            "I-Sections", "I-Sections", member_db, data,
+            r_total_m, c_total_m,
+            settings["gable_width"] / 180, settings["eaves_height"] / 180,
+            1,
+            solver=solver,
+        )
+    return best["r_name"], best["c_name"], best["weight"]
+
+
+@pytest.mark.parametrize("fixture", sorted(CASES))
+def test_solvers_select_the_same_sections(fixture, member_db):
+    winner, rafters, columns = CASES[fixture]
+    data = portal_data(fixture)
+
+    direct = _lightest_pair(
+        data, pfa.SOLVER_DIRECT, rafters, columns, member_db
+    )
+    superposed = _lightest_pair(
+        data, pfa.SOLVER_SUPERPOSITION, rafters, columns, member_db
+    )
+
+    assert direct[:2] == winner
+    assert superposed == direct
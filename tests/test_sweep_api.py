@@ -0,0 +1,92 @@
+"""The ``/api/sweep`` job through the analysis job endpoints."""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import pytest
+
+if sys.version_info < (3, 12):
+    # connection_report.py, imported by the backend, uses PEP 701 f-strings.
+    pytest.skip("The backend needs Python 3.12 or later.", allow_module_level=True)
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from backend import analysis_service  # noqa: E402
+from backend.main import app  # noqa: E402
+from conftest import load_fixture  # noqa: E402
+
+
+SWEEP_TIMEOUT_S = 900
+
+
+@pytest.fixture(scope="module")
+def sweep_job(tmp_path_factory):
+    """Run one two-variant sweep of the small duo-pitch fixture."""
+
+    jobs_root = analysis_service.JOBS_ROOT
+    analysis_service.JOBS_ROOT = tmp_path_factory.mktemp("jobs")
+    try:
+        client = TestClient(app)
+        payload = load_fixture("small_duo_pitch")
+        payload["parameters"] = {"span": [16000, 18000]}
+        payload["keep_snapshots"] = "best"
+        response = client.post("/api/sweep", json=payload)
+        assert response.status_code == 202, response.text
+        job = response.json()
+        assert job["kind"] == "sweep"
+
+        deadline = time.monotonic() + SWEEP_TIMEOUT_S
+        status = f"/api/analysis/{job['analysis_id']}/status"
+        while client.get(status).json()["status"] in {"queued", "running"}:
+            assert time.monotonic() < deadline, "The sweep did not finish."
+            time.sleep(1.0)
+        results = client.get(f"/api/analysis/{job['analysis_id']}/results")
+        assert results.status_code == 200, results.text
+        yield client, results.json()
+    finally:
+        analysis_service.JOBS_ROOT = jobs_root
+
+
+def test_sweep_job_completes(sweep_job):
+    _, job = sweep_job
+
+    assert job["status"] == "complete", job.get("error")
+    summary = job["sweep_summary"]
+    assert [row["variant"] for row in summary["variants"]] == ["v001", "v002"]
+    assert all(row["status"] == "PASS" for row in summary["variants"])
+    assert len(summary["kept_snapshots"]) == 1
+
+
+def test_sweep_artifacts_resolve(sweep_job):
+    client, job = sweep_job
+    kept = job["sweep_summary"]["kept_snapshots"][0]
+    dropped = ({"v001", "v002"} - {kept}).pop()
+    artifacts = job["artifacts"]
+
+    assert {"sweep-results-csv", "sweep-results-json"} <= set(artifacts)
+    snapshot = client.get(artifacts[f"{kept}-snapshot-json"]["download_url"])
+    assert snapshot.status_code == 200
+    assert snapshot.json()["results"]["frame_summary"]["overall_status"] == "PASS"
+    table = client.get(artifacts["sweep-results-json"]["download_url"]).json()
+    assert [row["variant"] for row in table["variants"]] == ["v001", "v002"]
+
+    assert f"{dropped}-snapshot-json" not in artifacts
+    missing = client.get(
+        f"/api/analysis/{job['analysis_id']}/artifacts/{dropped}-snapshot-json"
+    )
+    assert missing.status_code == 404
+
+
+def test_sweep_job_has_no_report_or_foundation(sweep_job):
+    client, job = sweep_job
+    base = f"/api/analysis/{job['analysis_id']}"
+
+    assert client.get(f"{base}/artifacts/design-report-html").status_code == 404
+    assert client.get(
+        f"{base}/connection-viewer", params={"view": "eaves"}
+    ).status_code == 404
+    foundation = client.post(f"{base}/foundation", json={})
+    assert foundation.status_code == 422
+    assert "parametric sweeps" in foundation.json()["detail"]
@@ -0,0 +1,345 @@
+"""Persistent cache of rafter/column trial results for the section search.
+
+Each entry is addressed by a SHA-256 key built from the analysis-relevant
+part of ``input_data.json``, the engine source hashes recorded in analysis
+snapshots, the search settings and the section pair. Report metadata and the
+raw wind tables therefore do not invalidate earlier trials, while any change
+to the frame, its loads or the engine does. Once the cache exceeds its entry
+cap, the least recently used entries are evicted down to 90% of the cap.
+
+The same file keeps the last winning pair and trial outcomes of each named
+project. A re-run of that project after an input edit cannot reuse its
+trials, but it can start the section search from the previous winner and its
+neighbours and check earlier strength failures for strength first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping
+
+from analysis_snapshot import _source_hashes
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+DEFAULT_TRIAL_CACHE_PATH = (
+    PROJECT_ROOT / "output" / "cache" / "trial_cache.sqlite3"
+)
+DEFAULT_MAX_ENTRIES = 200_000
+# An overflowing cache is trimmed to this fraction of its cap, so the LRU
+# scan runs once per many inserts rather than on every insert.
+EVICTION_TARGET = 0.9
+
+# ``input_data.json`` keys read by the portal trial. Wind tables only feed the
+# generated member loads, which are already listed here.
+ANALYSIS_INPUT_KEYS = (
+    "frame_data",
+    "nodes",
+    "members",
+    "supports",
+    "nodal_loads",
+    "member_loads",
+    "member_point_loads",
+    "rotational_springs",
+    "materials",
+    "steel_grade",
+    "serviceability_load_combinations",
+    "load_combinations",
+)
+
+# Frame settings that only affect secondary members or reports.
+NON_ANALYSIS_FRAME_KEYS = (
+    "purlin_section",
+    "purlin_max_spacing_mm",
+    "girt_section",
+    "girt_max_spacing_mm",
+    "gable_column_count",
+    "gable_column_brace_intervals",
+    "gable_column_section_order",
+    "gable_column_section_type",
+    "gable_column_section",
+    "roof_bracing_purlin_interval",
+    "roof_bracing_purlin_intervals",
+    "column_bracing_type",
+    "rafter_section",
+    "column_section",
+)
+
+
+def analysis_input_digest(input_path: str | Path) -> str:
+    """Return a digest of the parts of an input file that affect trials."""
+
+    data = json.loads(Path(input_path).read_text(encoding="utf-8"))
+    relevant = {key: data.get(key) for key in ANALYSIS_INPUT_KEYS}
+    relevant["frame_data"] = [
+        {
+            key: value
+            for key, value in dict(settings).items()
+            if key not in NON_ANALYSIS_FRAME_KEYS
+        }
+        for settings in data.get("frame_data", [])
+    ]
+    encoded = json.dumps(relevant, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def search_digest(
+    input_path: str | Path,
+    settings: Mapping[str, Any],
+    source_root: str | Path | None = None,
+) -> str:
+    """Return the digest shared by every trial of one section search."""
+
+    root = Path(source_root) if source_root else PROJECT_ROOT
+    encoded = json.dumps(
+        {
+            "input": analysis_input_digest(input_path),
+            "engine": _source_hashes(root),
+            "settings": dict(settings),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def trial_key(search: str, rafter: str, column: str) -> str:
+    """Return the content address of one trial in one search."""
+
+    return hashlib.sha256(
+        f"{search}\0{rafter}\0{column}".encode("utf-8")
+    ).hexdigest()
+
+
+class TrialCache:
+    """SQLite-backed LRU store of serialisable trial results."""
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_TRIAL_CACHE_PATH,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.path = Path(path)
+        self.max_entries = int(max_entries)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS trials ("
+                "key TEXT PRIMARY KEY, search TEXT NOT NULL, "
+                "rafter TEXT NOT NULL, column_section TEXT NOT NULL, "
+                "result TEXT NOT NULL, created REAL NOT NULL, "
+                "last_used REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS trials_last_used "
+                "ON trials (last_used)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS warm_starts ("
+                "project TEXT PRIMARY KEY, rafter TEXT NOT NULL, "
+                "column_section TEXT NOT NULL, outcomes TEXT NOT NULL, "
+                "updated REAL NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Yield a connection that commits on success and is always closed."""
+
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def get(self, search: str, rafter: str, column: str) -> dict | None:
+        """Return a cached result and mark it recently used."""
+
+        key = trial_key(search, rafter, column)
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT result FROM trials WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE trials SET last_used = ? WHERE key = ?",
+                (time.time(), key),
+            )
+        return json.loads(row[0])
+
+    def put(
+        self,
+        search: str,
+        rafter: str,
+        column: str,
+        result: Mapping[str, Any],
+    ) -> None:
+        """Store one result, trimming an overflowing cache below its cap."""
+
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO trials VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    trial_key(search, rafter, column),
+                    search,
+                    rafter,
+                    column,
+                    json.dumps(dict(result), sort_keys=True),
+                    now,
+                    now,
+                ),
+            )
+            entries = connection.execute(
+                "SELECT COUNT(*) FROM trials"
+            ).fetchone()[0]
+            if entries > self.max_entries:
+                connection.execute(
+                    "DELETE FROM trials WHERE key IN ("
+                    "SELECT key FROM trials ORDER BY last_used DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (int(self.max_entries * EVICTION_TARGET),),
+                )
+
+    def warm_start(self, project: str) -> dict[str, Any] | None:
+        """Return the last winning pair and trial outcomes of ``project``."""
+
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT rafter, column_section, outcomes FROM warm_starts "
+                "WHERE project = ?",
+                (project,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "rafter": row[0],
+            "column": row[1],
+            "outcomes": [tuple(outcome) for outcome in json.loads(row[2])],
+        }
+
+    def set_warm_start(
+        self,
+        project: str,
+        rafter: str,
+        column: str,
+        outcomes: Iterable[tuple[str, str, str]] = (),
+    ) -> None:
+        """Remember the winner and ``(rafter, column, outcome)`` trials."""
+
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO warm_starts VALUES (?, ?, ?, ?, ?)",
+                (
+                    project,
+                    rafter,
+                    column,
+                    json.dumps([list(outcome) for outcome in outcomes]),
+                    time.time(),
+                ),
+            )
+
+    def stats(self) -> dict[str, Any]:
+        """Return entry, search and pass counts for the cache file."""
+
+        with self._connect() as connection:
+            entries, searches, oldest, newest = connection.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT search), MIN(last_used), "
+                "MAX(last_used) FROM trials"
+            ).fetchone()
+            passed = connection.execute(
+                "SELECT COUNT(*) FROM trials "
+                "WHERE json_extract(result, '$.status') = 'PASS'"
+            ).fetchone()[0]
+            warm_starts = connection.execute(
+                "SELECT COUNT(*) FROM warm_starts"
+            ).fetchone()[0]
+        return {
+            "path": str(self.path),
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "searches": searches,
+            "passing_trials": passed,
+            "warm_start_projects": warm_starts,
+            "size_bytes": (
+                self.path.stat().st_size if self.path.exists() else 0
+            ),
+            "least_recently_used": oldest,
+            "most_recently_used": newest,
+        }
+
+    def entries(self, limit: int | None = 20) -> Iterable[dict[str, Any]]:
+        """Return the most recently used entries first."""
+
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT search, rafter, column_section, result, last_used "
+                "FROM trials ORDER BY last_used DESC LIMIT ?",
+                (-1 if limit is None else int(limit),),
+            ).fetchall()
+        return [
+            {
+                "search": search[:12],
+                "rafter": rafter,
+                "column": column,
+                "last_used": last_used,
+                **json.loads(result),
+            }
+            for search, rafter, column, result, last_used in rows
+        ]
+
+    def clear(self) -> int:
+        """Delete every entry and warm start; return the trials removed."""
+
+        with self._connect() as connection:
+            removed = connection.execute("DELETE FROM trials").rowcount
+            connection.execute("DELETE FROM warm_starts")
+        with self._connect() as connection:
+            connection.execute("VACUUM")
+        return removed
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from tabulate import tabulate
+
+    parser = argparse.ArgumentParser(
+        description="Inspect or clear the portal section-trial cache."
+    )
+    parser.add_argument(
+        "command", choices=("stats", "list", "clear"), nargs="?",
+        default="stats",
+    )
+    parser.add_argument("--path", default=str(DEFAULT_TRIAL_CACHE_PATH))
+    parser.add_argument("--limit", type=int, default=20)
+    arguments = parser.parse_args()
+
+    cache = TrialCache(arguments.path)
+    if arguments.command == "clear":
+        print(f"Removed {cache.clear()} cached trial(s) from {cache.path}.")
+    elif arguments.command == "list":
+        rows = [
+            [
+                entry["search"], entry["rafter"], entry["column"],
+                entry["status"], entry.get("weight"),
+                time.strftime(
+                    "%Y-%m-%d %H:%M", time.localtime(entry["last_used"])
+                ),
+            ]
+            for entry in cache.entries(arguments.limit)
+        ]
+        print(tabulate(
+            rows,
+            headers=["Search", "Rafter", "Column", "Status", "Weight",
+                     "Last used"],
+            tablefmt="pretty",
+        ))
+    else:
+        print(json.dumps(cache.stats(), indent=2))
@@ -5,13 +5,10 @@ from __future__ import annotations
 from copy import deepcopy
 from contextlib import redirect_stdout
 from io import StringIO
-import json
 import math
-from pathlib import Path
-from tempfile import TemporaryDirectory
 from typing import Any, Mapping
 
-import user_input
+from model_builder import ModelBuilder
 from truss_model import PrattTrussGeometry
 from wind_loads import (
     calculate_basic_wind_speed,
@@ -79,14 +76,8 @@ def _source_portal_data(
     configured["use_crawl_beams"] = "No"
     configured["crawl_beams"] = []
 
-    with TemporaryDirectory(prefix="portalframe-truss-loads-") as directory:
-        path = Path(directory) / "source_portal.json"
-        with redirect_stdout(StringIO()):
-            user_input.update_json_file(path, configured, dict(wind_data))
-            user_input.add_wind_member_loads(path)
-            user_input.add_live_loads(path)
-            user_input.add_dead_loads(path)
-        return json.loads(path.read_text(encoding="utf-8"))
+    with redirect_stdout(StringIO()):
+        return ModelBuilder(configured, dict(wind_data)).build()
 
 
 def _source_rafter_at_x(source: Mapping[str, Any], x_mm: float) -> tuple[dict, float]:
@@ -479,8 +479,12 @@ def safe_load_json(path: str | Path) -> dict:
         # New file or corrupt content → start fresh
         return {}
 
-def update_json_file(json_filename, b_data, wind_data):
-    json_filename = Path(json_filename)
+def generate_input_data(b_data, wind_data, data=None):
+    """Return the analysis input dict for ``b_data`` without member loads.
+
+    Generated sections replace those of ``data`` (an existing input dict)
+    when one is given; its other entries are kept.
+    """
 
     b_data = dict(b_data)
 
@@ -541,8 +545,7 @@ def update_json_file(json_filename, b_data, wind_data):
         for k, v in b_data.items()}
     wind_input["internal_pressure"] = resolve_internal_pressure(wind_input)
 
-    # --- load (or initialise) the JSON --------------------------------------
-    data = safe_load_json(json_filename)
+    data = {} if data is None else data
 
     # --- overwrite the sections we care about --------------------------------
     data.update({
@@ -563,6 +566,14 @@ def update_json_file(json_filename, b_data, wind_data):
         "load_combinations" : ULS,
     })
     data["member_point_loads"] = generate_crawl_member_point_loads(data)
+    return data
+
+
+def update_json_file(json_filename, b_data, wind_data):
+    json_filename = Path(json_filename)
+    data = generate_input_data(
+        b_data, wind_data, safe_load_json(json_filename)
+    )
 
     # --- write it back, *letting json handle the formatting* -----------------
     with open(json_filename, "w") as f:
@@ -571,23 +582,27 @@ def update_json_file(json_filename, b_data, wind_data):
     print(f"Portal frame data saved to {json_filename}")
     wind_out(json_filename)
 
-def add_wind_member_loads(json_filename):
-    """Generate wind loads and append them to the member loads list."""
+
+def apply_wind_member_loads(data):
+    """Replace the member loads of an input ``data`` dict with wind loads."""
     from generate_wind_loading import wind_loading
 
+    data["member_loads"] = wind_loading(data)
+    return data
+
+
+def add_wind_member_loads(json_filename):
+    """Generate wind loads and append them to the member loads list."""
     with open(json_filename, 'r') as file:
         data = json.load(file)
 
-    loads = wind_loading(data)
-    data.setdefault("member_loads", [])
-    data["member_loads"] = loads
+    apply_wind_member_loads(data)
     with open(json_filename, 'w') as json_file:
         json.dump(data, json_file, indent=2)
-def add_live_loads(json_filename):
-    """Generate live loads and append them to the member loads list."""
-    with open(json_filename, 'r') as file:
-        data = json.load(file)
 
+
+def apply_live_loads(data):
+    """Append the rafter live loads to an input ``data`` dict."""
     live_load = round(data["frame_data"][0]["rafter_spacing"] / 1000 * -0.25/1000, 5)
 
     for member in data["members"]:
@@ -600,20 +615,26 @@ def add_live_loads(json_filename):
                 'case': 'L'
             }
             data["member_loads"].append(lod)
+    return data
+
 
+def add_live_loads(json_filename):
+    """Generate live loads and append them to the member loads list."""
+    with open(json_filename, 'r') as file:
+        data = json.load(file)
+
+    apply_live_loads(data)
     with open(json_filename, 'w') as json_file:
         json.dump(data, json_file, indent=2)
 
-def add_dead_loads(json_filename):
+
+def apply_dead_loads(data):
     """Append only user-entered permanent roof loads to rafters.
 
     Structural member self-weight is calculated separately in load case D.
     D_MAX and D_MIN therefore remain zero when no permanent roof action is
     entered by the user.
     """
-    with open(json_filename, 'r') as file:
-        data = json.load(file)
-
     frame = data["frame_data"][0]
     additional_permanent_max_kpa = sum(
         float(frame.get(key, 0.0) or 0.0)
@@ -650,7 +671,15 @@ def add_dead_loads(json_filename):
                 'case': 'D_MIN'
             }
             data["member_loads"].append(d_min)
+    return data
+
+
+def add_dead_loads(json_filename):
+    """Append the user-entered permanent roof loads to the input file."""
+    with open(json_filename, 'r') as file:
+        data = json.load(file)
 
+    apply_dead_loads(data)
     with open(json_filename, 'w') as json_file:
         json.dump(data, json_file, indent=2)
 
@@ -1,10 +1,60 @@
 import json
 import math
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+
 import numpy as np
 
 from internal_pressure import pressure_coefficients
 
 
+# Buildings with their own zone tables.
+DUO_NORMAL = "duo_normal"
+MONO_NORMAL = "mono_normal"
+DUO_CANOPY = "duo_canopy"
+MONO_CANOPY = "mono_canopy"
+
+# ``wind_data`` entries read by the zone tables; with the internal-pressure
+# coefficients they key the memoised tables.
+WIND_ENGINE_KEYS = (
+    "building_type",
+    "building_roof",
+    "fundamental_basic_wind_speed",
+    "return_period",
+    "terrain_category",
+    "topographic_factor",
+    "altitude",
+    "apex_height",
+    "eaves_height",
+    "gable_width",
+    "building_length",
+    "roof_pitch",
+    "rafter_spacing",
+    "blocking_factor",
+)
+# Distinct envelopes kept, e.g. the depth candidates of a truss search and
+# the variants of a parametric sweep.
+WIND_CACHE_SIZE = 64
+
+
+@dataclass(frozen=True)
+class WindZoneTables:
+    """Immutable wind zone loads of one building envelope.
+
+    ``tables`` holds ``(name, rows)`` pairs, where ``name`` is a
+    ``wind_zones_*`` input key and each row the ``(field, value)`` items of
+    one zone entry, in input order.
+    """
+
+    tables: tuple
+
+    def as_input(self):
+        """Return new ``wind_zones_*`` lists for an input dict."""
+
+        return {name: [dict(row) for row in rows] for name, rows in self.tables}
+
+
 def import_data(file):
     with open(file) as f:
         data = json.load(f)
@@ -49,7 +99,8 @@ def interpolate_cpe_roof(roof_angle, angles, data):
 def calculate_pressure(peak_wind_pressure, cpe, cpi):
     return (peak_wind_pressure * cpe) - (peak_wind_pressure * cpi)
 
-def wind_data_duo_n(input_path="input_data.json"):
+def _duo_pitch_tables(wind):
+
     angles = np.array([5, 15, 30, 45])
 
     # Wind 0 Upward
@@ -76,7 +127,6 @@ def wind_data_duo_n(input_path="input_data.json"):
         [-1.1, -1.4, -0.9, -0.5]
     ])
 
-    data = import_data(input_path)
     h_d_data = [0.25, 1.0]
     cpe_d = [0.70, 0.80]
     cpe_e = [-0.3, -0.50]
@@ -87,9 +137,8 @@ def wind_data_duo_n(input_path="input_data.json"):
     results_mix_2 = []
     results_90 = []
 
-    wind = data['wind_data'][0]
-    cpi_0_positive, cpi_0_negative = pressure_coefficients(wind, "0")
-    cpi_90_positive, cpi_90_negative = pressure_coefficients(wind, "90")
+    cpi_0_positive, cpi_0_negative = wind['cpi_0']
+    cpi_90_positive, cpi_90_negative = wind['cpi_90']
     bs = calculate_basic_wind_speed(wind['fundamental_basic_wind_speed'], wind['return_period'])
     roughness = calculate_terrain_roughness(wind['apex_height'], wind['terrain_category'])
     peak_pressure = calculate_peak_wind_pressure(wind['topographic_factor'], bs, roughness, wind['altitude'])
@@ -164,7 +213,7 @@ def wind_data_duo_n(input_path="input_data.json"):
         "I": cpe_wind_90[3]
     }
 
-    zones = zones_normal(input_path)
+    zones = zone_lengths(wind)
     r_spacing = wind['rafter_spacing']
 
 
@@ -209,6 +258,20 @@ def wind_data_duo_n(input_path="input_data.json"):
             "cpi=-0.3": round(calculate_pressure(peak_pressure, cpe, cpi_90_negative) * r_spacing / -1000, 5)
         })
 
+    return {
+        "wind_zones_0U": results_up,
+        "wind_zones_0D": results_down,
+        "wind_zones_0M1": results_mix_1,
+        "wind_zones_0M2": results_mix_2,
+        "wind_zones_90": results_90,
+    }
+
+
+def _print_duo_pitch_pressures(tables):
+    results_up = tables["wind_zones_0U"]
+    results_down = tables["wind_zones_0D"]
+    results_90 = tables["wind_zones_90"]
+
     print("Wind Upward Pressures")
     print(f"{'Zone':<6}{'cpe':<10}{'Length':<10}{'Load. cpi=0.2':<18}{'Load. cpi=-0.3'}")
     print("-" * 56)
@@ -242,12 +305,18 @@ def wind_data_duo_n(input_path="input_data.json"):
 
         print(f"{result['Zone']:<6}{cpe_display:<10}{length_display + ' m':<10}{pressure_cpi_0_2 + ' kN/m':<18} {pressure_cpi_neg_0_3} kN/m")
 
-    data["wind_zones_0U"] = results_up
-    data["wind_zones_0D"] = results_down
-    data["wind_zones_0M1"] = results_mix_1
-    data["wind_zones_0M2"] = results_mix_2
-    data["wind_zones_90"] = results_90
 
+def add_wind_zones_duo_n(data):
+    """Add the duo-pitch wind zone loads to an input ``data`` dict."""
+
+    tables = wind_zone_tables(normalize_wind_data(data), DUO_NORMAL).as_input()
+    _print_duo_pitch_pressures(tables)
+    data.update(tables)
+    return data
+
+
+def wind_data_duo_n(input_path="input_data.json"):
+    data = add_wind_zones_duo_n(import_data(input_path))
     json_str = json.dumps(data, separators=(',', ':'))
 
     # Insert line breaks between JSON objects
@@ -263,7 +332,8 @@ def wind_data_duo_n(input_path="input_data.json"):
 
     return
 
-def wind_data_mono_n(input_path="input_data.json"):
+def _mono_pitch_tables(wind):
+
     angles = np.array([5, 15, 30, 45])
 
     # SANS 10160-3 Table 8. The suction envelope includes both theta=0
@@ -293,7 +363,6 @@ def wind_data_mono_n(input_path="input_data.json"):
         [-1.5, -1.4, -1.0, -0.9],  # 45 deg
     ])
 
-    data = import_data(input_path)
     h_d_data = [0.25, 1.0]
     cpe_d = [0.70, 0.80]
     cpe_e = [-0.3, -0.50]
@@ -302,9 +371,8 @@ def wind_data_mono_n(input_path="input_data.json"):
     results_down = []
     results_90 = []
 
-    wind = normalize_wind_data(data)
-    cpi_0_positive, cpi_0_negative = pressure_coefficients(wind, "0")
-    cpi_90_positive, cpi_90_negative = pressure_coefficients(wind, "90")
+    cpi_0_positive, cpi_0_negative = wind['cpi_0']
+    cpi_90_positive, cpi_90_negative = wind['cpi_90']
     bs = calculate_basic_wind_speed(wind['fundamental_basic_wind_speed'], wind['return_period'])
     roughness = calculate_terrain_roughness(wind['apex_height'], wind['terrain_category'])
     peak_pressure = calculate_peak_wind_pressure(wind['topographic_factor'], bs, roughness, wind['altitude'])
@@ -371,7 +439,7 @@ def wind_data_mono_n(input_path="input_data.json"):
         "I": cpe_wind_90[3]
     }
 
-    zones = zones_normal(input_path)
+    zones = zone_lengths(wind)
     r_spacing = wind['rafter_spacing']
 
     for zone, cpe in zones_up.items():
@@ -401,10 +469,24 @@ def wind_data_mono_n(input_path="input_data.json"):
             "cpi=-0.3": round(calculate_pressure(peak_pressure, cpe, cpi_90_negative) * r_spacing / -1000, 5)
         })
 
-    data["wind_zones_0U"] = results_up
-    data["wind_zones_0D"] = results_down
-    data["wind_zones_90"] = results_90
+    return {
+        "wind_zones_0U": results_up,
+        "wind_zones_0D": results_down,
+        "wind_zones_90": results_90,
+    }
+
 
+def add_wind_zones_mono_n(data):
+    """Add the mono-pitch wind zone loads to an input ``data`` dict."""
+
+    data.update(
+        wind_zone_tables(normalize_wind_data(data), MONO_NORMAL).as_input()
+    )
+    return data
+
+
+def wind_data_mono_n(input_path="input_data.json"):
+    data = add_wind_zones_mono_n(import_data(input_path))
     with open(input_path, 'w') as json_file:
         json.dump(data, json_file, indent=2)
 
@@ -429,10 +511,7 @@ def _interp_phi(min_phi0, min_phi1, phi):
     return min_phi0 + phi * (min_phi1 - min_phi0)
 
 
-def _wind_data_canopy(roof_type, input_path="input_data.json"):
-    data = import_data(input_path)
-    wind = normalize_wind_data(data)
-
+def _canopy_tables(roof_type, wind):
     bs = calculate_basic_wind_speed(wind['fundamental_basic_wind_speed'], wind['return_period'])
     roughness = calculate_terrain_roughness(wind['apex_height'], wind['terrain_category'])
     peak_pressure = calculate_peak_wind_pressure(wind['topographic_factor'], bs, roughness, wind['altitude'])
@@ -509,7 +588,7 @@ def _wind_data_canopy(roof_type, input_path="input_data.json"):
         zones_90 = {"A": a_up, "B": b_up, "C": c_up, "D": d_up, "E": e_up,
                     "F": a_up, "G": b_up, "H": c_up, "I": d_up}
 
-    zone_lengths = zones_normal(input_path)
+    lengths = zone_lengths(wind)
     r_spacing = wind['rafter_spacing']
 
     results_up = []
@@ -520,7 +599,7 @@ def _wind_data_canopy(roof_type, input_path="input_data.json"):
         results_up.append({
             "Zone": zone,
             "cpe": round(cpe, 4),
-            "Length": zone_lengths[zone]["0_deg"],
+            "Length": lengths[zone]["0_deg"],
             # cp,net is already net pressure coefficient for canopy roofs.
             "cpi=0.2": round(peak_pressure * cpe * r_spacing / -1000, 5),
             "cpi=-0.3": round(peak_pressure * cpe * r_spacing / -1000, 5)
@@ -530,7 +609,7 @@ def _wind_data_canopy(roof_type, input_path="input_data.json"):
         results_down.append({
             "Zone": zone,
             "cpe": round(cpe, 4),
-            "Length": zone_lengths[zone]["0_deg"],
+            "Length": lengths[zone]["0_deg"],
             "cpi=0.2": round(peak_pressure * cpe * r_spacing / -1000, 5),
             "cpi=-0.3": round(peak_pressure * cpe * r_spacing / -1000, 5)
         })
@@ -539,15 +618,26 @@ def _wind_data_canopy(roof_type, input_path="input_data.json"):
         results_90.append({
             "Zone": zone,
             "cpe": round(cpe, 4),
-            "Length": zone_lengths[zone]["90_deg"],
+            "Length": lengths[zone]["90_deg"],
             "cpi=0.2": round(peak_pressure * cpe * r_spacing / -1000, 5),
             "cpi=-0.3": round(peak_pressure * cpe * r_spacing / -1000, 5)
         })
 
-    data["wind_zones_0U"] = results_up
-    data["wind_zones_0D"] = results_down
-    data["wind_zones_90"] = results_90
+    return {
+        "wind_zones_0U": results_up,
+        "wind_zones_0D": results_down,
+        "wind_zones_90": results_90,
+    }
+
 
+def _add_wind_zones_canopy(roof_type, data):
+    kind = DUO_CANOPY if roof_type == "Duo Pitched" else MONO_CANOPY
+    data.update(wind_zone_tables(normalize_wind_data(data), kind).as_input())
+    return data
+
+
+def _wind_data_canopy(roof_type, input_path="input_data.json"):
+    data = _add_wind_zones_canopy(roof_type, import_data(input_path))
     with open(input_path, 'w') as json_file:
         json.dump(data, json_file, indent=2)
 
@@ -576,9 +666,12 @@ def print_zones(zones):
         print(f"{zone:<5} {fmt(v['0_deg']):<20} {fmt(v['90_deg']):<20}")
 
 def zones_normal(input_path="input_data.json"):
-    data = import_data(input_path)['wind_data'][0]
+    return zone_lengths(import_data(input_path)['wind_data'][0])
 
 
+def zone_lengths(data):
+    """Return the 0 and 90 degree wind zone lengths of a ``wind_data`` entry."""
+
     b_0 = data['building_length']
     b_90 = data['gable_width']
     d_0 = data['gable_width']
@@ -657,6 +750,97 @@ def zones_normal(input_path="input_data.json"):
     }
     return zones
 
+def _frozen(value):
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(key), _frozen(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_frozen(item) for item in value)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def wind_engine_key(wind):
+    """Return the normalised inputs that determine the wind zone tables.
+
+    The key holds the ``WIND_ENGINE_KEYS`` present in ``wind`` and the
+    resolved internal-pressure coefficients of both wind directions.
+    """
+
+    items = [
+        (key, _frozen(wind[key])) for key in WIND_ENGINE_KEYS if key in wind
+    ]
+    items.append(("cpi_0", pressure_coefficients(wind, "0")))
+    items.append(("cpi_90", pressure_coefficients(wind, "90")))
+    return tuple(items)
+
+
+def _building_kind(wind):
+    if wind['building_type'] == 'Normal':
+        if wind['building_roof'] == 'Duo Pitched':
+            return DUO_NORMAL
+        elif wind['building_roof'] == 'Mono Pitched':
+            return MONO_NORMAL
+
+    elif wind['building_type'] == 'Canopy':
+        if wind['building_roof'] == 'Duo Pitched':
+            return DUO_CANOPY
+        elif wind['building_roof'] == 'Mono Pitched':
+            return MONO_CANOPY
+    return None
+
+
+@lru_cache(maxsize=WIND_CACHE_SIZE)
+def _wind_zone_tables_cached(kind, key):
+    wind = dict(key)
+    if kind == DUO_NORMAL:
+        tables = _duo_pitch_tables(wind)
+    elif kind == MONO_NORMAL:
+        tables = _mono_pitch_tables(wind)
+    else:
+        roof_type = "Duo Pitched" if kind == DUO_CANOPY else "Mono Pitched"
+        tables = _canopy_tables(roof_type, wind)
+    return WindZoneTables(tuple(
+        (name, tuple(
+            tuple((field, _frozen(value)) for field, value in row.items())
+            for row in rows
+        ))
+        for name, rows in tables.items()
+    ))
+
+
+def wind_zone_tables(wind, kind=None):
+    """Return the memoised zone tables of one ``wind_data`` entry.
+
+    ``kind`` selects the building (``DUO_NORMAL``, ``MONO_NORMAL``,
+    ``DUO_CANOPY`` or ``MONO_CANOPY``) and defaults to the one given by the
+    building type and roof; ``None`` is returned for any other building.
+    Identical envelopes share one calculation, however many models are
+    generated from them.
+    """
+
+    kind = _building_kind(wind) if kind is None else kind
+    if kind is None:
+        return None
+    return _wind_zone_tables_cached(kind, wind_engine_key(wind))
+
+
+def add_wind_zones(data):
+    """Add the wind zone loads of the building type to an input ``data`` dict.
+
+    This is the in-memory form of :func:`wind_out`.
+    """
+
+    kind = _building_kind(normalize_wind_data(data))
+    if kind == DUO_NORMAL:
+        return add_wind_zones_duo_n(data)
+    if kind is not None:
+        data.update(
+            wind_zone_tables(normalize_wind_data(data), kind).as_input()
+        )
+    return data
+
+
 def wind_out(input_path="input_data.json"):
     data = import_data(input_path)['wind_data'][0]
     if data['building_type'] == 'Normal':